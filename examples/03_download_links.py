@@ -149,7 +149,7 @@ async def main():
                 (
                     link
                     for link in table_links.download_links
-                    if link.server in scraper_jk._file_link_getters
+                    if scraper_jk.resolvers.handles(link.server)
                 ),
                 None,
             )
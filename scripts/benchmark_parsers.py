@@ -0,0 +1,136 @@
+"""Benchmark the parse paths on the fixture HTML.
+
+Requires the dev extras (BeautifulSoup is only used as a baseline).
+"""
+
+import timeit
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+from lxml import html as lxml_html
+from lxml.cssselect import CSSSelector
+from rich.console import Console
+from rich.table import Table
+
+from ani_scrapy.core.html import HtmlBody, parse_html
+from ani_scrapy.providers.animeflv import parser as animeflv_parser
+from ani_scrapy.providers.animeflv.parser import AnimeFLVParser
+from ani_scrapy.providers.jkanime import parser as jkanime_parser
+
+
+FIXTURES_DIR = Path(__file__).parent.parent / "tests" / "fixtures" / "html"
+NUMBER = 500
+REPEAT = 5
+
+
+def best_ms(fn) -> float:
+    """Best average milliseconds per call over REPEAT rounds."""
+    return min(timeit.repeat(fn, number=NUMBER, repeat=REPEAT)) * 1000 / NUMBER
+
+
+def str_round_trip_episodes(raw: bytes):
+    """AnimeFLV episode extraction as done before the bytes path.
+
+    The body was decoded, parsed, serialized back to a string and parsed
+    a second time to read the episode scripts.
+    """
+    root = lxml_html.document_fromstring(raw.decode("utf-8"))
+    return AnimeFLVParser.extract_episode_data(lxml_html.tostring(root).decode())
+
+
+SELECTOR_CASES = {
+    "animeflv_search.html": animeflv_parser,
+    "animeflv_anime.html": animeflv_parser,
+    "jkanime_search.html": jkanime_parser,
+    "jkanime_anime.html": jkanime_parser,
+}
+
+
+def module_selectors(module) -> list[CSSSelector]:
+    """Compiled selectors declared at the top of a parser module."""
+    return [value for value in vars(module).values() if isinstance(value, CSSSelector)]
+
+
+def selectors_table() -> Table:
+    """Run every parser selector over each fixture with each engine."""
+    table = Table(title=f"Selector benchmark (best of {REPEAT} x {NUMBER})")
+    table.add_column("Fixture", style="cyan")
+    table.add_column("BeautifulSoup", justify="right")
+    table.add_column("lxml cssselect", justify="right")
+    table.add_column("compiled", justify="right")
+    table.add_column("vs BeautifulSoup", justify="right")
+
+    for name, module in SELECTOR_CASES.items():
+        raw = (FIXTURES_DIR / name).read_bytes()
+        body = HtmlBody(raw, "utf-8")
+        selectors = module_selectors(module)
+
+        def soup_path():
+            soup = BeautifulSoup(raw, "lxml")
+            for selector in selectors:
+                soup.select(selector.css)
+
+        def cssselect_path():
+            root = parse_html(body)
+            for selector in selectors:
+                root.cssselect(selector.css)
+
+        def compiled_path():
+            root = parse_html(body)
+            for selector in selectors:
+                selector(root)
+
+        soup_ms = best_ms(soup_path)
+        cssselect_ms = best_ms(cssselect_path)
+        compiled_ms = best_ms(compiled_path)
+        table.add_row(
+            name,
+            f"{soup_ms:.3f} ms",
+            f"{cssselect_ms:.3f} ms",
+            f"{compiled_ms:.3f} ms",
+            f"{soup_ms / compiled_ms:.2f}x",
+        )
+
+    return table
+
+
+def main():
+    """Compare decode-then-parse against bytes, and the selector engines."""
+    console = Console()
+    table = Table(title=f"Parse benchmark (best of {REPEAT} x {NUMBER})")
+    table.add_column("Case", style="cyan")
+    table.add_column("str path", justify="right")
+    table.add_column("bytes path", justify="right")
+    table.add_column("Speedup", justify="right")
+
+    def add_row(name: str, str_ms: float, bytes_ms: float):
+        table.add_row(
+            name,
+            f"{str_ms:.3f} ms",
+            f"{bytes_ms:.3f} ms",
+            f"{str_ms / bytes_ms:.2f}x",
+        )
+
+    for path in sorted(FIXTURES_DIR.glob("*.html")):
+        raw = path.read_bytes()
+        body = HtmlBody(raw, "utf-8")
+        add_row(
+            f"{path.name} tree",
+            best_ms(lambda: lxml_html.document_fromstring(raw.decode("utf-8"))),
+            best_ms(lambda: parse_html(body)),
+        )
+
+    raw = (FIXTURES_DIR / "animeflv_anime.html").read_bytes()
+    body = HtmlBody(raw, "utf-8")
+    add_row(
+        "animeflv_anime.html episodes",
+        best_ms(lambda: str_round_trip_episodes(raw)),
+        best_ms(lambda: AnimeFLVParser.extract_episode_data(parse_html(body))),
+    )
+
+    console.print(table)
+    console.print(selectors_table())
+
+
+if __name__ == "__main__":
+    main()
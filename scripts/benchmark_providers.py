@@ -67,6 +67,28 @@ async def benchmark_scraper(name: str, scraper, console: Console) -> dict:
     return results
 
 
+async def benchmark_iframe_paths(console: Console) -> None:
+    """Compare AnimeFLV iframe links read over HTTP and in the browser."""
+    table = Table(title="AnimeFLV get_iframe_download_links")
+    table.add_column("Path", style="cyan")
+    table.add_column("Time", justify="right")
+    table.add_column("Links", justify="right")
+
+    for path, hybrid in (("HTTP", True), ("Browser", False)):
+        async with AnimeFLVScraper(hybrid=hybrid) as scraper:
+            start = time.perf_counter()
+            try:
+                info = await scraper.get_iframe_download_links(ANIME_ID, EPISODE_NUMBER)
+                elapsed = time.perf_counter() - start
+                table.add_row(
+                    path, f"{elapsed * 1000:.2f} ms", str(len(info.download_links))
+                )
+            except Exception as e:
+                table.add_row(path, f"ERROR: {type(e).__name__}", "-")
+
+    console.print(table)
+
+
 async def main():
     """Run benchmark for all providers."""
     console = Console()
@@ -108,6 +130,8 @@ async def main():
     console.print("\n")
     console.print(table)
 
+    await benchmark_iframe_paths(console)
+
 
 if __name__ == "__main__":
     asyncio.run(main())
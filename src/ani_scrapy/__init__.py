@@ -1,7 +1,7 @@
 from ani_scrapy.providers.animeflv import AnimeFLVScraper
 from ani_scrapy.providers.jkanime import JKAnimeScraper
 from ani_scrapy.providers.animeav1 import AnimeAV1Scraper
-from ani_scrapy.core import AsyncBrowser
+from ani_scrapy.core import AsyncBrowser, BrowserFleet
 from ani_scrapy.core.exceptions import (
     ScraperError,
     ScraperBlockedError,
@@ -15,6 +15,7 @@ __all__ = [
     "JKAnimeScraper",
     "AnimeAV1Scraper",
     "AsyncBrowser",
+    "BrowserFleet",
     "ScraperError",
     "ScraperBlockedError",
     "ScraperTimeoutError",
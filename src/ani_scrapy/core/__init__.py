@@ -1,8 +1,39 @@
 """Core package."""
 
 from ani_scrapy.core.base import BaseScraper
+from ani_scrapy.core.blocking import BlockRules
 from ani_scrapy.core.browser import AsyncBrowser
-from ani_scrapy.core.http import AsyncHttpAdapter
+from ani_scrapy.core.executor import ParseExecutor
+from ani_scrapy.core.extract import PageExtractor
+from ani_scrapy.core.fleet import BrowserFleet
+from ani_scrapy.core.http import (
+    AsyncHttpAdapter,
+    SessionRegistry,
+    configure_session_registry,
+)
+from ani_scrapy.core.html import HtmlBody
+from ani_scrapy.core.metrics import LatencyRecorder, get_latency_recorder
+from ani_scrapy.core.cache import (
+    HttpCache,
+    MemoryCacheBackend,
+    SQLiteCacheBackend,
+)
+from ani_scrapy.core.ratelimit import (
+    AdaptiveRateLimiter,
+    RateLimiterRegistry,
+    configure_rate_limiters,
+)
+from ani_scrapy.core.resolvers import (
+    HosterResolver,
+    ResolverRegistry,
+    configure_resolver_registry,
+    get_resolver_registry,
+)
+from ani_scrapy.core.retry import (
+    RetryBudget,
+    RetryPolicy,
+    configure_retry_budget,
+)
 from ani_scrapy.core.exceptions import (
     ScraperError,
     ScraperBlockedError,
@@ -24,7 +55,29 @@ from ani_scrapy.core.schemas import (
 __all__ = [
     "BaseScraper",
     "AsyncBrowser",
+    "BlockRules",
+    "BrowserFleet",
+    "ParseExecutor",
+    "PageExtractor",
     "AsyncHttpAdapter",
+    "SessionRegistry",
+    "configure_session_registry",
+    "HtmlBody",
+    "LatencyRecorder",
+    "get_latency_recorder",
+    "HttpCache",
+    "MemoryCacheBackend",
+    "SQLiteCacheBackend",
+    "AdaptiveRateLimiter",
+    "RateLimiterRegistry",
+    "configure_rate_limiters",
+    "HosterResolver",
+    "ResolverRegistry",
+    "configure_resolver_registry",
+    "get_resolver_registry",
+    "RetryBudget",
+    "RetryPolicy",
+    "configure_retry_budget",
     "ScraperError",
     "ScraperBlockedError",
     "ScraperTimeoutError",
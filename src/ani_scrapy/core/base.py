@@ -1,7 +1,35 @@
+import asyncio
+import functools
 from abc import ABC, abstractmethod
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import Page
 
-from ani_scrapy.core.browser import AsyncBrowser
+from ani_scrapy.core.blocking import BlockRules
+from ani_scrapy.core.browser import DEFAULT_SCOPE, AsyncBrowser
+from ani_scrapy.core.challenge import Clearance
+from ani_scrapy.core.constants.general import CHALLENGE_TIMEOUT
+from ani_scrapy.core.exceptions import ScraperBlockedError
+from ani_scrapy.core.executor import ParseExecutor
+from ani_scrapy.core.html import HtmlBody, HtmlSource
+from ani_scrapy.core.http import AsyncHttpAdapter
+from ani_scrapy.core.log import logger
+from ani_scrapy.core.metrics import measure
+from ani_scrapy.core.resolvers import (
+    BrowserFlow,
+    ResolverRegistry,
+    get_resolver_registry,
+)
 from ani_scrapy.core.schemas import (
     AnimeInfo,
     DownloadLinkInfo,
@@ -10,20 +38,131 @@ from ani_scrapy.core.schemas import (
     PagedSearchAnimeInfo,
 )
 
+T = TypeVar("T")
+
 
 class BaseScraper(ABC):
     """Base class for anime scrapers."""
 
+    http: AsyncHttpAdapter
+    # Browser contexts are pooled per scope, keeping providers isolated.
+    browser_scope: str = DEFAULT_SCOPE
+    # Request blocking for this provider's contexts; None uses the default.
+    browser_block_rules: Optional[BlockRules] = None
+    # Try the HTTP resolvers before driving hoster pages in the browser.
+    hybrid: bool = True
+
     def __init__(
         self,
         headless: bool = True,
         executable_path: str = "",
         external_browser: Optional[AsyncBrowser] = None,
+        parse_executor: Optional[ParseExecutor] = None,
+        resolvers: Optional[ResolverRegistry] = None,
     ) -> None:
         self.headless = headless
         self.executable_path = executable_path
         self._external_browser = external_browser
         self._browser: Optional[AsyncBrowser] = None
+        # Owned by the caller, who may share it between scrapers.
+        self.parse_executor = parse_executor or ParseExecutor()
+        self._clearance_lock = asyncio.Lock()
+        # Hoster resolvers and resolved links, shared with other scrapers.
+        self.resolvers = resolvers or get_resolver_registry()
+        self.resolvers.attach()
+        self._resolvers_attached = True
+
+    async def _parse(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a parser call through the parse executor."""
+        return await self.parse_executor.run(fn, *args, **kwargs)
+
+    async def _get_page(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        stop_after: Sequence[str] = (),
+    ) -> HtmlSource:
+        """Fetch a page in the form the parse executor can take.
+
+        Streams into an lxml tree (stopping after ``stop_after`` markers)
+        when parsers share memory with the loop, and returns the raw
+        bytes for process workers, which cannot receive trees.
+        """
+        if self.parse_executor.shares_memory:
+            return await self.http.get_document(
+                endpoint, params=params, stop_after=stop_after
+            )
+        return await self.http.get_bytes(endpoint, params=params)
+
+    async def _refresh_clearance(
+        self, url: str, stale: Optional[Clearance] = None
+    ) -> None:
+        """Pass the site challenge in the browser and hand it to HTTP.
+
+        Concurrent callers that saw the same ``stale`` clearance share a
+        single browser visit.
+        """
+        async with self._clearance_lock:
+            if self.http.clearance is not stale:
+                return
+            async with self._browser_page() as page:
+                await page.goto(url, wait_until="domcontentloaded")
+                await page.wait_for_function(
+                    "!document.title.includes('Just a moment')",
+                    timeout=CHALLENGE_TIMEOUT,
+                )
+                clearance = await Clearance.from_page(page)
+            self.http.set_clearance(clearance)
+            logger.info(
+                "Browser clearance refreshed | url={url} cookies={cookies}",
+                url=url,
+                cookies=len(clearance.cookies),
+            )
+
+    async def _get_bytes_with_clearance(self, endpoint: str) -> HtmlBody:
+        """GET over HTTP, refreshing the clearance once if challenged."""
+        stale = self.http.clearance
+        try:
+            return await self.http.get_bytes(endpoint)
+        except ScraperBlockedError:
+            await self._refresh_clearance(self.http.build_url(endpoint), stale)
+        return await self.http.get_bytes(endpoint)
+
+    async def _resolve_file_link(self, server: str, url: str) -> Optional[str]:
+        """File link through the shared resolvers or the hoster's browser flow."""
+        if not self.resolvers.handles(server):
+            logger.error("Server not supported | server={server}", server=server)
+            return None
+
+        flow = self.resolvers.browser_flow(server)
+        if flow is None:
+            # No browser flow: the resolver is the only way, hybrid or not.
+            return await self.resolvers.resolve(server, url)
+        return await self.resolvers.resolve(
+            server,
+            url,
+            fallback=functools.partial(self._browser_file_link, server, url, flow),
+            use_resolver=self.hybrid,
+        )
+
+    async def _browser_file_link(
+        self, server: str, url: str, flow: BrowserFlow
+    ) -> Optional[str]:
+        """Run a hoster's browser flow on a pooled page of this provider."""
+        try:
+            async with (
+                measure(f"{self.browser_scope}.file_link.{server}.browser"),
+                self._browser_page() as page,
+            ):
+                page.on("popup", lambda popup: popup.close())
+                return await flow(page, url)
+        except PlaywrightError as e:
+            logger.warning(
+                "Browser file link failed | server={server} error={error}",
+                server=server,
+                error=str(e),
+            )
+            return None
 
     async def __aenter__(self):
         return self
@@ -46,6 +185,20 @@ class BaseScraper(ABC):
             await self._browser.__aenter__()
         return self._browser
 
+    @asynccontextmanager
+    async def _browser_page(
+        self, timeout: Optional[float] = None
+    ) -> AsyncIterator[Page]:
+        """Borrow a pooled browser page from this provider's contexts.
+
+        ``timeout`` (seconds) bounds the wait for a free page.
+        """
+        browser = await self._get_browser()
+        async with browser.page(
+            self.browser_scope, self.browser_block_rules, timeout=timeout
+        ) as page:
+            yield page
+
     async def start_browser(self) -> None:
         """Manually start the browser for reuse across operations."""
         if self._external_browser is not None:
@@ -72,6 +225,9 @@ class BaseScraper(ABC):
 
     async def aclose(self):
         """Close resources."""
+        if self._resolvers_attached:
+            self._resolvers_attached = False
+            await self.resolvers.detach()
         if self._browser is not None:
             await self._browser.__aexit__(None, None, None)
             self._browser = None
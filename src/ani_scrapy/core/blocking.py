@@ -0,0 +1,143 @@
+"""Network-level request blocking for browser contexts."""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable
+from urllib.parse import urlsplit
+
+from playwright.async_api import BrowserContext, Response, Route
+
+from ani_scrapy.core.constants.general import (
+    BROWSER_BLOCKED_DOMAINS,
+    BROWSER_BLOCKED_RESOURCE_TYPES,
+)
+from ani_scrapy.core.log import logger
+
+
+class DomainMatcher:
+    """Match hosts against a set of domains and all their subdomains.
+
+    Lookups walk the labels of the host from the full name up to the top
+    level domain, so each check costs one set lookup per label no matter
+    how many domains are registered.
+    """
+
+    def __init__(self, domains: Iterable[str] = ()):
+        self.domains = frozenset(d.strip(".").lower() for d in domains if d)
+
+    def matches(self, host: str) -> bool:
+        """Whether host is one of the domains or a subdomain of one."""
+        if not self.domains or not host:
+            return False
+        host = host.lower()
+        domains = self.domains
+        while True:
+            if host in domains:
+                return True
+            dot = host.find(".")
+            if dot < 0:
+                return False
+            host = host[dot + 1 :]
+
+
+@dataclass(frozen=True)
+class BlockRules:
+    """What a browser scope may load.
+
+    A request is aborted when its resource type is in ``block_types`` or
+    its host falls under ``block_domains``, unless the host falls under
+    ``allow_domains``, which always wins.
+    """
+
+    block_types: frozenset[str] = frozenset()
+    block_domains: frozenset[str] = frozenset()
+    allow_domains: frozenset[str] = frozenset()
+
+    def __bool__(self) -> bool:
+        return bool(self.block_types or self.block_domains)
+
+    def merge(self, other: "BlockRules") -> "BlockRules":
+        """Combine two rule sets."""
+        return BlockRules(
+            block_types=self.block_types | other.block_types,
+            block_domains=self.block_domains | other.block_domains,
+            allow_domains=self.allow_domains | other.allow_domains,
+        )
+
+
+DEFAULT_BLOCK_RULES = BlockRules(
+    block_types=frozenset(BROWSER_BLOCKED_RESOURCE_TYPES),
+    block_domains=frozenset(BROWSER_BLOCKED_DOMAINS),
+)
+
+
+@dataclass
+class BlockingStats:
+    """Request counters of a blocker; bytes are response Content-Length.
+
+    Blocked requests never reach the network, so their size is unknown;
+    they are broken down by resource type instead.
+    """
+
+    allowed: int = 0
+    blocked: int = 0
+    allowed_bytes: int = 0
+    blocked_by_type: Dict[str, int] = field(default_factory=dict)
+
+
+class RequestBlocker:
+    """Route handler that aborts requests matching a set of rules."""
+
+    def __init__(self, rules: BlockRules):
+        self.rules = rules
+        self._block_domains = DomainMatcher(rules.block_domains)
+        self._allow_domains = DomainMatcher(rules.allow_domains)
+        self._allowed = 0
+        self._blocked = 0
+        self._allowed_bytes = 0
+        self._blocked_by_type: Counter[str] = Counter()
+
+    def should_block(self, url: str, resource_type: str) -> bool:
+        """Whether a request for url of resource_type is blocked."""
+        host = urlsplit(url).hostname or ""
+        if self._allow_domains.matches(host):
+            return False
+        return resource_type in self.rules.block_types or (
+            self._block_domains.matches(host)
+        )
+
+    async def handle(self, route: Route) -> None:
+        """Abort or continue an intercepted request."""
+        request = route.request
+        resource_type = request.resource_type
+        if self.should_block(request.url, resource_type):
+            self._blocked += 1
+            self._blocked_by_type[resource_type] += 1
+            await route.abort("blockedbyclient")
+        else:
+            self._allowed += 1
+            await route.fallback()
+
+    def on_response(self, response: Response) -> None:
+        length = response.headers.get("content-length", "")
+        if length.isdigit():
+            self._allowed_bytes += int(length)
+
+    async def attach(self, context: BrowserContext) -> None:
+        """Route every request of context through this blocker."""
+        await context.route("**/*", self.handle)
+        context.on("response", self.on_response)
+        logger.debug(
+            "Request blocking enabled | types={types} domains={domains}",
+            types=sorted(self.rules.block_types),
+            domains=len(self.rules.block_domains),
+        )
+
+    def stats(self) -> BlockingStats:
+        """Snapshot for metrics."""
+        return BlockingStats(
+            allowed=self._allowed,
+            blocked=self._blocked,
+            allowed_bytes=self._allowed_bytes,
+            blocked_by_type=dict(self._blocked_by_type),
+        )
@@ -1,25 +1,63 @@
-from playwright.async_api import async_playwright
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from playwright.async_api import BrowserContext, Page, async_playwright
 from playwright_stealth import Stealth
 
-from ani_scrapy.core.constants.general import CONTEXT_OPTIONS
+from ani_scrapy.core.blocking import (
+    DEFAULT_BLOCK_RULES,
+    BlockingStats,
+    BlockRules,
+    RequestBlocker,
+)
+from ani_scrapy.core.capture import UrlCapture, UrlPattern
+from ani_scrapy.core.constants.general import (
+    BROWSER_CONTEXT_RECYCLE_AFTER,
+    BROWSER_MAX_CONTEXTS,
+    BROWSER_MAX_PAGES,
+    CONTEXT_OPTIONS,
+)
+from ani_scrapy.core.contextpool import ContextPool, ContextPoolStats
 
 stealth = Stealth()
 
+DEFAULT_SCOPE = "default"
+
 
 class AsyncBrowser:
-    """Async browser manager."""
+    """Async browser manager.
+
+    Pooled pages are grouped by scope (one per provider): each scope gets
+    its own contexts, so cookies and popups never cross providers, and
+    its own request blocking rules: ``block_rules[scope]`` if given, else
+    the rules the scope was first requested with, else
+    ``default_block_rules``.
+    """
 
     def __init__(
         self,
         headless: bool = True,
         executable_path: str | None = None,
         args: list[str] = [],
+        max_pages: int = BROWSER_MAX_PAGES,
+        max_contexts: int = BROWSER_MAX_CONTEXTS,
+        recycle_after: int = BROWSER_CONTEXT_RECYCLE_AFTER,
+        block_rules: Optional[dict[str, BlockRules]] = None,
+        default_block_rules: BlockRules = DEFAULT_BLOCK_RULES,
     ):
         self.headless = headless
         self.executable_path = executable_path
         self.args = args
+        self.max_pages = max_pages
+        self.max_contexts = max_contexts
+        self.recycle_after = recycle_after
+        self.block_rules = dict(block_rules or {})
+        self.default_block_rules = default_block_rules
         self.playwright = None
         self.browser = None
+        self.context = None
+        self._pools: dict[str, ContextPool] = {}
+        self._blockers: dict[str, RequestBlocker] = {}
         self._playwright_cm = None
 
     async def __aenter__(self):
@@ -36,11 +74,13 @@ class AsyncBrowser:
         if self.executable_path:
             launch_options["executable_path"] = self.executable_path
         self.browser = await self.playwright.chromium.launch(**launch_options)
-        self.context = await self.browser.new_context(**CONTEXT_OPTIONS)
-        await stealth.apply_stealth_async(self.context)
+        self.context = await self.new_context()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            await pool.close()
         if self.context:
             await self.context.close()
         if self.browser:
@@ -48,7 +88,57 @@ class AsyncBrowser:
         if self._playwright_cm:
             await self._playwright_cm.__aexit__(exc_type, exc_val, exc_tb)
 
+    async def new_context(
+        self, blocker: Optional[RequestBlocker] = None
+    ) -> BrowserContext:
+        """Create a new stealth-prepared context, optionally with blocking."""
+        context = await self.browser.new_context(**CONTEXT_OPTIONS)
+        await stealth.apply_stealth_async(context)
+        if blocker is not None:
+            await blocker.attach(context)
+        return context
+
     async def new_page(self):
         """Create a new page in the browser."""
         page = await self.context.new_page()
         return page
+
+    def _pool(self, scope: str, rules: Optional[BlockRules]) -> ContextPool:
+        pool = self._pools.get(scope)
+        if pool is None:
+            rules = self.block_rules.get(scope, rules or self.default_block_rules)
+            blocker = RequestBlocker(rules) if rules else None
+            if blocker is not None:
+                self._blockers[scope] = blocker
+            pool = ContextPool(
+                lambda: self.new_context(blocker),
+                max_contexts=self.max_contexts,
+                max_pages=self.max_pages,
+                recycle_after=self.recycle_after,
+            )
+            self._pools[scope] = pool
+        return pool
+
+    @asynccontextmanager
+    async def page(
+        self,
+        scope: str = DEFAULT_SCOPE,
+        rules: Optional[BlockRules] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[Page]:
+        """Borrow a pooled page from the least-loaded context of scope."""
+        async with self._pool(scope, rules).page(timeout) as page:
+            yield page
+
+    @staticmethod
+    def capture_url(page: Page, pattern: UrlPattern) -> UrlCapture:
+        """Resolve a future with the first request of page matching pattern."""
+        return UrlCapture(page, pattern)
+
+    def page_stats(self) -> dict[str, ContextPoolStats]:
+        """Context and page pool metrics per scope."""
+        return {scope: pool.stats() for scope, pool in self._pools.items()}
+
+    def blocking_stats(self) -> dict[str, BlockingStats]:
+        """Allowed/blocked request metrics per scope."""
+        return {scope: b.stats() for scope, b in self._blockers.items()}
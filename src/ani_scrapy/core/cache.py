@@ -0,0 +1,279 @@
+"""Conditional-GET HTTP cache with pluggable backends."""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Mapping, Optional
+from urllib.parse import urlencode
+
+from ani_scrapy.core.log import logger
+
+
+@dataclass
+class CacheEntry:
+    """Stored response body with its validators."""
+
+    body: bytes
+    encoding: str = "utf-8"
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    stored_at: float = field(default_factory=time.time)
+
+    @property
+    def size(self) -> int:
+        return len(self.body)
+
+    def text(self) -> str:
+        """Decode the stored body."""
+        return self.body.decode(self.encoding, errors="replace")
+
+
+@dataclass
+class CacheStats:
+    """Cache counters."""
+
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+
+
+class BaseCacheBackend(ABC):
+    """Storage backend for HttpCache."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        """Get an entry by key."""
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry."""
+        ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove an entry."""
+        ...
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Remove every entry."""
+        ...
+
+    async def close(self) -> None:
+        """Release backend resources."""
+
+
+class MemoryCacheBackend(BaseCacheBackend):
+    """In-memory LRU backend bounded by total body size."""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        if entry.size > self.max_bytes:
+            await self.delete(key)
+            return
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.current_bytes -= previous.size
+
+        self._entries[key] = entry
+        self.current_bytes += entry.size
+
+        while self.current_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.current_bytes -= evicted.size
+
+    async def delete(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.current_bytes -= entry.size
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self.current_bytes = 0
+
+
+class SQLiteCacheBackend(BaseCacheBackend):
+    """On-disk backend stored in a SQLite database.
+
+    Queries run in a worker thread so the event loop is never blocked on
+    disk I/O.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS http_cache ("
+            "key TEXT PRIMARY KEY, body BLOB NOT NULL, encoding TEXT NOT NULL, "
+            "etag TEXT, last_modified TEXT, stored_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def _execute(self, query: str, args: tuple = ()) -> list[tuple]:
+        with self._lock:
+            rows = self._conn.execute(query, args).fetchall()
+            self._conn.commit()
+            return rows
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        rows = await asyncio.to_thread(
+            self._execute,
+            "SELECT body, encoding, etag, last_modified, stored_at "
+            "FROM http_cache WHERE key = ?",
+            (key,),
+        )
+        if not rows:
+            return None
+        body, encoding, etag, last_modified, stored_at = rows[0]
+        return CacheEntry(
+            body=bytes(body),
+            encoding=encoding,
+            etag=etag,
+            last_modified=last_modified,
+            stored_at=stored_at,
+        )
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        await asyncio.to_thread(
+            self._execute,
+            "INSERT OR REPLACE INTO http_cache "
+            "(key, body, encoding, etag, last_modified, stored_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                entry.body,
+                entry.encoding,
+                entry.etag,
+                entry.last_modified,
+                entry.stored_at,
+            ),
+        )
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(
+            self._execute, "DELETE FROM http_cache WHERE key = ?", (key,)
+        )
+
+    async def clear(self) -> None:
+        await asyncio.to_thread(self._execute, "DELETE FROM http_cache")
+
+    async def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class HttpCache:
+    """Conditional-GET cache used by AsyncHttpAdapter.
+
+    Responses carrying an ``ETag`` or ``Last-Modified`` header are stored
+    and revalidated with ``If-None-Match``/``If-Modified-Since``; a 304
+    answer serves the stored body. Entries younger than ``max_age``
+    seconds are served without contacting the server at all.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[BaseCacheBackend] = None,
+        max_age: float = 0,
+    ):
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.max_age = max_age
+        self.stats = CacheStats()
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Mapping] = None) -> str:
+        """Build the cache key for a GET request."""
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted(params.items()), doseq=True)}"
+
+    async def lookup(self, key: str) -> Optional[CacheEntry]:
+        """Get a stored entry, counting a hit when it is still fresh."""
+        entry = await self.backend.get(key)
+        if entry is not None and self.is_fresh(entry):
+            self.stats.hits += 1
+        return entry
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """Whether entry can be served without revalidation."""
+        return self.max_age > 0 and time.time() - entry.stored_at < self.max_age
+
+    @staticmethod
+    def conditional_headers(entry: Optional[CacheEntry]) -> dict[str, str]:
+        """Validator headers for revalidating entry."""
+        headers: dict[str, str] = {}
+        if entry is None:
+            return headers
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    async def revalidated(self, key: str, entry: CacheEntry) -> CacheEntry:
+        """Record a 304 answer and refresh the entry timestamp."""
+        self.stats.revalidated += 1
+        entry.stored_at = time.time()
+        await self.backend.set(key, entry)
+        return entry
+
+    async def store(
+        self,
+        key: str,
+        body: bytes,
+        encoding: str,
+        headers: Mapping[str, str],
+    ) -> None:
+        """Record a full response and store it when it is cacheable."""
+        self.stats.misses += 1
+
+        cache_control = headers.get("Cache-Control", "").lower()
+        if "no-store" in cache_control:
+            return
+
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified and self.max_age <= 0:
+            return
+
+        try:
+            await self.backend.set(
+                key,
+                CacheEntry(
+                    body=body,
+                    encoding=encoding,
+                    etag=etag,
+                    last_modified=last_modified,
+                ),
+            )
+        except Exception as e:
+            logger.warning(
+                "HTTP cache store failed | key={key} error={error}",
+                key=key,
+                error=str(e),
+            )
+
+    async def close(self) -> None:
+        """Close the backend."""
+        await self.backend.close()
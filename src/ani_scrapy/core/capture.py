@@ -0,0 +1,105 @@
+"""Capture URLs from the network traffic of a page."""
+
+import asyncio
+import re
+from typing import Awaitable, Callable, Optional, TypeVar, Union
+
+from playwright.async_api import Page, Request
+
+T = TypeVar("T")
+
+UrlPattern = Union[str, re.Pattern, Callable[[Request], bool]]
+
+MEDIA_URL = re.compile(r"\.(?:m3u8|mpd|mp4|webm)(?:[?#]|$)", re.IGNORECASE)
+
+
+def is_media_request(request: Request) -> bool:
+    """Whether request fetches a video file or streaming manifest."""
+    return request.resource_type == "media" or bool(MEDIA_URL.search(request.url))
+
+
+def is_main_frame_media(request: Request) -> bool:
+    """Whether request is a video requested by the page itself, not an ad frame."""
+    return is_media_request(request) and request.frame.parent_frame is None
+
+
+def _matcher(pattern: UrlPattern) -> Callable[[Request], bool]:
+    if isinstance(pattern, str):
+        return lambda request: pattern in request.url
+    if isinstance(pattern, re.Pattern):
+        return lambda request: pattern.search(request.url) is not None
+    return pattern
+
+
+class UrlCapture:
+    """Future resolved with the URL of the first request matching a pattern.
+
+    The matching ``Request`` itself is kept in ``request``.
+
+    Requests from every frame of the page are seen as they leave it, so
+    a link is known before the element that triggered it is rendered.
+    Strings match as substrings of the URL, regular expressions are
+    searched in it and callables receive the ``Request``.
+    """
+
+    def __init__(self, page: Page, pattern: UrlPattern):
+        self.page = page
+        self._match = _matcher(pattern)
+        self.future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self.request: Optional[Request] = None
+        page.on("request", self._on_request)
+
+    def _on_request(self, request: Request) -> None:
+        if self.future.done():
+            return
+        try:
+            matched = self._match(request)
+        except Exception:
+            # Requests without a frame (service workers) and the like.
+            matched = False
+        if matched:
+            self.request = request
+            self.future.set_result(request.url)
+            self.dispose()
+
+    async def wait(self, timeout: float) -> Optional[str]:
+        """Matched URL, or None if nothing matched within timeout seconds."""
+        try:
+            return await asyncio.wait_for(asyncio.shield(self.future), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def dispose(self) -> None:
+        """Stop listening; a pending future is cancelled."""
+        self.page.remove_listener("request", self._on_request)
+        if not self.future.done():
+            self.future.cancel()
+
+
+async def first_result(*aws: Awaitable[Optional[T]], timeout: float) -> Optional[T]:
+    """First non-None result of aws within timeout seconds.
+
+    Awaitables that fail or return None drop out of the race; the ones
+    still running when it ends are cancelled.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    pending = {asyncio.ensure_future(aw) for aw in aws}
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=max(deadline - loop.time(), 0),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not done:
+                return None
+            for task in done:
+                if task.cancelled() or task.exception() is not None:
+                    continue
+                if task.result() is not None:
+                    return task.result()
+        return None
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,43 @@
+"""Anti-bot challenge detection and browser clearance handoff."""
+
+from dataclasses import dataclass, field
+from typing import Dict, Mapping
+
+from playwright.async_api import Page
+
+CHALLENGE_STATUSES = frozenset({403, 429, 503})
+CHALLENGE_MARKERS = (
+    b"challenge-platform",
+    b"cf-browser-verification",
+    b"_cf_chl_opt",
+    b"<title>Just a moment...</title>",
+    b"DDoS-Guard",
+)
+
+
+def is_challenge(status: int, headers: Mapping[str, str], body: bytes = b"") -> bool:
+    """Whether a response is an anti-bot challenge instead of the page."""
+    if headers.get("cf-mitigated", "").lower() == "challenge":
+        return True
+    if status not in CHALLENGE_STATUSES:
+        return False
+    head = body[:32768]
+    return any(marker in head for marker in CHALLENGE_MARKERS)
+
+
+@dataclass(frozen=True)
+class Clearance:
+    """Cookies and user agent a browser obtained by passing a challenge."""
+
+    user_agent: str
+    cookies: Dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    async def from_page(cls, page: Page) -> "Clearance":
+        """Export the clearance of the site page is on."""
+        cookies = await page.context.cookies(page.url)
+        user_agent = await page.evaluate("navigator.userAgent")
+        return cls(
+            user_agent=user_agent,
+            cookies={cookie["name"]: cookie["value"] for cookie in cookies},
+        )
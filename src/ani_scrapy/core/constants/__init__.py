@@ -6,8 +6,33 @@ from ani_scrapy.core.constants.general import (
     YOURUPLOAD_DOWNLOAD_URL,
     YOURUPLOAD_TIMEOUT,
     SW_TIMEOUT,
+    SW_ERROR_SELECTOR,
+    SW_LINK_SELECTOR,
+    SW_FORM_SELECTOR,
+    SW_QUALITY_SUFFIXES,
+    SW_DOWNLOADS_DISABLED,
     MEDIAFIRE_TIMEOUT,
+    CHALLENGE_TIMEOUT,
+    RESOLVER_CACHE_TTL,
+    RESOLVER_EXPIRY_MARGIN,
+    RESOLVER_MAX_CONCURRENCY,
     MONTH_MAP,
+    HTTP_CONNECTOR_LIMIT,
+    HTTP_CONNECTOR_LIMIT_PER_HOST,
+    HTTP_KEEPALIVE_TIMEOUT,
+    HTTP_DNS_CACHE_TTL,
+    HTTP_RATE_LIMIT,
+    HTTP_RATE_BURST,
+    HTTP_INITIAL_CONCURRENCY,
+    HTTP_MIN_CONCURRENCY,
+    HTTP_MAX_CONCURRENCY,
+    HTTP_STREAM_CHUNK_SIZE,
+    BROWSER_MAX_PAGES,
+    BROWSER_MAX_CONTEXTS,
+    BROWSER_CONTEXT_RECYCLE_AFTER,
+    BROWSER_FLEET_SIZE,
+    BROWSER_BLOCKED_RESOURCE_TYPES,
+    BROWSER_BLOCKED_DOMAINS,
 )
 
 __all__ = [
@@ -16,6 +41,31 @@ __all__ = [
     "YOURUPLOAD_DOWNLOAD_URL",
     "YOURUPLOAD_TIMEOUT",
     "SW_TIMEOUT",
+    "SW_ERROR_SELECTOR",
+    "SW_LINK_SELECTOR",
+    "SW_FORM_SELECTOR",
+    "SW_QUALITY_SUFFIXES",
+    "SW_DOWNLOADS_DISABLED",
     "MEDIAFIRE_TIMEOUT",
+    "CHALLENGE_TIMEOUT",
+    "RESOLVER_CACHE_TTL",
+    "RESOLVER_EXPIRY_MARGIN",
+    "RESOLVER_MAX_CONCURRENCY",
     "MONTH_MAP",
+    "HTTP_CONNECTOR_LIMIT",
+    "HTTP_CONNECTOR_LIMIT_PER_HOST",
+    "HTTP_KEEPALIVE_TIMEOUT",
+    "HTTP_DNS_CACHE_TTL",
+    "HTTP_RATE_LIMIT",
+    "HTTP_RATE_BURST",
+    "HTTP_INITIAL_CONCURRENCY",
+    "HTTP_MIN_CONCURRENCY",
+    "HTTP_MAX_CONCURRENCY",
+    "HTTP_STREAM_CHUNK_SIZE",
+    "BROWSER_MAX_PAGES",
+    "BROWSER_MAX_CONTEXTS",
+    "BROWSER_CONTEXT_RECYCLE_AFTER",
+    "BROWSER_FLEET_SIZE",
+    "BROWSER_BLOCKED_RESOURCE_TYPES",
+    "BROWSER_BLOCKED_DOMAINS",
 ]
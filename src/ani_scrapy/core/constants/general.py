@@ -21,7 +21,17 @@ YOURUPLOAD_DOWNLOAD_URL = "https://yourupload.com/embed"
 
 YOURUPLOAD_TIMEOUT = 10000
 SW_TIMEOUT = 7000
+SW_ERROR_SELECTOR = "div.text-danger.text-center.mb-5"
+SW_LINK_SELECTOR = "div.text-center a.btn"
+SW_FORM_SELECTOR = "form#F1"
+SW_QUALITY_SUFFIXES = ("_h", "_n", "_l")
+SW_DOWNLOADS_DISABLED = "Downloads disabled 620"
 MEDIAFIRE_TIMEOUT = 10000
+CHALLENGE_TIMEOUT = 15000
+
+RESOLVER_CACHE_TTL = 600
+RESOLVER_EXPIRY_MARGIN = 30
+RESOLVER_MAX_CONCURRENCY = 4
 
 MONTH_MAP = {
     "Enero": 1,
@@ -37,3 +47,39 @@ MONTH_MAP = {
     "Noviembre": 11,
     "Diciembre": 12,
 }
+
+HTTP_CONNECTOR_LIMIT = 100
+HTTP_CONNECTOR_LIMIT_PER_HOST = 10
+HTTP_KEEPALIVE_TIMEOUT = 30.0
+HTTP_DNS_CACHE_TTL = 300
+
+HTTP_RATE_LIMIT = 20.0
+HTTP_RATE_BURST = 20
+# The connector never opens more than HTTP_CONNECTOR_LIMIT_PER_HOST
+# connections to a host, so the limiter starts there and only backs off
+# from it when the host throttles.
+HTTP_INITIAL_CONCURRENCY = HTTP_CONNECTOR_LIMIT_PER_HOST
+HTTP_MIN_CONCURRENCY = 1
+HTTP_MAX_CONCURRENCY = HTTP_CONNECTOR_LIMIT_PER_HOST
+
+HTTP_STREAM_CHUNK_SIZE = 16 * 1024
+
+BROWSER_MAX_PAGES = 4
+BROWSER_MAX_CONTEXTS = 2
+BROWSER_CONTEXT_RECYCLE_AFTER = 100
+BROWSER_FLEET_SIZE = 2
+# Media stays allowed: several hosters are read from their <video> player.
+BROWSER_BLOCKED_RESOURCE_TYPES = ("image", "font")
+BROWSER_BLOCKED_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "adservice.google.com",
+    "connect.facebook.net",
+    "scorecardresearch.com",
+    "histats.com",
+    "disqus.com",
+    "disquscdn.com",
+)
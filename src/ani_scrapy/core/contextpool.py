@@ -0,0 +1,147 @@
+"""Pool of stealth-prepared Playwright browser contexts."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+from playwright.async_api import BrowserContext, Frame, Page
+
+from ani_scrapy.core.log import logger
+from ani_scrapy.core.pagepool import RESET_URL, PagePool, PagePoolStats
+
+
+@dataclass
+class ContextPoolStats:
+    """Context pool counters, with the page pool of each live context."""
+
+    max_contexts: int
+    max_pages_per_context: int
+    recycle_after: int
+    created: int
+    recycled: int
+    contexts: list[PagePoolStats] = field(default_factory=list)
+
+
+class _PooledContext:
+    """A browser context, its pages and how much it has been used."""
+
+    def __init__(self, context: BrowserContext, max_pages: int):
+        self.context = context
+        self.pages = PagePool(self._new_page, max_pages=max_pages)
+        self.navigations = 0
+        self.active = 0
+        self.retiring = False
+
+    async def _new_page(self) -> Page:
+        page = await self.context.new_page()
+        page.on("framenavigated", self._on_navigation)
+        return page
+
+    def _on_navigation(self, frame: Frame) -> None:
+        if frame.parent_frame is None and frame.url != RESET_URL:
+            self.navigations += 1
+
+    async def close(self) -> None:
+        await self.pages.close()
+        try:
+            await self.context.close()
+        except Exception as e:
+            logger.debug("Closing browser context failed | error={error}", error=str(e))
+
+
+class ContextPool:
+    """Up to ``max_contexts`` contexts, each serving ``max_pages`` pages.
+
+    Pages are taken from the least-loaded context. A new context is only
+    opened when every live one is at its page cap, and a context is
+    retired (closed once its last page is checked in, then replaced on
+    demand) after ``recycle_after`` navigations, so cookies, storage and
+    leaked popups do not accumulate. ``recycle_after=0`` never recycles.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Awaitable[BrowserContext]],
+        max_contexts: int = 2,
+        max_pages: int = 4,
+        recycle_after: int = 0,
+    ):
+        self.factory = factory
+        self.max_contexts = max_contexts
+        self.max_pages = max_pages
+        self.recycle_after = recycle_after
+        self._contexts: list[_PooledContext] = []
+        self._retiring: list[_PooledContext] = []
+        self._lock = asyncio.Lock()
+        self._created = 0
+        self._recycled = 0
+        self._closed = False
+
+    def stats(self) -> ContextPoolStats:
+        """Snapshot for metrics."""
+        return ContextPoolStats(
+            max_contexts=self.max_contexts,
+            max_pages_per_context=self.max_pages,
+            recycle_after=self.recycle_after,
+            created=self._created,
+            recycled=self._recycled,
+            contexts=[pooled.pages.stats() for pooled in self._contexts],
+        )
+
+    async def _pick(self) -> _PooledContext:
+        """Least-loaded context, opening a new one while all are full."""
+        async with self._lock:
+            if self._closed:
+                raise RuntimeError("Context pool is closed")
+            least = min(self._contexts, key=lambda c: c.active, default=None)
+            if least is None or (
+                least.active >= self.max_pages
+                and len(self._contexts) < self.max_contexts
+            ):
+                least = _PooledContext(await self.factory(), self.max_pages)
+                self._contexts.append(least)
+                self._created += 1
+            least.active += 1
+            return least
+
+    async def _done(self, pooled: _PooledContext) -> None:
+        pooled.active -= 1
+        if (
+            not pooled.retiring
+            and self.recycle_after
+            and pooled.navigations >= self.recycle_after
+        ):
+            logger.debug(
+                "Recycling browser context | navigations={navigations}",
+                navigations=pooled.navigations,
+            )
+            pooled.retiring = True
+            self._contexts.remove(pooled)
+            self._retiring.append(pooled)
+            self._recycled += 1
+        if pooled.retiring and pooled.active == 0:
+            self._retiring.remove(pooled)
+            await pooled.close()
+
+    @asynccontextmanager
+    async def page(self, timeout: Optional[float] = None) -> AsyncIterator[Page]:
+        """Check out a page from the least-loaded context.
+
+        ``timeout`` (seconds) bounds the wait for a free page.
+        """
+        pooled = await self._pick()
+        try:
+            async with pooled.pages.page(timeout) as page:
+                yield page
+        finally:
+            await self._done(pooled)
+
+    async def close(self) -> None:
+        """Close every context and its pages."""
+        async with self._lock:
+            self._closed = True
+            contexts, self._contexts = self._contexts + self._retiring, []
+            self._retiring = []
+        for pooled in contexts:
+            await pooled.close()
@@ -0,0 +1,118 @@
+"""Executor for running parser calls off the event loop."""
+
+import asyncio
+import functools
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+PARSE_MODES = ("inline", "thread", "process")
+
+
+@dataclass
+class ExecutorStats:
+    """Parse executor counters; waits are in seconds."""
+
+    mode: str
+    max_workers: int
+    submitted: int
+    completed: int
+    in_flight: int
+    last_wait: float
+    total_wait: float
+    max_wait: float
+
+
+def _timed_call(fn: Callable[..., T], args: tuple, kwargs: dict) -> tuple[float, T]:
+    """Run fn in a worker, reporting when it started.
+
+    Uses wall-clock time because process workers do not share the
+    caller's monotonic clock on every platform.
+    """
+    return time.time(), fn(*args, **kwargs)
+
+
+class ParseExecutor:
+    """Run parser calls inline, in a thread pool or in a process pool.
+
+    ``inline`` parses on the event loop, ``thread`` keeps the loop free
+    while sharing parsed trees, and ``process`` spreads parsing across
+    cores; in that mode functions, arguments and results must be
+    picklable, so parsers receive raw bytes instead of lxml trees.
+    """
+
+    def __init__(self, mode: str = "inline", max_workers: Optional[int] = None):
+        if mode not in PARSE_MODES:
+            raise ValueError(f"mode must be one of {PARSE_MODES}, got {mode!r}")
+        self.mode = mode
+        self.max_workers = (
+            0 if mode == "inline" else max_workers or min(32, os.cpu_count() or 1)
+        )
+        self._pool: Optional[Executor] = None
+        self._submitted = 0
+        self._completed = 0
+        self._last_wait = 0.0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    @property
+    def shares_memory(self) -> bool:
+        """Whether parsed trees can be handed to the parser functions."""
+        return self.mode != "process"
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            if self.mode == "thread":
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="ani-scrapy-parse"
+                )
+            else:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._pool
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Call fn(*args, **kwargs) in the configured executor."""
+        self._submitted += 1
+        if self.mode == "inline":
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._completed += 1
+
+        loop = asyncio.get_running_loop()
+        submitted_at = time.time()
+        try:
+            started_at, result = await loop.run_in_executor(
+                self._get_pool(), functools.partial(_timed_call, fn, args, kwargs)
+            )
+        finally:
+            self._completed += 1
+
+        wait = max(started_at - submitted_at, 0.0)
+        self._last_wait = wait
+        self._total_wait += wait
+        self._max_wait = max(self._max_wait, wait)
+        return result
+
+    def stats(self) -> ExecutorStats:
+        """Snapshot for metrics."""
+        return ExecutorStats(
+            mode=self.mode,
+            max_workers=self.max_workers,
+            submitted=self._submitted,
+            completed=self._completed,
+            in_flight=self._submitted - self._completed,
+            last_wait=round(self._last_wait, 6),
+            total_wait=round(self._total_wait, 6),
+            max_wait=round(self._max_wait, 6),
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker pool; it is recreated on the next call."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+            self._pool = None
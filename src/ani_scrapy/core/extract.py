@@ -0,0 +1,34 @@
+"""Structured extraction inside the page instead of full DOM dumps."""
+
+from dataclasses import dataclass
+from typing import Any, Union
+
+from playwright.async_api import Frame, Page
+
+from ani_scrapy.core.log import logger
+from ani_scrapy.core.metrics import measure
+
+
+@dataclass(frozen=True)
+class PageExtractor:
+    """JS function run over the elements matching a selector.
+
+    ``script`` receives the matched elements (and ``arg``) and returns
+    plain data, so only the fields a parser needs cross the Playwright
+    connection instead of the serialized document.
+    """
+
+    name: str
+    selector: str
+    script: str
+
+    async def __call__(self, target: Union[Page, Frame], arg: Any = None) -> Any:
+        """Run the extractor in a page or frame."""
+        async with measure(f"extract.{self.name}"):
+            result = await target.locator(self.selector).evaluate_all(self.script, arg)
+        logger.debug(
+            "Extracted from page | extractor={name} items={items}",
+            name=self.name,
+            items=len(result) if isinstance(result, list) else 1,
+        )
+        return result
@@ -0,0 +1,164 @@
+"""Fleet of browsers sharing the page load of one or more scrapers."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Optional
+
+from playwright.async_api import Page
+
+from ani_scrapy.core.blocking import BlockingStats, BlockRules
+from ani_scrapy.core.browser import DEFAULT_SCOPE, AsyncBrowser
+from ani_scrapy.core.constants.general import BROWSER_FLEET_SIZE
+from ani_scrapy.core.contextpool import ContextPoolStats
+from ani_scrapy.core.log import logger
+
+
+@dataclass
+class FleetStats:
+    """Fleet counters; ``load`` is the queue depth of each browser."""
+
+    size: int
+    restarts: int
+    load: list[int]
+
+
+class _Member:
+    """One browser of the fleet and the operations queued on it."""
+
+    def __init__(self, index: int):
+        self.index = index
+        self.browser: Optional[AsyncBrowser] = None
+        self.load = 0
+        self.lock = asyncio.Lock()
+
+    @property
+    def alive(self) -> bool:
+        browser = self.browser
+        return (
+            browser is not None
+            and browser.browser is not None
+            and browser.browser.is_connected()
+        )
+
+
+class BrowserFleet(AsyncBrowser):
+    """``size`` independent browsers behind the ``AsyncBrowser`` API.
+
+    Every browser runs its own Playwright driver and Chromium process
+    tree, so page work spreads over several cores while results still
+    come back to the caller's event loop. Pages are taken from the
+    browser with the fewest queued operations, and a browser found
+    disconnected (crashed or killed) is relaunched before it is used
+    again. Pass it as ``external_browser`` to any scraper.
+    """
+
+    def __init__(self, size: int = BROWSER_FLEET_SIZE, **browser_options: Any):
+        super().__init__(**browser_options)
+        self.size = size
+        self._browser_options = browser_options
+        self._members = [_Member(i) for i in range(size)]
+        self._restarts = 0
+        self._next = 0
+
+    async def _launch(self) -> AsyncBrowser:
+        browser = AsyncBrowser(**self._browser_options)
+        await browser.__aenter__()
+        return browser
+
+    async def _start(self, member: _Member) -> None:
+        async with member.lock:
+            if member.alive:
+                return
+            if member.browser is not None:
+                logger.warning(
+                    "Restarting disconnected browser | index={index}",
+                    index=member.index,
+                )
+                self._restarts += 1
+                await self._stop(member)
+            member.browser = await self._launch()
+
+    async def _stop(self, member: _Member) -> None:
+        browser, member.browser = member.browser, None
+        if browser is None:
+            return
+        try:
+            await browser.__aexit__(None, None, None)
+        except Exception as e:
+            logger.debug(
+                "Closing fleet browser failed | index={index} error={error}",
+                index=member.index,
+                error=str(e),
+            )
+
+    async def __aenter__(self):
+        await asyncio.gather(*(self._start(m) for m in self._members))
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await asyncio.gather(*(self._stop(m) for m in self._members))
+
+    async def _pick(self) -> _Member:
+        """Least-loaded browser, relaunched first if it went away."""
+        # Rotate the starting point so ties do not always go to the first.
+        start, self._next = self._next, (self._next + 1) % self.size
+        members = self._members[start:] + self._members[:start]
+        member = min(members, key=lambda m: m.load)
+        member.load += 1
+        try:
+            if not member.alive:
+                await self._start(member)
+        except BaseException:
+            member.load -= 1
+            raise
+        return member
+
+    async def new_page(self):
+        """Create a new, unpooled page in the least-loaded browser."""
+        member = await self._pick()
+        try:
+            return await member.browser.new_page()
+        finally:
+            member.load -= 1
+
+    @asynccontextmanager
+    async def page(
+        self,
+        scope: str = DEFAULT_SCOPE,
+        rules: Optional[BlockRules] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[Page]:
+        """Borrow a pooled page from the least-loaded browser."""
+        member = await self._pick()
+        try:
+            async with member.browser.page(scope, rules, timeout=timeout) as page:
+                yield page
+        finally:
+            member.load -= 1
+
+    def stats(self) -> FleetStats:
+        """Snapshot for metrics."""
+        return FleetStats(
+            size=self.size,
+            restarts=self._restarts,
+            load=[m.load for m in self._members],
+        )
+
+    def page_stats(self) -> dict[str, ContextPoolStats]:
+        """Context and page pool metrics per ``scope@browser``."""
+        return {
+            f"{scope}@{m.index}": stats
+            for m in self._members
+            if m.browser is not None
+            for scope, stats in m.browser.page_stats().items()
+        }
+
+    def blocking_stats(self) -> dict[str, BlockingStats]:
+        """Allowed/blocked request metrics per ``scope@browser``."""
+        return {
+            f"{scope}@{m.index}": stats
+            for m in self._members
+            if m.browser is not None
+            for scope, stats in m.browser.blocking_stats().items()
+        }
@@ -0,0 +1,167 @@
+"""HTML parsing helpers built on lxml."""
+
+import codecs
+import threading
+from dataclasses import dataclass
+from typing import Optional, Sequence, Union
+
+from lxml import etree
+from lxml import html as lxml_html
+
+SCRIPT_END = b"</script>"
+
+
+@dataclass(frozen=True)
+class HtmlBody:
+    """Raw response body with the encoding reported by the server."""
+
+    content: bytes
+    encoding: Optional[str] = None
+
+    def text(self) -> str:
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+
+Markup = Union[str, bytes, memoryview, HtmlBody]
+HtmlSource = Union[Markup, lxml_html.HtmlElement]
+
+
+def _codec_name(encoding: Optional[str]) -> Optional[str]:
+    """Normalize an encoding label to the codec name lxml understands."""
+    if not encoding:
+        return None
+    try:
+        return codecs.lookup(encoding).name
+    except LookupError:
+        return None
+
+
+def html_parser(encoding: Optional[str] = None) -> lxml_html.HTMLParser:
+    """Get an lxml HTML parser for encoding, ignoring names lxml rejects."""
+    name = _codec_name(encoding)
+    if name is not None:
+        try:
+            return lxml_html.HTMLParser(encoding=name)
+        except LookupError:
+            pass
+    return lxml_html.HTMLParser()
+
+
+_local_parsers = threading.local()
+
+
+def _document_parser(encoding: str) -> lxml_html.HTMLParser:
+    """Reusable parser for whole documents; lxml parsers are per thread."""
+    parsers = _local_parsers.__dict__.setdefault("by_encoding", {})
+    parser = parsers.get(encoding)
+    if parser is None:
+        parser = parsers[encoding] = html_parser(encoding)
+    return parser
+
+
+def _raw_markup(source: Markup) -> tuple[Union[str, bytes], Optional[str]]:
+    """Split markup into what the parsers accept and its encoding."""
+    if isinstance(source, HtmlBody):
+        return source.content, _codec_name(source.encoding) or "utf-8"
+    if isinstance(source, memoryview):
+        # lxml only takes str or bytes.
+        source = source.tobytes()
+    return source, "utf-8" if isinstance(source, bytes) else None
+
+
+def parse_html(source: HtmlSource) -> lxml_html.HtmlElement:
+    """Get an lxml document from markup or an already parsed tree.
+
+    Bytes are handed to lxml undecoded, in the body encoding when known
+    and UTF-8 otherwise.
+    """
+    if isinstance(source, etree._Element):
+        return source
+    markup, encoding = _raw_markup(source)
+    parser = _document_parser(encoding) if isinstance(markup, bytes) else None
+    try:
+        return lxml_html.document_fromstring(markup, parser=parser)
+    except etree.ParserError:
+        # Empty documents have no root; parse a bare one instead.
+        return lxml_html.document_fromstring("<html></html>")
+
+
+def first(elements: list):
+    """First element of a selector result, or None when it is empty."""
+    return elements[0] if elements else None
+
+
+def text_of(element) -> str:
+    """Stripped text content of element, or "" when it is missing."""
+    if element is None:
+        return ""
+    return element.text_content().strip()
+
+
+class IncrementalHTMLParser:
+    """Feed HTML chunks to lxml as they arrive from the network.
+
+    With ``stop_after`` markers the parser reports completion once every
+    marker has been seen and ``terminator`` (the end of the enclosing
+    ``<script>`` by default) follows the last one, so the caller can stop
+    reading the rest of the body.
+    """
+
+    def __init__(
+        self,
+        stop_after: Sequence[str | bytes] = (),
+        terminator: bytes = SCRIPT_END,
+        encoding: Optional[str] = None,
+    ):
+        self._parser = html_parser(encoding)
+        self._pending = {m.encode() if isinstance(m, str) else m for m in stop_after}
+        self._terminator = terminator
+        self._keep = max([len(terminator), *map(len, self._pending)]) - 1
+        self._tail = b""
+        self._search_from = 0
+        self._fed = 0
+        self.complete = False
+
+    @property
+    def bytes_fed(self) -> int:
+        return self._fed
+
+    def feed(self, chunk: bytes) -> bool:
+        """Feed a chunk; True once every marker and its terminator were seen."""
+        if not chunk:
+            return self.complete
+
+        self._parser.feed(chunk)
+        if self.complete or not (self._pending or self._search_from):
+            self._fed += len(chunk)
+            return self.complete
+
+        window = self._tail + chunk
+        window_start = self._fed - len(self._tail)
+        self._fed += len(chunk)
+
+        for marker in list(self._pending):
+            pos = window.find(marker)
+            if pos != -1:
+                self._pending.discard(marker)
+                self._search_from = max(
+                    self._search_from, window_start + pos + len(marker)
+                )
+
+        if not self._pending:
+            start = max(self._search_from - window_start, 0)
+            if window.find(self._terminator, start) != -1:
+                self.complete = True
+
+        self._tail = window[-self._keep :] if self._keep > 0 else b""
+        return self.complete
+
+    def close(self) -> lxml_html.HtmlElement:
+        """Finish parsing and get the document root."""
+        try:
+            root = self._parser.close()
+        except etree.XMLSyntaxError:
+            root = None
+        if root is None:
+            return lxml_html.document_fromstring("<html></html>")
+        return root
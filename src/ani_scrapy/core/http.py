@@ -1,11 +1,213 @@
 """HTTP adapter using aiohttp."""
 
+import asyncio
 import aiohttp
 import time
-from typing import Dict, Optional
+import weakref
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+from lxml.html import HtmlElement
+from ani_scrapy.core.cache import HttpCache
+from ani_scrapy.core.challenge import CHALLENGE_STATUSES, Clearance, is_challenge
+from ani_scrapy.core.exceptions import ScraperBlockedError
+from ani_scrapy.core.html import (
+    SCRIPT_END,
+    HtmlBody,
+    IncrementalHTMLParser,
+    parse_html,
+)
 from ani_scrapy.core.log import logger
+from ani_scrapy.core.ratelimit import (
+    AdaptiveRateLimiter,
+    RateLimiterRegistry,
+    get_rate_limiters,
+)
+from ani_scrapy.core.retry import DEFAULT_HTTP_RETRY, RetryPolicy
+from ani_scrapy.core.singleflight import SingleFlight, request_key
 
-from ani_scrapy.core.constants.general import CONTEXT_OPTIONS
+from ani_scrapy.core.constants.general import (
+    CONTEXT_OPTIONS,
+    HTTP_STREAM_CHUNK_SIZE,
+    HTTP_CONNECTOR_LIMIT,
+    HTTP_CONNECTOR_LIMIT_PER_HOST,
+    HTTP_KEEPALIVE_TIMEOUT,
+    HTTP_DNS_CACHE_TTL,
+)
+
+# Methods retried by default; others may already have been applied.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+
+
+def _default_headers() -> Dict[str, str]:
+    """Default headers shared by every session."""
+    return {
+        "User-Agent": CONTEXT_OPTIONS["user_agent"],
+        "Accept": CONTEXT_OPTIONS["extra_http_headers"]["accept"],
+        "Accept-Language": CONTEXT_OPTIONS["extra_http_headers"]["accept-language"],
+    }
+
+
+@dataclass
+class _SessionEntry:
+    session: aiohttp.ClientSession
+    loop: asyncio.AbstractEventLoop
+    refcount: int = 0
+    idle_handle: Optional[asyncio.TimerHandle] = None
+
+
+class SessionRegistry:
+    """Process-wide registry handing out one refcounted session per host.
+
+    Sessions are created with a dedicated ``TCPConnector`` so keep-alive
+    connections, DNS cache entries and TLS sessions are reused by every
+    adapter talking to the same host. A session is closed when its last
+    holder releases it, optionally after ``idle_timeout`` seconds so that
+    short-lived scrapers created one after another still hit a warm pool.
+    Sessions are bound to the loop they were created in, so each loop gets
+    its own entry per host.
+    """
+
+    def __init__(
+        self,
+        limit: int = HTTP_CONNECTOR_LIMIT,
+        limit_per_host: int = HTTP_CONNECTOR_LIMIT_PER_HOST,
+        keepalive_timeout: float = HTTP_KEEPALIVE_TIMEOUT,
+        ttl_dns_cache: Optional[int] = HTTP_DNS_CACHE_TTL,
+        idle_timeout: float = 0,
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self.idle_timeout = idle_timeout
+        self._entries: Dict[Tuple[str, asyncio.AbstractEventLoop], _SessionEntry] = {}
+        self._locks: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def _lock(self) -> asyncio.Lock:
+        """Get the registry lock bound to the running loop."""
+        loop = asyncio.get_running_loop()
+        lock = self._locks.get(loop)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[loop] = lock
+        return lock
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Create a session backed by a connector with the configured limits."""
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache,
+            use_dns_cache=self.ttl_dns_cache is not None,
+        )
+        return aiohttp.ClientSession(connector=connector, headers=_default_headers())
+
+    async def acquire(self, host: str) -> aiohttp.ClientSession:
+        """Get the shared session for host, creating it if needed."""
+        async with self._lock():
+            loop = asyncio.get_running_loop()
+            entry = self._entries.get((host, loop))
+            if entry is None or entry.session.closed:
+                logger.debug("HTTP session created | host={host}", host=host)
+                entry = _SessionEntry(session=self._create_session(), loop=loop)
+                self._entries[(host, loop)] = entry
+
+            if entry.idle_handle is not None:
+                entry.idle_handle.cancel()
+                entry.idle_handle = None
+
+            entry.refcount += 1
+            return entry.session
+
+    def _entry_of(
+        self, host: str, session: aiohttp.ClientSession
+    ) -> Optional[_SessionEntry]:
+        """Entry holding session, whichever loop it was created in."""
+        for (entry_host, _), entry in self._entries.items():
+            if entry_host == host and entry.session is session:
+                return entry
+        return None
+
+    async def release(self, host: str, session: aiohttp.ClientSession) -> None:
+        """Release a session obtained from acquire."""
+        async with self._lock():
+            entry = self._entry_of(host, session)
+            if entry is None:
+                # Superseded by a new session after this one was closed.
+                return
+
+            entry.refcount -= 1
+            if entry.refcount > 0:
+                return
+
+            if self.idle_timeout > 0:
+                entry.idle_handle = entry.loop.call_later(
+                    self.idle_timeout,
+                    lambda: asyncio.ensure_future(self._close_idle(host, session)),
+                )
+                return
+
+            del self._entries[(host, entry.loop)]
+        await session.close()
+
+    async def _close_idle(self, host: str, session: aiohttp.ClientSession) -> None:
+        """Close a session that stayed unused for idle_timeout seconds."""
+        async with self._lock():
+            entry = self._entry_of(host, session)
+            if entry is None or entry.refcount > 0:
+                return
+            del self._entries[(host, entry.loop)]
+        await session.close()
+
+    def refcount(self, host: str) -> int:
+        """Number of adapters currently holding a session for host."""
+        return sum(
+            entry.refcount
+            for (entry_host, _), entry in self._entries.items()
+            if entry_host == host
+        )
+
+    async def close(self) -> None:
+        """Close every session owned by the running loop."""
+        async with self._lock():
+            loop = asyncio.get_running_loop()
+            entries = [
+                (key, entry)
+                for key, entry in self._entries.items()
+                if entry.loop is loop
+            ]
+            for key, entry in entries:
+                if entry.idle_handle is not None:
+                    entry.idle_handle.cancel()
+                del self._entries[key]
+        for _, entry in entries:
+            await entry.session.close()
+
+
+_default_registry: Optional[SessionRegistry] = None
+
+
+def get_session_registry() -> SessionRegistry:
+    """Get the process-wide session registry."""
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = SessionRegistry()
+    return _default_registry
+
+
+def configure_session_registry(**limits) -> SessionRegistry:
+    """Replace the process-wide registry with one using the given limits.
+
+    Accepts the ``SessionRegistry`` arguments: ``limit``, ``limit_per_host``,
+    ``keepalive_timeout``, ``ttl_dns_cache`` and ``idle_timeout``. Adapters
+    that already hold a session keep using it until they are closed.
+    """
+    global _default_registry
+    _default_registry = SessionRegistry(**limits)
+    return _default_registry
 
 
 class BaseHttpAdapter:
@@ -16,7 +218,9 @@ class BaseHttpAdapter:
         self.timeout = timeout
 
     def build_url(self, endpoint: str) -> str:
-        """Build full URL from endpoint."""
+        """Build full URL from endpoint; absolute URLs are kept as they are."""
+        if "://" in endpoint:
+            return endpoint
         endpoint = endpoint.lstrip("/")
         return f"{self.base_url}/{endpoint}"
 
@@ -24,82 +228,382 @@ class BaseHttpAdapter:
 class AsyncHttpAdapter(BaseHttpAdapter):
     """Async HTTP adapter using aiohttp."""
 
-    def __init__(self, base_url: str, timeout: int = 30):
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 30,
+        registry: Optional[SessionRegistry] = None,
+        cache: Optional[HttpCache] = None,
+        coalesce: bool = True,
+        limiters: Optional[RateLimiterRegistry] = None,
+        rate_limit: bool = True,
+        retry: Optional[RetryPolicy] = DEFAULT_HTTP_RETRY,
+    ):
         super().__init__(base_url, timeout)
-        self._session = None
+        self._registry = registry
+        self.cache = cache
+        self.coalesce = coalesce
+        self._limiters = limiters
+        self.rate_limit = rate_limit
+        self.retry = retry
+        self._flight = SingleFlight()
+        self._host = urlsplit(self.base_url).netloc
+        self._client_timeout = aiohttp.ClientTimeout(total=self.timeout)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_registry: Optional[SessionRegistry] = None
+        self._session_lock = asyncio.Lock()
+        self.clearance: Optional[Clearance] = None
+
+    def set_clearance(self, clearance: Optional[Clearance]) -> None:
+        """Send a browser's challenge cookies and user agent from now on."""
+        self.clearance = clearance
+
+    def _request_options(self, headers: Optional[Dict] = None) -> Dict:
+        """Per-request headers and cookies, including any clearance."""
+        if self.clearance is None:
+            return {"headers": headers}
+        return {
+            "headers": {**(headers or {}), "User-Agent": self.clearance.user_agent},
+            "cookies": self.clearance.cookies,
+        }
+
+    async def _raise_for_challenge(
+        self, url: str, response: aiohttp.ClientResponse
+    ) -> None:
+        """Raise ScraperBlockedError when response is a challenge page."""
+        if response.status not in CHALLENGE_STATUSES:
+            return
+        body = await response.read()
+        if is_challenge(response.status, response.headers, body):
+            logger.warning(
+                "Challenge page detected | url={url} status_code={status_code}",
+                url=url,
+                status_code=response.status,
+            )
+            raise ScraperBlockedError(f"Challenge page served for {url}")
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Lazy initialization of aiohttp session."""
-        if self._session is None or self._session.closed:
-            timeout = aiohttp.ClientTimeout(total=self.timeout)
-            headers = {
-                "User-Agent": CONTEXT_OPTIONS["user_agent"],
-                "Accept": CONTEXT_OPTIONS["extra_http_headers"]["accept"],
-                "Accept-Language": CONTEXT_OPTIONS["extra_http_headers"][
-                    "accept-language"
-                ],
-            }
-            self._session = aiohttp.ClientSession(timeout=timeout, headers=headers)
-        return self._session
+        """Get the shared session for this host from the registry."""
+        async with self._session_lock:
+            if self._session is None or self._session.closed:
+                registry = self._registry or get_session_registry()
+                self._session = await registry.acquire(self._host)
+                self._session_registry = registry
+            return self._session
+
+    def _limiter_for(self, url: str) -> AdaptiveRateLimiter:
+        """Get the limiter for the host of url."""
+        limiters = self._limiters or get_rate_limiters()
+        return limiters.get(urlsplit(url).netloc)
+
+    @property
+    def rate_limiter(self) -> AdaptiveRateLimiter:
+        """Limiter for the adapter host, exposing limit, queue depth and waits."""
+        return self._limiter_for(self.base_url)
+
+    @asynccontextmanager
+    async def _rate_limited(self, url: str):
+        """Hold a slot of the per-host limiter around one request."""
+        if not self.rate_limit:
+            yield None
+            return
+
+        limiter = self._limiter_for(url)
+        ticket = await limiter.acquire()
+        try:
+            yield ticket
+        except asyncio.TimeoutError:
+            ticket.throttled = True
+            raise
+        finally:
+            limiter.release(ticket)
+
+    @property
+    def coalesced(self) -> int:
+        """Number of GET calls served by joining an identical in-flight one."""
+        return self._flight.coalesced
 
     async def get(self, endpoint: str, params: Optional[Dict] = None) -> str:
-        """Async GET request."""
-        session = await self._get_session()
+        """Async GET request.
+
+        Identical GETs (same URL and params) issued while one is already in
+        flight share its result unless the adapter was built with
+        ``coalesce=False``.
+        """
+        body = await self.get_bytes(endpoint, params)
+        return body.text()
+
+    async def get_bytes(self, endpoint: str, params: Optional[Dict] = None) -> HtmlBody:
+        """Async GET request returning the undecoded body and its encoding."""
         url = self.build_url(endpoint)
-        logger.debug(
-            "HTTP GET request | url={url} params={params}",
-            url=url,
-            params=params,
+        if not self.coalesce:
+            return await self._get(url, params)
+
+        return await self._flight.do(
+            request_key("GET", url, params), lambda: self._get(url, params)
         )
 
-        start = time.perf_counter()
+    async def _send(self, method: str, url: str, fn, retry: Optional[bool] = None):
+        """Run one request through the retry policy.
+
+        Only idempotent methods are retried unless ``retry`` says otherwise.
+        Client errors left after the last attempt are raised as
+        ``ConnectionError``.
+        """
+        if retry is None:
+            retry = method.upper() in IDEMPOTENT_METHODS
         try:
-            async with session.get(url, params=params) as response:
-                response.raise_for_status()
-                duration_ms = (time.perf_counter() - start) * 1000
-                logger.debug(
-                    "HTTP GET response | url={url} status_code={status_code} duration_ms={duration_ms}",
-                    url=url,
-                    status_code=response.status,
-                    duration_ms=round(duration_ms, 2),
-                )
-                return await response.text()
+            if self.retry is None or not retry:
+                return await fn()
+            return await self.retry.run(fn, name=f"{method} {url}")
         except aiohttp.ClientError as e:
             logger.error(
-                "HTTP GET failed | url={url} error={error}",
+                "HTTP {method} failed | url={url} error={error}",
+                method=method,
                 url=url,
                 error=str(e),
             )
             raise ConnectionError(f"HTTP request failed: {e}")
 
-    async def post(self, endpoint: str, data: Optional[Dict] = None) -> str:
-        """Async POST request."""
+    async def _get(self, url: str, params: Optional[Dict] = None) -> HtmlBody:
+        """Perform a GET request, retrying transient failures."""
+        return await self._send("GET", url, lambda: self._get_once(url, params))
+
+    async def _get_once(self, url: str, params: Optional[Dict] = None) -> HtmlBody:
+        """Perform a single GET attempt."""
         session = await self._get_session()
+        logger.debug(
+            "HTTP GET request | url={url} params={params}",
+            url=url,
+            params=params,
+        )
+
+        cache_key = None
+        entry = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(url, params)
+            entry = await self.cache.lookup(cache_key)
+            if entry is not None and self.cache.is_fresh(entry):
+                logger.debug("HTTP GET cache hit | url={url}", url=url)
+                return HtmlBody(entry.body, entry.encoding)
+
+        start = time.perf_counter()
+        async with (
+            self._rate_limited(url) as ticket,
+            session.get(
+                url,
+                params=params,
+                timeout=self._client_timeout,
+                **self._request_options(HttpCache.conditional_headers(entry)),
+            ) as response,
+        ):
+            if ticket is not None:
+                ticket.observe(response.status, response.headers)
+            await self._raise_for_challenge(url, response)
+            if response.status == 304 and entry is not None:
+                logger.debug("HTTP GET not modified | url={url}", url=url)
+                entry = await self.cache.revalidated(cache_key, entry)
+                return HtmlBody(entry.body, entry.encoding)
+
+            response.raise_for_status()
+            duration_ms = (time.perf_counter() - start) * 1000
+            logger.debug(
+                "HTTP GET response | url={url} status_code={status_code} duration_ms={duration_ms}",
+                url=url,
+                status_code=response.status,
+                duration_ms=round(duration_ms, 2),
+            )
+            body = await response.read()
+            encoding = response.get_encoding()
+            if self.cache is not None:
+                await self.cache.store(cache_key, body, encoding, response.headers)
+            return HtmlBody(body, encoding)
+
+    async def get_document(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        stop_after: Sequence[str] = (),
+        terminator: bytes = SCRIPT_END,
+    ) -> HtmlElement:
+        """Stream a GET response into an incremental lxml parser.
+
+        Chunks are parsed while the rest of the body is still in transit.
+        With ``stop_after`` markers the download stops as soon as every
+        marker and the following ``terminator`` have been received; the
+        document is then built from what was read so far. With an HTTP
+        cache configured the full body goes through the cache instead.
+        """
+        if self.cache is not None:
+            return parse_html(await self.get_bytes(endpoint, params))
+
         url = self.build_url(endpoint)
+        key = (*request_key("GET", url, params), tuple(stop_after), terminator)
+
+        async def fetch():
+            return await self._send(
+                "GET",
+                url,
+                lambda: self._get_document_once(url, params, stop_after, terminator),
+            )
+
+        if not self.coalesce:
+            return await fetch()
+        return await self._flight.do(key, fetch)
+
+    async def _get_document_once(
+        self,
+        url: str,
+        params: Optional[Dict],
+        stop_after: Sequence[str],
+        terminator: bytes,
+    ) -> HtmlElement:
+        """Perform a single streamed GET attempt."""
+        session = await self._get_session()
+        logger.debug(
+            "HTTP GET stream request | url={url} params={params}",
+            url=url,
+            params=params,
+        )
+
+        start = time.perf_counter()
+        async with (
+            self._rate_limited(url) as ticket,
+            session.get(
+                url,
+                params=params,
+                timeout=self._client_timeout,
+                **self._request_options(),
+            ) as response,
+        ):
+            if ticket is not None:
+                ticket.observe(response.status, response.headers)
+            await self._raise_for_challenge(url, response)
+            response.raise_for_status()
+
+            parser = IncrementalHTMLParser(
+                stop_after=stop_after,
+                terminator=terminator,
+                encoding=response.charset or "utf-8",
+            )
+            async for chunk in response.content.iter_chunked(HTTP_STREAM_CHUNK_SIZE):
+                if parser.feed(chunk):
+                    break
+
+            duration_ms = (time.perf_counter() - start) * 1000
+            logger.debug(
+                "HTTP GET stream response | url={url} status_code={status_code} bytes={bytes} early_stop={early_stop} duration_ms={duration_ms}",
+                url=url,
+                status_code=response.status,
+                bytes=parser.bytes_fed,
+                early_stop=parser.complete,
+                duration_ms=round(duration_ms, 2),
+            )
+            return parser.close()
+
+    async def post(
+        self, endpoint: str, data: Optional[Dict] = None, retry: bool = False
+    ) -> str:
+        """Async POST request; retried only with ``retry=True``."""
+        url = self.build_url(endpoint)
+        return await self._send(
+            "POST", url, lambda: self._post_once(url, data), retry=retry
+        )
+
+    async def _post_once(self, url: str, data: Optional[Dict] = None) -> str:
+        """Perform a single POST attempt."""
+        session = await self._get_session()
 
         logger.debug("HTTP POST request | url={url} data={data}", url=url, data=data)
 
         start = time.perf_counter()
-        try:
-            async with session.post(url, data=data) as response:
-                response.raise_for_status()
-                duration_ms = (time.perf_counter() - start) * 1000
-                logger.debug(
-                    "HTTP POST response | url={url} status_code={status_code} duration_ms={duration_ms}",
-                    url=url,
-                    status_code=response.status,
-                    duration_ms=round(duration_ms, 2),
-                )
-                return await response.text()
-        except aiohttp.ClientError as e:
-            logger.error(
-                "HTTP POST failed | url={url} error={error}",
+        async with (
+            self._rate_limited(url) as ticket,
+            session.post(
+                url,
+                data=data,
+                timeout=self._client_timeout,
+                **self._request_options(),
+            ) as response,
+        ):
+            if ticket is not None:
+                ticket.observe(response.status, response.headers)
+            await self._raise_for_challenge(url, response)
+            response.raise_for_status()
+            duration_ms = (time.perf_counter() - start) * 1000
+            logger.debug(
+                "HTTP POST response | url={url} status_code={status_code} duration_ms={duration_ms}",
                 url=url,
-                error=str(e),
+                status_code=response.status,
+                duration_ms=round(duration_ms, 2),
             )
-            raise ConnectionError(f"HTTP request failed: {e}")
+            return await response.text()
+
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+        retry: Optional[bool] = None,
+    ) -> HtmlBody:
+        """Replay a request with a raw body, bypassing cache and coalescing.
+
+        GET and HEAD are retried; other methods only with ``retry=True``.
+        """
+        url = self.build_url(endpoint)
+        return await self._send(
+            method,
+            url,
+            lambda: self._request_once(method, url, data, headers),
+            retry=retry,
+        )
+
+    async def _request_once(
+        self,
+        method: str,
+        url: str,
+        data: Optional[str],
+        headers: Optional[Dict[str, str]],
+    ) -> HtmlBody:
+        """Perform a single attempt of a replayed request."""
+        session = await self._get_session()
+        logger.debug(
+            "HTTP {method} request | url={url} data={data}",
+            method=method,
+            url=url,
+            data=data,
+        )
+
+        start = time.perf_counter()
+        async with (
+            self._rate_limited(url) as ticket,
+            session.request(
+                method,
+                url,
+                data=data,
+                timeout=self._client_timeout,
+                **self._request_options(headers),
+            ) as response,
+        ):
+            if ticket is not None:
+                ticket.observe(response.status, response.headers)
+            await self._raise_for_challenge(url, response)
+            response.raise_for_status()
+            duration_ms = (time.perf_counter() - start) * 1000
+            logger.debug(
+                "HTTP {method} response | url={url} status_code={status_code} duration_ms={duration_ms}",
+                method=method,
+                url=url,
+                status_code=response.status,
+                duration_ms=round(duration_ms, 2),
+            )
+            return HtmlBody(await response.read(), response.get_encoding())
 
     async def close(self) -> None:
-        """Close aiohttp session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """Release the shared session back to the registry."""
+        async with self._session_lock:
+            session, self._session = self._session, None
+            registry, self._session_registry = self._session_registry, None
+        if session is not None and registry is not None:
+            await registry.release(self._host, session)
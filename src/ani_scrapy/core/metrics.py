@@ -0,0 +1,88 @@
+"""Per-step latency recording for browser flows."""
+
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Optional
+
+from ani_scrapy.core.log import logger
+
+
+@dataclass
+class LatencyStats:
+    """Latency of one step; times are in seconds."""
+
+    count: int
+    failures: int
+    last: float
+    total: float
+    max: float
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class LatencyRecorder:
+    """Record how long named steps take."""
+
+    def __init__(self):
+        self._steps: Dict[str, LatencyStats] = {}
+
+    def record(self, step: str, seconds: float, failed: bool = False) -> None:
+        """Add one measurement of step."""
+        stats = self._steps.get(step)
+        if stats is None:
+            stats = self._steps[step] = LatencyStats(0, 0, 0.0, 0.0, 0.0)
+        stats.count += 1
+        stats.failures += failed
+        stats.last = seconds
+        stats.total += seconds
+        stats.max = max(stats.max, seconds)
+
+    @asynccontextmanager
+    async def measure(self, step: str) -> AsyncIterator[None]:
+        """Time the block as one run of step; errors count as failures."""
+        start = time.perf_counter()
+        failed = False
+        try:
+            yield
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            self.record(step, elapsed, failed)
+            logger.debug(
+                "Step finished | step={step} ms={ms} failed={failed}",
+                step=step,
+                ms=round(elapsed * 1000, 2),
+                failed=failed,
+            )
+
+    def stats(self) -> Dict[str, LatencyStats]:
+        """Snapshot for metrics."""
+        return {
+            step: LatencyStats(s.count, s.failures, s.last, s.total, s.max)
+            for step, s in self._steps.items()
+        }
+
+    def reset(self) -> None:
+        """Forget every measurement."""
+        self._steps.clear()
+
+
+_default_recorder: Optional[LatencyRecorder] = None
+
+
+def get_latency_recorder() -> LatencyRecorder:
+    """Get the process-wide latency recorder."""
+    global _default_recorder
+    if _default_recorder is None:
+        _default_recorder = LatencyRecorder()
+    return _default_recorder
+
+
+def measure(step: str):
+    """Time a block with the process-wide recorder."""
+    return get_latency_recorder().measure(step)
@@ -0,0 +1,250 @@
+"""Pool of reusable Playwright pages."""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable, Dict, Optional
+
+from playwright.async_api import Page
+
+from ani_scrapy.core.log import logger
+
+RESET_URL = "about:blank"
+
+
+@dataclass
+class PagePoolStats:
+    """Page pool counters; waits are in seconds."""
+
+    max_pages: int
+    size: int
+    idle: int
+    in_use: int
+    waiting: int
+    checkouts: int
+    checkins: int
+    created: int
+    reused: int
+    discarded: int
+    last_wait: float
+    total_wait: float
+
+
+def _emitter(page: Page):
+    """Event emitter behind a Playwright page wrapper."""
+    return getattr(page, "_impl_obj", page)
+
+
+def _listener_snapshot(page: Page) -> Dict[str, list]:
+    emitter = _emitter(page)
+    return {event: list(emitter.listeners(event)) for event in emitter.event_names()}
+
+
+class _PooledPage:
+    """A pooled page with the listeners it had when it was created."""
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.crashed = False
+        page.on("crash", self._on_crash)
+        self.listeners = _listener_snapshot(page)
+
+    def _on_crash(self, *_) -> None:
+        self.crashed = True
+
+    def drop_listeners(self) -> None:
+        """Remove every listener added since the page was created."""
+        emitter = _emitter(self.page)
+        for event in list(emitter.event_names()):
+            keep = self.listeners.get(event, [])
+            for listener in list(emitter.listeners(event)):
+                if listener not in keep:
+                    emitter.remove_listener(event, listener)
+
+    @property
+    def healthy(self) -> bool:
+        return not self.crashed and not self.page.is_closed()
+
+
+class PagePool:
+    """Pool of at most ``max_pages`` reusable pages.
+
+    Checked-in pages are reset (listeners and routes added by the caller
+    are dropped and the page navigates to ``about:blank``) and kept for
+    the next checkout, so creating and closing tabs stays off the hot
+    path. Idle pages are health checked before being handed out; broken
+    ones are closed and replaced.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Awaitable[Page]],
+        max_pages: int = 4,
+        reset_timeout: float = 5.0,
+        health_timeout: float = 2.0,
+    ):
+        self.factory = factory
+        self.max_pages = max_pages
+        self.reset_timeout = reset_timeout
+        self.health_timeout = health_timeout
+        self._slots = asyncio.Semaphore(max_pages)
+        self._idle: deque[_PooledPage] = deque()
+        self._in_use: Dict[int, _PooledPage] = {}
+        self._waiting = 0
+        self._checkouts = 0
+        self._checkins = 0
+        self._created = 0
+        self._reused = 0
+        self._discarded = 0
+        self._last_wait = 0.0
+        self._total_wait = 0.0
+        self._closed = False
+        self._orphans: set[asyncio.Future] = set()
+
+    def stats(self) -> PagePoolStats:
+        """Snapshot for metrics."""
+        return PagePoolStats(
+            max_pages=self.max_pages,
+            size=len(self._idle) + len(self._in_use),
+            idle=len(self._idle),
+            in_use=len(self._in_use),
+            waiting=self._waiting,
+            checkouts=self._checkouts,
+            checkins=self._checkins,
+            created=self._created,
+            reused=self._reused,
+            discarded=self._discarded,
+            last_wait=round(self._last_wait, 6),
+            total_wait=round(self._total_wait, 6),
+        )
+
+    async def _is_alive(self, pooled: _PooledPage) -> bool:
+        if not pooled.healthy:
+            return False
+        try:
+            await asyncio.wait_for(
+                pooled.page.evaluate("1"), timeout=self.health_timeout
+            )
+            return True
+        except Exception:
+            return False
+
+    async def _discard(self, pooled: _PooledPage) -> None:
+        self._discarded += 1
+        try:
+            if not pooled.page.is_closed():
+                await pooled.page.close()
+        except Exception as e:
+            logger.debug("Closing pooled page failed | error={error}", error=str(e))
+
+    async def _create(self) -> _PooledPage:
+        """Open a new page; one finishing after a cancellation is closed."""
+        creating = asyncio.ensure_future(self.factory())
+        try:
+            page = await asyncio.shield(creating)
+        except asyncio.CancelledError:
+            orphan = asyncio.ensure_future(self._close_orphan(creating))
+            self._orphans.add(orphan)
+            orphan.add_done_callback(self._orphans.discard)
+            raise
+        self._created += 1
+        return _PooledPage(page)
+
+    async def _close_orphan(self, creating: asyncio.Future) -> None:
+        """Close the page of a creation its caller stopped waiting for."""
+        try:
+            page = await creating
+        except BaseException:
+            return
+        self._created += 1
+        await self._discard(_PooledPage(page))
+
+    async def acquire(self, timeout: Optional[float] = None) -> Page:
+        """Check out a page, waiting while all of them are in use.
+
+        ``timeout`` (seconds) bounds only the wait for a free slot, raising
+        ``asyncio.TimeoutError``; opening a new page is never cut short.
+        """
+        if self._closed:
+            raise RuntimeError("Page pool is closed")
+
+        start = time.monotonic()
+        self._waiting += 1
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout)
+        finally:
+            self._waiting -= 1
+
+        pooled = None
+        candidate = None
+        try:
+            while self._idle:
+                candidate = self._idle.popleft()
+                if await self._is_alive(candidate):
+                    pooled, candidate = candidate, None
+                    self._reused += 1
+                    break
+                logger.debug("Discarding unhealthy pooled page")
+                unhealthy, candidate = candidate, None
+                await self._discard(unhealthy)
+
+            if pooled is None:
+                pooled = await self._create()
+        except BaseException:
+            if candidate is not None:
+                # Interrupted mid health check: keep the page for the next caller.
+                self._idle.appendleft(candidate)
+            self._slots.release()
+            raise
+
+        waited = time.monotonic() - start
+        self._last_wait = waited
+        self._total_wait += waited
+        self._checkouts += 1
+        self._in_use[id(pooled.page)] = pooled
+        return pooled.page
+
+    async def release(self, page: Page, discard: bool = False) -> None:
+        """Check a page back in, resetting it for the next caller."""
+        pooled = self._in_use.pop(id(page), None)
+        if pooled is None:
+            return
+        self._checkins += 1
+        try:
+            if discard or self._closed or not await self._reset(pooled):
+                await self._discard(pooled)
+            else:
+                self._idle.append(pooled)
+        finally:
+            self._slots.release()
+
+    async def _reset(self, pooled: _PooledPage) -> bool:
+        """Bring a page back to a blank state; False if it is unusable."""
+        if not pooled.healthy:
+            return False
+        page = pooled.page
+        try:
+            pooled.drop_listeners()
+            await page.unroute_all(behavior="ignoreErrors")
+            await page.goto(RESET_URL, timeout=self.reset_timeout * 1000)
+            return True
+        except Exception as e:
+            logger.debug("Resetting pooled page failed | error={error}", error=str(e))
+            return False
+
+    @asynccontextmanager
+    async def page(self, timeout: Optional[float] = None) -> AsyncIterator[Page]:
+        """Check out a page for the duration of the block."""
+        page = await self.acquire(timeout)
+        try:
+            yield page
+        finally:
+            await self.release(page)
+
+    async def close(self) -> None:
+        """Close idle pages; pages still in use are closed on check-in."""
+        self._closed = True
+        while self._idle:
+            await self._discard(self._idle.popleft())
@@ -0,0 +1,266 @@
+"""Adaptive per-host rate limiting."""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping, Optional
+
+from ani_scrapy.core.constants.general import (
+    HTTP_RATE_LIMIT,
+    HTTP_RATE_BURST,
+    HTTP_INITIAL_CONCURRENCY,
+    HTTP_MIN_CONCURRENCY,
+    HTTP_MAX_CONCURRENCY,
+)
+from ani_scrapy.core.log import logger
+
+THROTTLE_STATUSES = frozenset({429, 503})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max((date - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+@dataclass
+class LimiterStats:
+    """Snapshot of a limiter state."""
+
+    limit: float
+    in_flight: int
+    queue_depth: int
+    tokens: float
+    last_wait: float
+    total_wait: float
+    acquired: int
+    throttled: int
+
+
+@dataclass
+class RateLimitTicket:
+    """Outcome of one request made under a limiter slot."""
+
+    started: float
+    throttled: bool = False
+    retry_after: Optional[float] = None
+
+    def observe(self, status: int, headers: Optional[Mapping[str, str]] = None):
+        """Record a response status, honouring Retry-After on throttling."""
+        if status in THROTTLE_STATUSES:
+            self.throttled = True
+            if headers is not None:
+                self.retry_after = parse_retry_after(headers.get("Retry-After"))
+
+
+class AdaptiveRateLimiter:
+    """Token bucket combined with AIMD concurrency control.
+
+    Every request takes a token (refilled at ``rate`` per second up to
+    ``burst``) and a concurrency slot. The concurrency limit grows by
+    roughly one slot per window of successful requests and halves when a
+    request is throttled (429/503 or timeout). A ``Retry-After`` answer
+    pauses the host for the requested time.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = HTTP_RATE_LIMIT,
+        burst: int = HTTP_RATE_BURST,
+        initial_limit: int = HTTP_INITIAL_CONCURRENCY,
+        min_limit: int = HTTP_MIN_CONCURRENCY,
+        max_limit: int = HTTP_MAX_CONCURRENCY,
+        backoff: float = 0.5,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._last_decrease = 0.0
+        self._in_flight = 0
+        self._queue_depth = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._last_wait = 0.0
+        self._total_wait = 0.0
+        self._acquired = 0
+        self._throttled = 0
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of callers waiting for a slot."""
+        return self._queue_depth
+
+    def stats(self) -> LimiterStats:
+        """Snapshot for metrics."""
+        self._refill(time.monotonic())
+        return LimiterStats(
+            limit=round(self._limit, 2),
+            in_flight=self._in_flight,
+            queue_depth=self._queue_depth,
+            tokens=round(self._tokens, 2),
+            last_wait=self._last_wait,
+            total_wait=self._total_wait,
+            acquired=self._acquired,
+            throttled=self._throttled,
+        )
+
+    def _refill(self, now: float) -> None:
+        if self.rate is None:
+            self._tokens = float(self.burst)
+            return
+        elapsed = now - self._refilled_at
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+        self._refilled_at = now
+
+    async def acquire(self) -> RateLimitTicket:
+        """Wait for a token and a concurrency slot."""
+        loop = asyncio.get_running_loop()
+        start = time.monotonic()
+        self._queue_depth += 1
+        try:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+
+                if self._in_flight >= self.limit:
+                    waiter = loop.create_future()
+                    self._waiters.append(waiter)
+                    try:
+                        await waiter
+                    except asyncio.CancelledError:
+                        if waiter in self._waiters:
+                            self._waiters.remove(waiter)
+                        elif waiter.done() and not waiter.cancelled():
+                            # Pass the wake-up on to the next waiter.
+                            self._wake()
+                        raise
+                    continue
+
+                self._refill(now)
+                if self._tokens < 1:
+                    await asyncio.sleep((1 - self._tokens) / self.rate)
+                    continue
+
+                self._tokens -= 1
+                self._in_flight += 1
+                break
+        finally:
+            self._queue_depth -= 1
+
+        waited = time.monotonic() - start
+        self._last_wait = waited
+        self._total_wait += waited
+        self._acquired += 1
+        return RateLimitTicket(started=time.monotonic())
+
+    def release(self, ticket: RateLimitTicket) -> None:
+        """Free the slot and adapt the limit to the request outcome."""
+        self._in_flight -= 1
+
+        if ticket.throttled:
+            self._throttled += 1
+            now = time.monotonic()
+            if ticket.retry_after:
+                self._blocked_until = max(self._blocked_until, now + ticket.retry_after)
+            # Only requests started after the last decrease may shrink the
+            # window again, so a burst of failures halves it once.
+            if ticket.started >= self._last_decrease:
+                self._limit = max(float(self.min_limit), self._limit * self.backoff)
+                self._last_decrease = now
+                logger.debug(
+                    "Rate limit decreased | limit={limit} retry_after={retry_after}",
+                    limit=self.limit,
+                    retry_after=ticket.retry_after,
+                )
+        else:
+            self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+
+        self._wake()
+
+    def _wake(self) -> None:
+        """Wake as many waiters as there are free slots."""
+        free = self.limit - self._in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+
+class RateLimiterRegistry:
+    """Process-wide set of limiters, one per host."""
+
+    def __init__(self, **defaults) -> None:
+        self.defaults = defaults
+        self._overrides: Dict[str, dict] = {}
+        self._limiters: Dict[str, AdaptiveRateLimiter] = {}
+
+    def configure(self, host: str, **options) -> AdaptiveRateLimiter:
+        """Set limiter options for a single host."""
+        self._overrides[host] = options
+        self._limiters[host] = AdaptiveRateLimiter(**{**self.defaults, **options})
+        return self._limiters[host]
+
+    def get(self, host: str) -> AdaptiveRateLimiter:
+        """Get the limiter for host, creating it if needed."""
+        limiter = self._limiters.get(host)
+        if limiter is None:
+            options = {**self.defaults, **self._overrides.get(host, {})}
+            limiter = AdaptiveRateLimiter(**options)
+            self._limiters[host] = limiter
+        return limiter
+
+    def stats(self) -> Dict[str, LimiterStats]:
+        """Snapshot of every limiter keyed by host."""
+        return {host: limiter.stats() for host, limiter in self._limiters.items()}
+
+
+_default_limiters: Optional[RateLimiterRegistry] = None
+
+
+def get_rate_limiters() -> RateLimiterRegistry:
+    """Get the process-wide limiter registry."""
+    global _default_limiters
+    if _default_limiters is None:
+        _default_limiters = RateLimiterRegistry()
+    return _default_limiters
+
+
+def configure_rate_limiters(**defaults) -> RateLimiterRegistry:
+    """Replace the process-wide limiter registry with new defaults.
+
+    Accepts the ``AdaptiveRateLimiter`` arguments: ``rate``, ``burst``,
+    ``initial_limit``, ``min_limit``, ``max_limit`` and ``backoff``.
+    """
+    global _default_limiters
+    _default_limiters = RateLimiterRegistry(**defaults)
+    return _default_limiters
@@ -0,0 +1,28 @@
+"""Resolvers turning hoster pages into file URLs, with browser fallbacks."""
+
+from ani_scrapy.core.resolvers.base import HosterResolver
+from ani_scrapy.core.resolvers.browser import BrowserFlow, default_browser_flows
+from ani_scrapy.core.resolvers.mediafire import MediafireResolver
+from ani_scrapy.core.resolvers.pixeldrain import PixelDrainResolver
+from ani_scrapy.core.resolvers.registry import (
+    ResolverRegistry,
+    ResolverStats,
+    configure_resolver_registry,
+    get_resolver_registry,
+)
+from ani_scrapy.core.resolvers.streamwish import StreamwishResolver
+from ani_scrapy.core.resolvers.yourupload import YourUploadResolver
+
+__all__ = [
+    "BrowserFlow",
+    "HosterResolver",
+    "MediafireResolver",
+    "PixelDrainResolver",
+    "ResolverRegistry",
+    "ResolverStats",
+    "StreamwishResolver",
+    "YourUploadResolver",
+    "configure_resolver_registry",
+    "default_browser_flows",
+    "get_resolver_registry",
+]
@@ -0,0 +1,30 @@
+"""Base class for hoster link resolvers."""
+
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+
+from ani_scrapy.core.http import AsyncHttpAdapter
+
+
+class HosterResolver(ABC):
+    """Turn a hoster page URL into a direct file URL without a browser.
+
+    Resolvers only talk HTTP; the adapter is created for ``base_url`` when
+    none is given, but any absolute URL can be requested through it.
+    """
+
+    name: str = ""
+    # Other server names providers use for the same hoster.
+    aliases: Tuple[str, ...] = ()
+    base_url: str = ""
+
+    def __init__(self, http: Optional[AsyncHttpAdapter] = None):
+        self.http = http or AsyncHttpAdapter(base_url=self.base_url)
+
+    @abstractmethod
+    async def resolve(self, url: str) -> Optional[str]:
+        """Direct file URL behind url, or None if it cannot be resolved."""
+
+    async def aclose(self) -> None:
+        """Release the HTTP session."""
+        await self.http.close()
@@ -0,0 +1,182 @@
+"""Browser flows of the hosters, used when no HTTP resolver finds a link.
+
+Every flow receives a pooled page of the calling provider and the hoster
+URL, and returns the direct file URL or None.
+"""
+
+import functools
+from typing import Awaitable, Callable, Dict, Optional
+
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from ani_scrapy.core.capture import UrlCapture, first_result, is_main_frame_media
+from ani_scrapy.core.constants.general import (
+    MEDIAFIRE_TIMEOUT,
+    SW_DOWNLOADS_DISABLED,
+    SW_ERROR_SELECTOR,
+    SW_LINK_SELECTOR,
+    SW_QUALITY_SUFFIXES,
+    SW_TIMEOUT,
+    YOURUPLOAD_TIMEOUT,
+)
+from ani_scrapy.core.exceptions import ScraperBlockedError
+from ani_scrapy.core.log import logger
+from ani_scrapy.core.metrics import measure
+from ani_scrapy.core.retry import DEFAULT_BROWSER_RETRY, RetryableError
+
+BrowserFlow = Callable[[Page, str], Awaitable[Optional[str]]]
+
+
+async def streamwish_file_link(page: Page, url: str) -> Optional[str]:
+    """Submit the download form of every SW quality variant in turn.
+
+    ``url`` is the download page of a video (``.../f/<id>``); the id is
+    read after redirects. "Downloads disabled" answers are retried, other
+    refusals fail their variant only, as in ``StreamwishResolver``.
+    """
+    logger.debug("Getting Streamwish file link in the browser")
+
+    await page.goto(url)
+    base = url.split("?")[0].rstrip("/").rsplit("/", 1)[0]
+    video_id = page.url.split("?")[0].rstrip("/").split("/")[-1]
+
+    for suffix in SW_QUALITY_SUFFIXES:
+        variant_url = f"{base}/{video_id}{suffix}"
+        try:
+            async with measure("browser.streamwish_variant"):
+                return await DEFAULT_BROWSER_RETRY.run(
+                    functools.partial(_streamwish_variant, page, variant_url),
+                    name="streamwish_variant",
+                )
+        except (PlaywrightError, RetryableError) as e:
+            logger.debug(
+                "SW variant failed | url={url} error={error}",
+                url=variant_url,
+                error=str(e),
+            )
+        except ScraperBlockedError as e:
+            logger.warning(
+                "SW variant refused | url={url} error={error}",
+                url=variant_url,
+                error=str(e),
+            )
+    return None
+
+
+async def _streamwish_variant(page: Page, url: str) -> Optional[str]:
+    """Submit the SW download form of one quality variant."""
+    await page.goto(url)
+
+    download_button = await page.wait_for_selector("form#F1 button", timeout=3000)
+    await download_button.click()
+
+    # Whichever shows up first: the error label or the download link.
+    await page.wait_for_selector(
+        f"{SW_ERROR_SELECTOR}, {SW_LINK_SELECTOR}", timeout=SW_TIMEOUT
+    )
+    error_label = await page.query_selector(SW_ERROR_SELECTOR)
+    if error_label is not None:
+        text_label = (await error_label.inner_text()).strip()
+        if text_label == SW_DOWNLOADS_DISABLED:
+            raise RetryableError(text_label)
+        raise ScraperBlockedError(text_label)
+
+    download_link = await page.query_selector(SW_LINK_SELECTOR)
+    if download_link is None:
+        return None
+    return await download_link.get_attribute("href")
+
+
+async def yourupload_file_link(page: Page, url: str) -> Optional[str]:
+    """Video URL of a YourUpload embed, from its request or <video> tag."""
+    logger.debug("Getting YourUpload file link in the browser")
+
+    async def from_dom() -> Optional[str]:
+        video_element = await page.wait_for_selector(
+            "div.jw-media video.jw-video", timeout=YOURUPLOAD_TIMEOUT
+        )
+        return await video_element.get_attribute("src")
+
+    # The player requests the file before its <video> gets a src.
+    capture = UrlCapture(page, is_main_frame_media)
+    try:
+        await page.goto(url)
+        return await first_result(
+            capture.future, from_dom(), timeout=YOURUPLOAD_TIMEOUT / 1000
+        )
+    except PlaywrightError as e:
+        logger.debug("YourUpload link not found | error={error}", error=str(e))
+        return None
+    finally:
+        capture.dispose()
+
+
+async def mediafire_file_link(page: Page, url: str) -> Optional[str]:
+    """URL of the download the Mediafire button starts."""
+    logger.debug("Getting Mediafire file link in the browser")
+
+    await page.goto(url)
+    try:
+        download_button = await page.wait_for_selector(
+            "a#downloadButton", timeout=MEDIAFIRE_TIMEOUT
+        )
+    except PlaywrightTimeoutError:
+        return None
+
+    async with page.expect_download() as download_info:
+        await download_button.click()
+
+    download = await download_info.value
+    real_url = download.url
+    await download.cancel()
+    return real_url
+
+
+async def upnshare_file_link(page: Page, url: str) -> Optional[str]:
+    """Download anchor UPNShare builds once its download button is clicked."""
+    logger.debug("Getting UPNShare file link in the browser")
+
+    dl_url = url + "&dl=1"
+    try:
+        await page.goto(dl_url, wait_until="domcontentloaded")
+
+        button = await page.wait_for_selector("button.downloader-button", timeout=10000)
+
+        await page.evaluate(
+            """() => {
+                const overlay = document.querySelector('div[style*="z-index: 2147483647"]');
+                if (overlay) {
+                    overlay.remove();
+                }
+            }"""
+        )
+
+        if button:
+            await button.dispatch_event("click")
+
+            anchor = await page.wait_for_selector(
+                "a.downloader-button[href][download]", timeout=15000
+            )
+
+            if anchor is not None:
+                return await anchor.get_attribute("href")
+
+    except PlaywrightError as e:
+        logger.warning(
+            "Failed to get UPNShare download link | error={error}",
+            error=str(e),
+        )
+
+    return None
+
+
+def default_browser_flows() -> Dict[str, BrowserFlow]:
+    """Browser flow of every hoster the providers link to."""
+    return {
+        "Streamwish": streamwish_file_link,
+        "YourUpload": yourupload_file_link,
+        "Mediafire": mediafire_file_link,
+        "UPNShare": upnshare_file_link,
+    }
@@ -0,0 +1,55 @@
+"""Mediafire file page resolver."""
+
+import base64
+import binascii
+from typing import Optional
+
+from lxml.cssselect import CSSSelector
+
+from ani_scrapy.core.exceptions import ScraperBlockedError
+from ani_scrapy.core.html import Markup, first, parse_html
+from ani_scrapy.core.log import logger
+from ani_scrapy.core.metrics import measure
+from ani_scrapy.core.resolvers.base import HosterResolver
+
+_DOWNLOAD_BUTTON = CSSSelector("a#downloadButton")
+
+
+def parse_download_url(html: Markup) -> Optional[str]:
+    """Direct URL behind the download button of a file page."""
+    button = first(_DOWNLOAD_BUTTON(parse_html(html)))
+    if button is None:
+        return None
+    href = str(button.get("href", ""))
+    if href.startswith("http"):
+        return href
+    # Some pages only carry the link base64-encoded for their script.
+    scrambled = button.get("data-scrambled-url")
+    if scrambled:
+        try:
+            return base64.b64decode(scrambled).decode()
+        except (binascii.Error, UnicodeDecodeError):
+            return None
+    return None
+
+
+class MediafireResolver(HosterResolver):
+    """Read the download URL from the static markup of a Mediafire page."""
+
+    name = "Mediafire"
+    base_url = "https://www.mediafire.com"
+
+    async def resolve(self, url: str) -> Optional[str]:
+        try:
+            async with measure("resolver.mediafire"):
+                link = parse_download_url(await self.http.get_bytes(url))
+        except (ConnectionError, ScraperBlockedError) as e:
+            logger.warning(
+                "Mediafire page failed | url={url} error={error}",
+                url=url,
+                error=str(e),
+            )
+            return None
+        if link is None:
+            logger.warning("Mediafire download button not found | url={url}", url=url)
+        return link
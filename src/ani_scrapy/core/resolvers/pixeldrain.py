@@ -0,0 +1,19 @@
+"""PixelDrain resolver."""
+
+from typing import Optional
+
+from ani_scrapy.core.resolvers.base import HosterResolver
+
+
+class PixelDrainResolver(HosterResolver):
+    """Build the download API URL of a PixelDrain file; no request needed."""
+
+    name = "PixelDrain"
+    aliases = ("PDrain",)
+    base_url = "https://pixeldrain.com"
+
+    async def resolve(self, url: str) -> Optional[str]:
+        file_id = url.split("/")[-1].split("?")[0]
+        if not file_id:
+            return None
+        return f"{self.base_url}/api/file/{file_id}?download"
@@ -0,0 +1,308 @@
+"""Process-wide registry of hoster resolvers with a resolved-link cache."""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, Iterable, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from ani_scrapy.core.constants.general import (
+    RESOLVER_CACHE_TTL,
+    RESOLVER_EXPIRY_MARGIN,
+    RESOLVER_MAX_CONCURRENCY,
+)
+from ani_scrapy.core.log import logger
+from ani_scrapy.core.resolvers.base import HosterResolver
+from ani_scrapy.core.resolvers.browser import BrowserFlow, default_browser_flows
+from ani_scrapy.core.resolvers.mediafire import MediafireResolver
+from ani_scrapy.core.resolvers.pixeldrain import PixelDrainResolver
+from ani_scrapy.core.resolvers.streamwish import StreamwishResolver
+from ani_scrapy.core.resolvers.yourupload import YourUploadResolver
+from ani_scrapy.core.singleflight import SingleFlight
+
+Fallback = Callable[[], Awaitable[Optional[str]]]
+
+# Query parameters signed hoster URLs carry their expiry time in.
+EXPIRY_PARAMS = ("expires", "expire", "exp", "e")
+# Values below this are lifetimes in seconds, not Unix timestamps.
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+def signed_url_expiry(url: str) -> Optional[float]:
+    """Unix time a signed URL stops working, if its query says so."""
+    params = {k.lower(): v for k, v in parse_qsl(urlsplit(url).query)}
+
+    if "x-amz-date" in params and "x-amz-expires" in params:
+        try:
+            signed = datetime.strptime(params["x-amz-date"], "%Y%m%dT%H%M%SZ")
+            lifetime = int(params["x-amz-expires"])
+        except ValueError:
+            return None
+        return signed.replace(tzinfo=timezone.utc).timestamp() + lifetime
+
+    for name in EXPIRY_PARAMS:
+        value = params.get(name)
+        if value is None or not value.isdigit():
+            continue
+        seconds = int(value)
+        if seconds >= _EPOCH_THRESHOLD:
+            return float(seconds)
+        return time.time() + seconds
+    return None
+
+
+def hoster_key(hoster: str) -> str:
+    """Registry key of a hoster or server name."""
+    return hoster.strip().lower()
+
+
+@dataclass
+class ResolverStats:
+    """Resolution counters of one hoster; times are in seconds."""
+
+    successes: int = 0
+    failures: int = 0
+    cache_hits: int = 0
+    fallbacks: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+    @property
+    def mean_time(self) -> float:
+        runs = self.successes + self.failures
+        return self.total_time / runs if runs else 0.0
+
+
+class ResolverRegistry:
+    """Resolvers and browser flows keyed by hoster, shared by every scraper.
+
+    Resolved links are cached for ``ttl`` seconds, or until
+    ``expiry_margin`` seconds before the expiry a signed link carries in
+    its query, whichever comes first. Links found with the HTTP resolvers
+    allowed and without them are cached apart, so a browser-only caller
+    never gets a resolver's answer. At most ``max_concurrency``
+    resolutions run per hoster, identical ones in flight are joined, and
+    each hoster keeps ``ResolverStats``. Scrapers ``attach`` on creation
+    and ``detach`` on close; resolver sessions are released when the last
+    one detaches.
+    """
+
+    def __init__(
+        self,
+        resolvers: Optional[Iterable[HosterResolver]] = None,
+        browser_flows: Optional[Dict[str, BrowserFlow]] = None,
+        ttl: float = RESOLVER_CACHE_TTL,
+        expiry_margin: float = RESOLVER_EXPIRY_MARGIN,
+        max_concurrency: int = RESOLVER_MAX_CONCURRENCY,
+    ):
+        self.ttl = ttl
+        self.expiry_margin = expiry_margin
+        self.max_concurrency = max_concurrency
+        self._resolvers: Dict[str, HosterResolver] = {}
+        self._browser_flows: Dict[str, BrowserFlow] = {}
+        self._limits: Dict[str, int] = {}
+        # Semaphores bind to a loop; each key keeps the one of the last loop.
+        self._semaphores: Dict[
+            str, Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]
+        ] = {}
+        self._stats: Dict[str, ResolverStats] = {}
+        self._cache: Dict[Tuple[str, str, bool], Tuple[str, float]] = {}
+        self._flight = SingleFlight()
+        self._users = 0
+        for resolver in resolvers or ():
+            self.register(resolver)
+        for hoster, flow in (browser_flows or {}).items():
+            self.register_browser_flow(hoster, flow)
+
+    def register(
+        self, resolver: HosterResolver, max_concurrency: Optional[int] = None
+    ) -> None:
+        """Serve resolver's hoster and aliases, optionally with its own cap."""
+        for name in (resolver.name, *resolver.aliases):
+            key = hoster_key(name)
+            self._resolvers[key] = resolver
+            if max_concurrency is not None:
+                self._limits[key] = max_concurrency
+
+    def register_browser_flow(self, hoster: str, flow: BrowserFlow) -> None:
+        """Use flow when hoster has no resolver or it finds nothing."""
+        self._browser_flows[self._key(hoster)] = flow
+
+    def get(self, hoster: str) -> Optional[HosterResolver]:
+        """Resolver registered for hoster."""
+        return self._resolvers.get(hoster_key(hoster))
+
+    def supports(self, hoster: str) -> bool:
+        """Whether hoster resolves without a browser."""
+        return hoster_key(hoster) in self._resolvers
+
+    def browser_flow(self, hoster: str) -> Optional[BrowserFlow]:
+        """Browser flow registered for hoster."""
+        return self._browser_flows.get(self._key(hoster))
+
+    def handles(self, hoster: str) -> bool:
+        """Whether hoster has a resolver or a browser flow."""
+        return self.supports(hoster) or self.browser_flow(hoster) is not None
+
+    def _key(self, hoster: str) -> str:
+        """Stats and cache key: the resolver's own name, when registered."""
+        resolver = self.get(hoster)
+        return hoster_key(resolver.name if resolver else hoster)
+
+    def _semaphore(self, key: str) -> asyncio.Semaphore:
+        """Concurrency cap of key for the running loop."""
+        loop = asyncio.get_running_loop()
+        entry = self._semaphores.get(key)
+        if entry is None or entry[0] is not loop:
+            limit = self._limits.get(key, self.max_concurrency)
+            entry = self._semaphores[key] = (loop, asyncio.Semaphore(limit))
+        return entry[1]
+
+    def _stats_for(self, key: str) -> ResolverStats:
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = ResolverStats()
+        return stats
+
+    async def resolve(
+        self,
+        hoster: str,
+        url: str,
+        fallback: Optional[Fallback] = None,
+        use_resolver: bool = True,
+    ) -> Optional[str]:
+        """File link behind url, from the cache, the resolver or fallback.
+
+        ``fallback`` (usually a browser flow) runs when the hoster has no
+        resolver, the resolver finds nothing or ``use_resolver`` is off.
+        """
+        key = self._key(hoster)
+        cache_key = (key, url, use_resolver)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            link, expires_at = cached
+            if expires_at > time.time():
+                self._stats_for(key).cache_hits += 1
+                logger.debug("Resolved link cache hit | hoster={hoster}", hoster=key)
+                return link
+            del self._cache[cache_key]
+
+        return await self._flight.do(
+            cache_key, lambda: self._resolve(key, url, fallback, use_resolver)
+        )
+
+    async def _resolve(
+        self,
+        key: str,
+        url: str,
+        fallback: Optional[Fallback],
+        use_resolver: bool,
+    ) -> Optional[str]:
+        stats = self._stats_for(key)
+        resolver = self._resolvers.get(key) if use_resolver else None
+        link = None
+        async with self._semaphore(key):
+            start = time.perf_counter()
+            try:
+                if resolver is not None:
+                    link = await resolver.resolve(url)
+                    if link is None and fallback is not None:
+                        logger.warning(
+                            "Resolver found no link, using fallback | hoster={hoster}",
+                            hoster=key,
+                        )
+                if link is None and fallback is not None:
+                    stats.fallbacks += 1
+                    link = await fallback()
+            finally:
+                elapsed = time.perf_counter() - start
+                stats.total_time += elapsed
+                stats.max_time = max(stats.max_time, elapsed)
+                if link is None:
+                    stats.failures += 1
+                else:
+                    stats.successes += 1
+
+        if link is not None:
+            self._store((key, url, use_resolver), link)
+        return link
+
+    def _store(self, cache_key: Tuple[str, str, bool], link: str) -> None:
+        """Cache link until the TTL or just before its signed expiry."""
+        now = time.time()
+        expires_at = now + self.ttl
+        signed = signed_url_expiry(link)
+        if signed is not None:
+            expires_at = min(expires_at, signed - self.expiry_margin)
+        if expires_at > now:
+            self._cache[cache_key] = (link, expires_at)
+
+    def clear_cache(self) -> None:
+        """Forget every resolved link."""
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, ResolverStats]:
+        """Snapshot for metrics, per hoster."""
+        return {
+            key: ResolverStats(
+                s.successes,
+                s.failures,
+                s.cache_hits,
+                s.fallbacks,
+                s.total_time,
+                s.max_time,
+            )
+            for key, s in self._stats.items()
+        }
+
+    def attach(self) -> None:
+        """Register a scraper using the registry."""
+        self._users += 1
+
+    async def detach(self) -> None:
+        """Unregister a scraper; the last one out releases the sessions."""
+        self._users = max(self._users - 1, 0)
+        if self._users == 0:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        """Release every resolver's HTTP session; they reopen on next use."""
+        for resolver in set(self._resolvers.values()):
+            await resolver.aclose()
+
+
+def default_resolvers() -> list[HosterResolver]:
+    """A fresh instance of every built-in resolver."""
+    return [
+        StreamwishResolver(),
+        YourUploadResolver(),
+        MediafireResolver(),
+        PixelDrainResolver(),
+    ]
+
+
+_default_registry: Optional[ResolverRegistry] = None
+
+
+def get_resolver_registry() -> ResolverRegistry:
+    """Get the process-wide resolver registry."""
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = ResolverRegistry(
+            default_resolvers(), default_browser_flows()
+        )
+    return _default_registry
+
+
+def configure_resolver_registry(**options) -> ResolverRegistry:
+    """Replace the process-wide registry with the built-in resolvers and flows.
+
+    Accepts the ``ResolverRegistry`` options: ``ttl``, ``expiry_margin``
+    and ``max_concurrency``. Scrapers created before keep the old one.
+    """
+    global _default_registry
+    _default_registry = ResolverRegistry(
+        default_resolvers(), default_browser_flows(), **options
+    )
+    return _default_registry
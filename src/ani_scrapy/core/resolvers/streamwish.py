@@ -0,0 +1,114 @@
+"""Streamwish (SW) download form resolver."""
+
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlencode, urljoin
+
+from lxml.cssselect import CSSSelector
+
+from ani_scrapy.core.capture import first_result
+from ani_scrapy.core.constants.general import (
+    SW_DOWNLOADS_DISABLED,
+    SW_ERROR_SELECTOR,
+    SW_FORM_SELECTOR,
+    SW_LINK_SELECTOR,
+    SW_QUALITY_SUFFIXES,
+    SW_TIMEOUT,
+)
+from ani_scrapy.core.exceptions import ScraperBlockedError
+from ani_scrapy.core.html import Markup, first, parse_html, text_of
+from ani_scrapy.core.log import logger
+from ani_scrapy.core.metrics import measure
+from ani_scrapy.core.resolvers.base import HosterResolver
+
+_FORM = CSSSelector(SW_FORM_SELECTOR)
+_FIELDS = CSSSelector("input[name], button[name]")
+_ERROR = CSSSelector(SW_ERROR_SELECTOR)
+_LINK = CSSSelector(SW_LINK_SELECTOR)
+
+
+def parse_download_form(html: Markup) -> Optional[Tuple[str, str, Dict[str, str]]]:
+    """Method, action and fields of the download form, if the page has one."""
+    form = first(_FORM(parse_html(html)))
+    if form is None:
+        return None
+    fields = {field.get("name"): field.get("value", "") for field in _FIELDS(form)}
+    return form.get("method", "post").upper(), form.get("action", ""), fields
+
+
+def parse_download_result(html: Markup) -> Tuple[Optional[str], Optional[str]]:
+    """Download link and error label of the page the form leads to."""
+    root = parse_html(html)
+    error = first(_ERROR(root))
+    if error is not None:
+        return None, text_of(error)
+    link = first(_LINK(root))
+    return (str(link.get("href")) if link is not None else None), None
+
+
+class StreamwishResolver(HosterResolver):
+    """Submit the SW download form of every quality variant over HTTP.
+
+    ``url`` is the download page of a video (``.../f/<id>``); its ``_h``,
+    ``_n`` and ``_l`` variants are tried concurrently and the first link
+    wins. "Downloads disabled" answers fail their variant at once.
+    """
+
+    name = "Streamwish"
+    aliases = ("SW",)
+    base_url = "https://streamwish.to"
+
+    async def resolve(self, url: str) -> Optional[str]:
+        base = url.split("?")[0].rstrip("/")
+        async with measure("resolver.streamwish"):
+            link = await first_result(
+                *(
+                    self._try_variant(f"{base}{suffix}")
+                    for suffix in SW_QUALITY_SUFFIXES
+                ),
+                timeout=SW_TIMEOUT / 1000,
+            )
+        if link is None:
+            logger.warning("No SW variant gave a link | url={url}", url=url)
+        return link
+
+    async def _try_variant(self, url: str) -> Optional[str]:
+        """Download link of one quality variant, or None."""
+        try:
+            form = parse_download_form(await self.http.get_bytes(url))
+            if form is None:
+                logger.debug("SW variant has no download form | url={url}", url=url)
+                return None
+
+            method, action, fields = form
+            action_url = urljoin(url, action) if action else url
+            data = urlencode(fields)
+            if method == "GET":
+                body = await self.http.request(
+                    "GET", f"{action_url}?{data}", headers={"Referer": url}
+                )
+            else:
+                body = await self.http.request(
+                    "POST",
+                    action_url,
+                    data=data,
+                    headers={
+                        "Content-Type": "application/x-www-form-urlencoded",
+                        "Referer": url,
+                    },
+                )
+        except (ConnectionError, ScraperBlockedError) as e:
+            logger.debug(
+                "SW variant failed | url={url} error={error}", url=url, error=str(e)
+            )
+            return None
+
+        link, error = parse_download_result(body)
+        if error:
+            if error == SW_DOWNLOADS_DISABLED:
+                logger.debug("SW variant disabled | url={url}", url=url)
+            else:
+                logger.warning(
+                    "SW variant refused | url={url} error={error}", url=url, error=error
+                )
+            return None
+        return link
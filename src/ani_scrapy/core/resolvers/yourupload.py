@@ -0,0 +1,50 @@
+"""YourUpload embed page resolver."""
+
+import re
+from typing import Optional
+
+from lxml.cssselect import CSSSelector
+
+from ani_scrapy.core.exceptions import ScraperBlockedError
+from ani_scrapy.core.html import Markup, first, parse_html
+from ani_scrapy.core.log import logger
+from ani_scrapy.core.metrics import measure
+from ani_scrapy.core.resolvers.base import HosterResolver
+
+_OG_VIDEO = CSSSelector('meta[property="og:video"][content]')
+_PLAYER_FILE = re.compile(r"""file\s*:\s*["'](https?://[^"']+)["']""")
+
+
+def parse_video_url(html: Markup) -> Optional[str]:
+    """Video URL of an embed page: its og:video tag or the player setup."""
+    root = parse_html(html)
+    meta = first(_OG_VIDEO(root))
+    if meta is not None:
+        return str(meta.get("content"))
+    for script in root.iter("script"):
+        match = _PLAYER_FILE.search(script.text or "")
+        if match:
+            return match.group(1)
+    return None
+
+
+class YourUploadResolver(HosterResolver):
+    """Read the video URL from the static markup of a YourUpload embed."""
+
+    name = "YourUpload"
+    base_url = "https://www.yourupload.com"
+
+    async def resolve(self, url: str) -> Optional[str]:
+        try:
+            async with measure("resolver.yourupload"):
+                link = parse_video_url(await self.http.get_bytes(url))
+        except (ConnectionError, ScraperBlockedError) as e:
+            logger.warning(
+                "YourUpload page failed | url={url} error={error}",
+                url=url,
+                error=str(e),
+            )
+            return None
+        if link is None:
+            logger.warning("YourUpload video not found | url={url}", url=url)
+        return link
@@ -0,0 +1,258 @@
+"""Retry policy shared by the HTTP and browser paths."""
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional, TypeVar
+
+import aiohttp
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from ani_scrapy.core.log import logger
+
+T = TypeVar("T")
+
+RETRYABLE_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+class RetryableError(Exception):
+    """Raised by an operation to ask the policy for another attempt."""
+
+
+@dataclass
+class RetryBudgetStats:
+    """Retry budget counters."""
+
+    tokens: float
+    allowed: int
+    denied: int
+
+
+class RetryBudget:
+    """Budget capping retries to a fraction of the overall traffic.
+
+    Every operation deposits ``ratio`` tokens and every retry withdraws
+    one; ``min_per_second`` tokens are added over time so a quiet process
+    can still retry. When an upstream is down the budget runs dry and
+    operations fail fast instead of multiplying the load.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_per_second: float = 1.0,
+        max_tokens: float = 20.0,
+    ):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._updated = time.monotonic()
+        self._allowed = 0
+        self._denied = 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.max_tokens,
+            self._tokens + (now - self._updated) * self.min_per_second,
+        )
+        self._updated = now
+
+    def deposit(self) -> None:
+        """Record a new operation."""
+        self._refill()
+        self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        """Take a token for a retry, if one is available."""
+        self._refill()
+        if self._tokens >= 1:
+            self._tokens -= 1
+            self._allowed += 1
+            return True
+        self._denied += 1
+        return False
+
+    def stats(self) -> RetryBudgetStats:
+        self._refill()
+        return RetryBudgetStats(
+            tokens=round(self._tokens, 2),
+            allowed=self._allowed,
+            denied=self._denied,
+        )
+
+
+_default_budget: Optional[RetryBudget] = None
+
+
+def get_retry_budget() -> RetryBudget:
+    """Get the process-wide retry budget."""
+    global _default_budget
+    if _default_budget is None:
+        _default_budget = RetryBudget()
+    return _default_budget
+
+
+def configure_retry_budget(**options) -> RetryBudget:
+    """Replace the process-wide retry budget."""
+    global _default_budget
+    _default_budget = RetryBudget(**options)
+    return _default_budget
+
+
+class RetryState:
+    """Attempt tracking for one operation.
+
+    Used directly by loops that cannot be expressed as a single callable,
+    such as browser pagination::
+
+        retry = policy.start(max_retries=5)
+        while ...:
+            if failed and not await retry.backoff():
+                break
+    """
+
+    def __init__(
+        self,
+        policy: "RetryPolicy",
+        max_retries: int,
+        deadline: Optional[float],
+        name: str,
+    ):
+        self.policy = policy
+        self.max_retries = max_retries
+        self.name = name
+        self.retries = 0
+        self._delay = policy.base_delay
+        self._deadline_at = (
+            time.monotonic() + deadline if deadline is not None else None
+        )
+        if policy.budget is not None:
+            policy.budget.deposit()
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the deadline, or None without one."""
+        if self._deadline_at is None:
+            return None
+        return max(self._deadline_at - time.monotonic(), 0.0)
+
+    async def backoff(self, error: Optional[BaseException] = None) -> bool:
+        """Sleep before the next attempt; False when retrying is not allowed."""
+        if self.retries >= self.max_retries:
+            return False
+
+        self._delay = self.policy.next_delay(self._delay)
+        remaining = self.remaining()
+        if remaining is not None and remaining <= self._delay:
+            return False
+
+        budget = self.policy.budget
+        if budget is not None and not budget.try_withdraw():
+            logger.warning("Retry budget exhausted | op={op}", op=self.name)
+            return False
+
+        self.retries += 1
+        logger.debug(
+            "Retrying | op={op} retry={retry} delay={delay} error={error}",
+            op=self.name,
+            retry=self.retries,
+            delay=round(self._delay, 3),
+            error=str(error) if error else None,
+        )
+        await asyncio.sleep(self._delay)
+        return True
+
+
+class RetryPolicy:
+    """Retry policy with decorrelated-jitter backoff.
+
+    ``max_retries`` caps the attempts after the first one and ``deadline``
+    caps the total time in seconds spent on an operation. Retries draw
+    from the process-wide ``RetryBudget`` unless another ``budget`` is
+    given or ``shared_budget`` is False.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 2,
+        base_delay: float = 0.25,
+        max_delay: float = 10.0,
+        deadline: Optional[float] = None,
+        retry_statuses: frozenset[int] = RETRYABLE_STATUSES,
+        retry_on: tuple[type[BaseException], ...] = (),
+        budget: Optional[RetryBudget] = None,
+        shared_budget: bool = True,
+    ):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.retry_statuses = retry_statuses
+        self.retry_on = retry_on
+        self._budget = budget
+        self.shared_budget = shared_budget
+
+    @property
+    def budget(self) -> Optional[RetryBudget]:
+        if self._budget is not None:
+            return self._budget
+        return get_retry_budget() if self.shared_budget else None
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """Whether error is transient and worth another attempt."""
+        if isinstance(error, aiohttp.ClientResponseError):
+            return error.status in self.retry_statuses
+        return isinstance(
+            error,
+            (
+                RetryableError,
+                aiohttp.ClientConnectionError,
+                aiohttp.ClientPayloadError,
+                asyncio.TimeoutError,
+                PlaywrightTimeoutError,
+                *self.retry_on,
+            ),
+        )
+
+    def next_delay(self, previous: float) -> float:
+        """Decorrelated jitter: uniform between base and three times the last."""
+        upper = max(self.base_delay, previous * 3)
+        return min(self.max_delay, random.uniform(self.base_delay, upper))
+
+    def start(
+        self,
+        max_retries: Optional[int] = None,
+        deadline: Optional[float] = None,
+        name: str = "",
+    ) -> RetryState:
+        """Start tracking attempts for one operation."""
+        return RetryState(
+            self,
+            max_retries=self.max_retries if max_retries is None else max_retries,
+            deadline=self.deadline if deadline is None else deadline,
+            name=name,
+        )
+
+    async def run(
+        self,
+        fn: Callable[[], Awaitable[T]],
+        deadline: Optional[float] = None,
+        name: str = "",
+    ) -> T:
+        """Call fn until it succeeds, fails permanently or runs out of retries."""
+        state = self.start(deadline=deadline, name=name)
+        while True:
+            try:
+                remaining = state.remaining()
+                if remaining is None:
+                    return await fn()
+                return await asyncio.wait_for(fn(), timeout=remaining)
+            except Exception as e:
+                if not self.is_retryable(e) or not await state.backoff(e):
+                    raise
+
+
+DEFAULT_HTTP_RETRY = RetryPolicy(max_retries=2, base_delay=0.25, max_delay=5.0)
+DEFAULT_BROWSER_RETRY = RetryPolicy(max_retries=2, base_delay=0.5, max_delay=3.0)
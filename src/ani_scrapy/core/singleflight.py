@@ -0,0 +1,50 @@
+"""Single-flight coalescing of identical in-flight calls."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Run at most one call per key at a time.
+
+    The first caller for a key (the leader) starts the call; callers
+    arriving while it is in flight await the same result instead of
+    starting their own. The call runs in its own task, so cancelling the
+    leader does not cancel it for the followers.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Future] = {}
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run fn for key, or join the call already in flight."""
+        call = self._calls.get(key)
+        if call is None:
+            call = asyncio.ensure_future(fn())
+            self._calls[key] = call
+            call.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(call)
+
+    def _forget(self, key: Hashable, call: asyncio.Future) -> None:
+        """Drop a finished call so the next caller starts a fresh one."""
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        if not call.cancelled():
+            # Mark the exception as retrieved when every waiter went away.
+            call.exception()
+
+
+def request_key(method: str, url: str, params: Any = None) -> tuple:
+    """Build a hashable key from a request method, URL and params."""
+    if not params:
+        return (method.upper(), url, ())
+    items = params.items() if hasattr(params, "items") else params
+    return (method.upper(), url, tuple(sorted((str(k), str(v)) for k, v in items)))
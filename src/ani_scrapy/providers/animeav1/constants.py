@@ -1,5 +1,6 @@
 """AnimeAV1 constants."""
 
+from ani_scrapy.core.blocking import DEFAULT_BLOCK_RULES, BlockRules
 from ani_scrapy.core.schemas import _AnimeType, _RelatedType
 
 BASE_URL = "https://animeav1.com"
@@ -17,3 +18,10 @@ RELATED_TYPE_MAP = {
     1: _RelatedType.PREQUEL,
     2: _RelatedType.SEQUEL,
 }
+
+DATA_SCRIPT_MARKERS = ("__sveltekit_",)
+
+# The UPNShare flow only clicks through to a download anchor.
+BROWSER_BLOCK_RULES = DEFAULT_BLOCK_RULES.merge(
+    BlockRules(block_types=frozenset({"media"}))
+)
@@ -0,0 +1,244 @@
+"""Reader for the JavaScript literals SvelteKit embeds in AnimeAV1 pages.
+
+Page data is serialized with devalue as a JavaScript object literal
+(unquoted keys, ``void 0``, ``new Date(...)``) inside the bootstrap
+script, so it is not JSON. ``find_literal`` tokenizes the script once,
+left to right, and converts the value of the first ``key:`` property it
+meets into Python objects.
+"""
+
+import math
+import re
+from typing import Any, Iterator, Optional
+
+from ani_scrapy.core.exceptions import ScraperParseError
+
+_TOKEN = re.compile(
+    r"""
+    \s+
+    |(?P<str>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'|`(?:[^`\\]|\\.)*`)
+    |(?P<num>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?n?)
+    |(?P<name>[A-Za-z_$][\w$]*)
+    |(?P<punct>.)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+_ESCAPE = re.compile(r"\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|.)", re.S)
+_SIMPLE_ESCAPES = {
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+    "b": "\b",
+    "f": "\f",
+    "v": "\v",
+    "0": "\0",
+    "\n": "",
+}
+_CONSTANTS = {
+    "true": True,
+    "false": False,
+    "null": None,
+    "undefined": None,
+    "NaN": math.nan,
+    "Infinity": math.inf,
+}
+
+_END = ("end", "")
+
+
+def _unescape_one(match: re.Match) -> str:
+    escape = match.group(1)
+    if escape[0] == "u":
+        return chr(int(escape.strip("u{}"), 16))
+    if escape[0] == "x":
+        return chr(int(escape[1:], 16))
+    return _SIMPLE_ESCAPES.get(escape, escape)
+
+
+def _unquote(token: str) -> str:
+    body = token[1:-1]
+    if "\\" not in body:
+        return body
+    text = _ESCAPE.sub(_unescape_one, body)
+    # Join \uD83D\uDE00 style surrogate pairs into one character.
+    return text.encode("utf-16", "surrogatepass").decode("utf-16", "replace")
+
+
+def _number(token: str) -> int | float:
+    token = token.rstrip("n")
+    if "." in token or "e" in token or "E" in token:
+        return float(token)
+    return int(token)
+
+
+class _Reader:
+    """Pull tokens from source and build values out of them."""
+
+    def __init__(self, source: str, pos: int = 0):
+        self.source = source
+        self.pos = pos
+        self._peeked: Optional[tuple[str, str]] = None
+
+    def tokens(self) -> Iterator[tuple[str, str]]:
+        while True:
+            token = self.next()
+            if token is _END:
+                return
+            yield token
+
+    def next(self) -> tuple[str, str]:
+        if self._peeked is not None:
+            token, self._peeked = self._peeked, None
+            return token
+        source = self.source
+        while self.pos < len(source):
+            match = _TOKEN.match(source, self.pos)
+            self.pos = match.end()
+            kind = match.lastgroup
+            if kind is not None:
+                return kind, match.group(kind)
+        return _END
+
+    def peek(self) -> tuple[str, str]:
+        if self._peeked is None:
+            self._peeked = self.next()
+        return self._peeked
+
+    def expect(self, text: str) -> None:
+        kind, value = self.next()
+        if value != text or kind == "str":
+            raise ScraperParseError(
+                f"Expected {text!r} at offset {self.pos}, found {value!r}"
+            )
+
+    def value(self) -> Any:
+        kind, text = self.next()
+        if kind == "str":
+            return _unquote(text)
+        if kind == "num":
+            return _number(text)
+        if kind == "name":
+            return self._name(text)
+        if text == "{":
+            return self._object()
+        if text == "[":
+            return self._array()
+        if text == "(":
+            value = self.value()
+            self.expect(")")
+            return value
+        if text in "-+" and kind == "punct":
+            value = self.value()
+            if not isinstance(value, (int, float)):
+                raise ScraperParseError(f"Invalid number at offset {self.pos}")
+            return -value if text == "-" else value
+        raise ScraperParseError(f"Unexpected {text!r} at offset {self.pos}")
+
+    def _object(self) -> dict:
+        result: dict = {}
+        while True:
+            kind, key = self.next()
+            if key == "}" and kind == "punct":
+                return result
+            if kind == "str":
+                key = _unquote(key)
+            elif kind not in ("name", "num"):
+                raise ScraperParseError(f"Invalid key {key!r} at offset {self.pos}")
+
+            if self.peek()[1] == ":":
+                self.next()
+                result[key] = self.value()
+            else:
+                # Shorthand property referencing a variable we cannot resolve.
+                result[key] = None
+
+            kind, text = self.next()
+            if text == "}" and kind == "punct":
+                return result
+            if text != "," or kind != "punct":
+                raise ScraperParseError(f"Expected ',' at offset {self.pos}")
+
+    def _array(self) -> list:
+        result: list = []
+        while True:
+            kind, text = self.peek()
+            if kind == "punct" and text == "]":
+                self.next()
+                return result
+            if kind == "punct" and text == ",":
+                # Array hole.
+                self.next()
+                result.append(None)
+                continue
+
+            result.append(self.value())
+            kind, text = self.next()
+            if text == "]" and kind == "punct":
+                return result
+            if text != "," or kind != "punct":
+                raise ScraperParseError(f"Expected ',' at offset {self.pos}")
+
+    def _name(self, name: str) -> Any:
+        if name in _CONSTANTS:
+            return _CONSTANTS[name]
+        if name == "void":
+            self.value()
+            return None
+        if name == "new":
+            _, constructor = self.next()
+            args = self._arguments()
+            if constructor == "Map" and args:
+                return dict(args[0])
+            return args[0] if args else None
+
+        # A variable, member access or call we cannot evaluate.
+        while True:
+            kind, text = self.peek()
+            if kind == "punct" and text == ".":
+                self.next()
+                self.next()
+            elif kind == "punct" and text == "(":
+                self._arguments()
+            else:
+                return None
+
+    def _arguments(self) -> list:
+        if self.peek()[1] != "(":
+            return []
+        self.next()
+        args: list = []
+        while True:
+            kind, text = self.peek()
+            if kind == "punct" and text == ")":
+                self.next()
+                return args
+            args.append(self.value())
+            if self.peek()[1] == ",":
+                self.next()
+
+
+def parse_literal(source: str, pos: int = 0) -> Any:
+    """Convert the JavaScript literal starting at pos into Python objects."""
+    return _Reader(source, pos).value()
+
+
+def find_literal(source: str, key: str) -> Any:
+    """Get the value of the first ``key:`` property in source.
+
+    Raises ``KeyError`` when no such property exists and
+    ``ScraperParseError`` when its value is not a literal.
+    """
+    reader = _Reader(source)
+    previous = ""
+    for kind, text in reader.tokens():
+        if (
+            kind in ("name", "str")
+            and (text == key or (kind == "str" and _unquote(text) == key))
+            and previous in ("{", ",")
+            and reader.peek()[1] == ":"
+        ):
+            reader.next()
+            return reader.value()
+        previous = text if kind == "punct" else ""
+    raise KeyError(key)
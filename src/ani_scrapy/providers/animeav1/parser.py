@@ -1,8 +1,11 @@
 """AnimeAV1 parser."""
 
-import re
 from datetime import datetime
-from bs4 import BeautifulSoup
+from lxml.cssselect import CSSSelector
+
+from ani_scrapy.core.exceptions import ScraperParseError
+from ani_scrapy.core.html import HtmlSource, first, parse_html, text_of
+from ani_scrapy.core.log import logger
 
 from ani_scrapy.core.schemas import (
     SearchAnimeInfo,
@@ -18,20 +21,31 @@ from ani_scrapy.providers.animeav1.constants import (
     RELATED_TYPE_MAP,
     ANIME_COVER_URL,
 )
+from ani_scrapy.providers.animeav1.devalue import find_literal
+
+
+_SEARCH_ARTICLES = CSSSelector("article.group\\/item")
+_MEDIA_LINK = CSSSelector("a[href^='/media/']")
+_SEARCH_TITLE = CSSSelector("h3")
+_SEARCH_POSTER = CSSSelector("figure img")
+_SEARCH_TYPE = CSSSelector("div.rounded.bg-line")
+_PAGINATION = CSSSelector("section.col-span-full div.flex.flex-wrap.gap-2")
+_PAGE_BUTTONS = CSSSelector("a.btn")
+_POSTER = CSSSelector("div.relative img.aspect-poster")
 
 
 class AnimeAV1Parser:
     """Parser for AnimeAV1."""
 
-    def parse_search_results(self, html: str) -> list[SearchAnimeInfo]:
+    def parse_search_results(self, html: HtmlSource) -> list[SearchAnimeInfo]:
         """Parse search results from HTML."""
-        soup = BeautifulSoup(html, "lxml")
+        root = parse_html(html)
         results = []
 
-        for article in soup.select("article.group\\/item"):
+        for article in _SEARCH_ARTICLES(root):
             try:
-                link_element = article.select_one("a[href^='/media/']")
-                if not link_element:
+                link_element = first(_MEDIA_LINK(article))
+                if link_element is None:
                     continue
 
                 href = str(link_element.get("href", ""))
@@ -40,14 +54,17 @@ class AnimeAV1Parser:
 
                 anime_id = href.split("/media/")[-1]
 
-                title_element = article.select_one("h3")
-                title = title_element.text.strip() if title_element else ""
+                title = text_of(first(_SEARCH_TITLE(article)))
 
-                img_element = article.select_one("figure img")
-                poster = str(img_element.get("src", "")).strip() if img_element else ""
+                img_element = first(_SEARCH_POSTER(article))
+                poster = (
+                    str(img_element.get("src", "")).strip()
+                    if img_element is not None
+                    else ""
+                )
 
-                type_element = article.select_one("div.rounded.bg-line")
-                type_text = type_element.text.strip() if type_element else "TV Anime"
+                type_element = first(_SEARCH_TYPE(article))
+                type_text = text_of(type_element) or "TV Anime"
                 anime_type = ANIME_TYPE_MAP.get(type_text, _AnimeType.TV)
 
                 if anime_id and title:
@@ -65,33 +82,38 @@ class AnimeAV1Parser:
 
         return results
 
-    def parse_total_pages(self, html: str) -> int:
+    def parse_search_page(
+        self, html: HtmlSource
+    ) -> tuple[list[SearchAnimeInfo], int]:
+        """Parse search results and total pages from one search page."""
+        root = parse_html(html)
+        return self.parse_search_results(root), self.parse_total_pages(root)
+
+    def parse_total_pages(self, html: HtmlSource) -> int:
         """Parse total pages from pagination HTML."""
-        soup = BeautifulSoup(html, "lxml")
+        root = parse_html(html)
 
-        pagination_div = soup.select_one(
-            "section.col-span-full div.flex.flex-wrap.gap-2"
-        )
-        if not pagination_div:
+        pagination_div = first(_PAGINATION(root))
+        if pagination_div is None:
             return 1
 
-        pagination = pagination_div.select("a.btn")
+        pagination = _PAGE_BUTTONS(pagination_div)
         if len(pagination) >= 2:
             penultimate = pagination[-2]
-            page_text = penultimate.text.strip()
+            page_text = text_of(penultimate)
             if page_text.isdigit():
                 return int(page_text)
 
         return 1
 
     def parse_anime_info(
-        self, html: str, anime_id: str, include_episodes: bool = True
+        self, html: HtmlSource, anime_id: str, include_episodes: bool = True
     ) -> AnimeInfo:
         """Parse anime info from HTML."""
-        soup = BeautifulSoup(html, "lxml")
+        root = parse_html(html)
 
         # Extract media data from script
-        media_data = self._extract_media_data(html)
+        media_data = self._extract_media_data(root)
         if not media_data:
             return AnimeInfo(
                 id=anime_id,
@@ -103,14 +125,14 @@ class AnimeAV1Parser:
             )
 
         # Extract fields from media data
-        title = media_data.get("title", "")
-        synopsis = media_data.get("synopsis", "")
-        category_name = media_data.get("category", {}).get("name", "TV Anime")
+        title = media_data.get("title") or ""
+        synopsis = media_data.get("synopsis") or ""
+        category_name = (media_data.get("category") or {}).get("name") or "TV Anime"
         anime_type = ANIME_TYPE_MAP.get(category_name, _AnimeType.TV)
 
         # Poster from HTML
-        img = soup.select_one("div.relative img.aspect-poster")
-        if img:
+        img = first(_POSTER(root))
+        if img is not None:
             poster = str(img.get("src", "")).strip()
         else:
             # Fallback to CDN URL using ID
@@ -118,13 +140,13 @@ class AnimeAV1Parser:
             poster = f"{ANIME_COVER_URL}/covers/{media_id}.jpg"
 
         # Genres
-        genres = [g.get("name", "") for g in media_data.get("genres", [])]
+        genres = [g.get("name", "") for g in media_data.get("genres") or []]
 
         # Episodes
         episodes: list[EpisodeInfo | None] = []
         media_id = media_data.get("id", "")
         if include_episodes:
-            episodes_data = media_data.get("episodes", [])
+            episodes_data = media_data.get("episodes") or []
             for ep in episodes_data:
                 ep_number = ep.get("number", 0)
                 image_preview = (
@@ -140,10 +162,10 @@ class AnimeAV1Parser:
 
         # Related animes
         related: list[RelatedInfo | None] = []
-        relations_data = media_data.get("relations", [])
+        relations_data = media_data.get("relations") or []
         for rel in relations_data:
             rel_type = rel.get("type", 1)
-            dest = rel.get("destination", {})
+            dest = rel.get("destination") or {}
             related.append(
                 RelatedInfo(
                     id=dest.get("slug", ""),
@@ -168,306 +190,80 @@ class AnimeAV1Parser:
             episodes=episodes,
         )
 
-    def _extract_media_data(self, html: str) -> dict | None:
-        """Extract media data from script tag."""
-        soup = BeautifulSoup(html, "lxml")
-
-        # Find script with __sveltekit_ and media
-        for script in soup.find_all("script"):
-            content = str(script)
-            if "__sveltekit_" in content and "media:" in content:
-                script_content = content[8:-9]  # Remove <script> and </script>
-                return self._parse_media_script(script_content)
-
+    def _find_data_script(self, html: HtmlSource, key: str) -> str | None:
+        """Get the SvelteKit data script containing key."""
+        for script in parse_html(html).iter("script"):
+            content = script.text or ""
+            if "__sveltekit_" in content and key in content:
+                return content
         return None
 
-    def _parse_media_script(self, script_content: str) -> dict | None:
-        """Parse media data from script content."""
-        # Find media: in this script
-        media_pos = script_content.find("media:")
-        if media_pos == -1:
+    def _extract_data(self, html: HtmlSource, key: str):
+        """Get the value of key from the SvelteKit data script, if any."""
+        script_content = self._find_data_script(html, f"{key}:")
+        if script_content is None:
             return None
-
-        # Find matching braces
-        depth = 0
-        i = media_pos + 6  # Skip 'media:'
-        obj_start = i
-
-        while i < len(script_content):
-            if script_content[i] == "{":
-                depth += 1
-            elif script_content[i] == "}":
-                depth -= 1
-                if depth == 0:
-                    break
-            i += 1
-
-        media_str = script_content[obj_start : i + 1]
-
-        # Extract basic fields
-        result: dict = {}
-
-        # id
-        id_match = re.search(r"(?:id|\"id\"):\s*(\d+)", media_str)
-        if id_match:
-            result["id"] = int(id_match.group(1))
-
-        # title
-        title_match = re.search(r'title:\s*"([^"]+)"', media_str)
-        if title_match:
-            result["title"] = title_match.group(1)
-
-        # slug - find after synopsis
-        synopsis_pos = media_str.find("synopsis:")
-        if synopsis_pos != -1:
-            slug_pos = media_str.find("slug:", synopsis_pos)
-            if slug_pos != -1:
-                slug_match = re.search(
-                    r'slug:\s*"([^"]+)"', media_str[slug_pos : slug_pos + 30]
-                )
-                if slug_match:
-                    result["slug"] = slug_match.group(1)
-
-        # synopsis
-        synopsis_match = re.search(r'synopsis:\s*"([^"]*)"', media_str)
-        result["synopsis"] = synopsis_match.group(1) if synopsis_match else ""
-
-        # category
-        cat_match = re.search(r'category:\s*\{[^}]*name:\s*"([^"]+)"', media_str)
-        result["category"] = (
-            {"name": cat_match.group(1)} if cat_match else {"name": "TV Anime"}
-        )
-
-        # genres
-        if "genres:" in media_str:
-            genres_start = media_str.find("genres:")
-            genres_section = media_str[genres_start : genres_start + 300]
-            genres = re.findall(r'name:\s*"([^"]+)"', genres_section)
-            result["genres"] = [{"name": g} for g in genres]
-        else:
-            result["genres"] = []
-
-        # episodes
-        if "episodes:" in media_str:
-            episodes_start = media_str.find("episodes:")
-            episodes_section = media_str[episodes_start : episodes_start + 50000]
-            episodes = re.findall(r"number:\s*(\d+)", episodes_section)
-            result["episodes"] = [{"number": int(e)} for e in episodes]
-        else:
-            result["episodes"] = []
-
-        # relations
-        if "relations:" in media_str:
-            rels_start = media_str.find("relations:")
-            rels_section = media_str[rels_start : rels_start + 800]
-            rels = re.findall(
-                r'type:\s*(\d+).*?slug:\s*"([^"]+)"[^}]*title:\s*"([^"]+)"',
-                rels_section,
+        try:
+            return find_literal(script_content, key)
+        except (KeyError, ScraperParseError) as e:
+            logger.warning(
+                "Could not read page data | key={key} error={error}",
+                key=key,
+                error=str(e),
             )
-            result["relations"] = [
-                {"type": int(r[0]), "destination": {"slug": r[1], "title": r[2]}}
-                for r in rels
-            ]
-        else:
-            result["relations"] = []
-
-        # endDate (for is_finished) - extract actual value
-        end_date_match = re.search(r'endDate:\s*"([^"]*)"', media_str)
-        result["endDate"] = end_date_match.group(1) if end_date_match else None
+            return None
 
-        return result
+    def _extract_media_data(self, html: HtmlSource) -> dict | None:
+        """Extract media data from script tag."""
+        media = self._extract_data(html, "media")
+        return media if isinstance(media, dict) else None
 
-    def parse_episode_page(self, html: str, anime_id: str) -> list[DownloadLinkInfo]:
+    def parse_episode_page(
+        self, html: HtmlSource, anime_id: str
+    ) -> list[DownloadLinkInfo]:
         """Parse episode page from HTML and extract download links."""
-        download_links: list[DownloadLinkInfo] = []
-
-        soup = BeautifulSoup(html, "lxml")
-
-        # Find script with __sveltekit_ and downloads data
-        for script in soup.find_all("script"):
-            content = str(script)
-            if "__sveltekit_" in content and "downloads:" in content:
-                script_content = content[8:-9]  # Remove <script> and </script>
-                download_links = self._parse_downloads_from_script(script_content)
-                break
+        return self._parse_sub_links(self._extract_data(html, "downloads"))
 
-        return download_links
-
-    def parse_episode_embeds(self, html: str) -> list[DownloadLinkInfo]:
+    def parse_episode_embeds(self, html: HtmlSource) -> list[DownloadLinkInfo]:
         """Parse episode page from HTML and extract iframe/embed links."""
-        embed_links: list[DownloadLinkInfo] = []
-
-        soup = BeautifulSoup(html, "lxml")
+        return self._parse_sub_links(self._extract_data(html, "embeds"))
 
-        # Find script with __sveltekit_ and embeds data
-        for script in soup.find_all("script"):
-            content = str(script)
-            if "__sveltekit_" in content and "embeds:" in content:
-                script_content = content[8:-9]  # Remove <script> and </script>
-                embed_links = self._parse_embeds_from_script(script_content)
-                break
+    def _parse_sub_links(self, links) -> list[DownloadLinkInfo]:
+        """Build server links from the SUB entries of a downloads/embeds object."""
+        if not isinstance(links, dict):
+            return []
 
-        return embed_links
+        result: list[DownloadLinkInfo] = []
+        for link in links.get("SUB") or []:
+            if not isinstance(link, dict):
+                continue
+            server = link.get("server")
+            url = link.get("url")
+            if server and url:
+                result.append(DownloadLinkInfo(server=server, url=url))
+        return result
 
-    def _parse_downloads_from_script(
-        self, script_content: str
-    ) -> list[DownloadLinkInfo]:
-        """Parse downloads from script content."""
-        download_links: list[DownloadLinkInfo] = []
-
-        # Find downloads section
-        downloads_pos = script_content.find("downloads:")
-        if downloads_pos == -1:
-            return download_links
-
-        # Extract downloads section (find matching braces)
-        depth = 0
-        i = downloads_pos + 10  # Skip "downloads:"
-        obj_start = i
-
-        while i < len(script_content):
-            if script_content[i] == "{":
-                depth += 1
-            elif script_content[i] == "}":
-                depth -= 1
-                if depth == 0:
-                    break
-            i += 1
-
-        downloads_str = script_content[obj_start : i + 1]
-
-        # Look for SUB section
-        sub_pos = downloads_str.find("SUB:")
-        if sub_pos == -1:
-            return download_links
-
-        # Extract SUB section
-        sub_depth = 0
-        j = sub_pos + 4
-        sub_start = j
-
-        while j < len(downloads_str):
-            if downloads_str[j] == "[":
-                sub_depth += 1
-            elif downloads_str[j] == "]":
-                sub_depth -= 1
-                if sub_depth == 0:
-                    break
-            j += 1
-
-        sub_str = downloads_str[sub_start : j + 1]
-
-        # Extract server and url pairs
-        # Pattern: server: "X", url: "Y"
-        server_matches = re.findall(r'server:\s*"([^"]+)",\s*url:\s*"([^"]+)"', sub_str)
-
-        for server, url in server_matches:
-            download_links.append(DownloadLinkInfo(server=server, url=url))
-
-        return download_links
-
-    def _parse_embeds_from_script(self, script_content: str) -> list[DownloadLinkInfo]:
-        """Parse embeds from script content."""
-        embed_links: list[DownloadLinkInfo] = []
-
-        # Find embeds section
-        embeds_pos = script_content.find("embeds:")
-        if embeds_pos == -1:
-            return embed_links
-
-        # Extract embeds section (find matching braces)
-        depth = 0
-        i = embeds_pos + 7  # Skip "embeds:"
-        obj_start = i
-
-        while i < len(script_content):
-            if script_content[i] == "{":
-                depth += 1
-            elif script_content[i] == "}":
-                depth -= 1
-                if depth == 0:
-                    break
-            i += 1
-
-        embeds_str = script_content[obj_start : i + 1]
-
-        # Look for SUB section
-        sub_pos = embeds_str.find("SUB:")
-        if sub_pos == -1:
-            return embed_links
-
-        # Extract SUB section
-        sub_depth = 0
-        j = sub_pos + 4
-        sub_start = j
-
-        while j < len(embeds_str):
-            if embeds_str[j] == "[":
-                sub_depth += 1
-            elif embeds_str[j] == "]":
-                sub_depth -= 1
-                if sub_depth == 0:
-                    break
-            j += 1
-
-        sub_str = embeds_str[sub_start : j + 1]
-
-        # Extract server and url pairs
-        server_matches = re.findall(r'server:\s*"([^"]+)",\s*url:\s*"([^"]+)"', sub_str)
-
-        for server, url in server_matches:
-            embed_links.append(DownloadLinkInfo(server=server, url=url))
-
-        return embed_links
-
-    def parse_schedule(self, html: str) -> dict[str, datetime]:
+    def parse_schedule(self, html: HtmlSource) -> dict[str, datetime]:
         """Parse schedule from /horario page."""
         schedule: dict[str, datetime] = {}
 
-        soup = BeautifulSoup(html, "lxml")
+        media = self._extract_data(html, "media")
+        if not isinstance(media, list):
+            return schedule
 
-        # Find script with __sveltekit_ and media array
-        for script in soup.find_all("script"):
-            content = str(script)
-            if "__sveltekit_" in content and "media:" in content:
-                script_content = content[8:-9]  # Remove <script> and </script>
-
-                # Find the media array (contains schedule data)
-                media_pos = script_content.find("media:")
-                if media_pos == -1:
-                    continue
-
-                # Extract media array
-                depth = 0
-                i = media_pos + 6  # Skip 'media:'
-                obj_start = i
-
-                while i < len(script_content):
-                    if script_content[i] == "[":
-                        depth += 1
-                    elif script_content[i] == "]":
-                        depth -= 1
-                        if depth == 0:
-                            break
-                    i += 1
-
-                media_str = script_content[obj_start : i + 1]
-
-                # Extract slug and latestEpisode for each anime
-                # Pattern: slug: "...", latestEpisode: { ..., createdAt: "..." }
-                item_pattern = (
-                    r'slug:\s*"([^"]+)".*?latestEpisode:.*?createdAt:\s*"([^"]+)"'
+        for item in media:
+            if not isinstance(item, dict):
+                continue
+            slug = item.get("slug")
+            latest_episode = item.get("latestEpisode") or {}
+            created_at = latest_episode.get("createdAt")
+            if not slug or not isinstance(created_at, str):
+                continue
+            try:
+                schedule[slug] = datetime.fromisoformat(
+                    created_at.replace("+00:00", "")
                 )
-                matches = re.findall(item_pattern, media_str, re.DOTALL)
-
-                for slug, created_at in matches:
-                    try:
-                        # Parse the datetime
-                        dt = datetime.fromisoformat(created_at.replace("+00:00", ""))
-                        schedule[slug] = dt
-                    except (ValueError, OSError):
-                        continue
-
-                break
+            except (ValueError, OSError):
+                continue
 
         return schedule
@@ -7,9 +7,18 @@ from ani_scrapy.core.log import logger
 
 from ani_scrapy.core.base import BaseScraper
 from ani_scrapy.core.browser import AsyncBrowser
+from ani_scrapy.core.cache import HttpCache
+from ani_scrapy.core.executor import ParseExecutor
 from ani_scrapy.core.http import AsyncHttpAdapter
+from ani_scrapy.core.resolvers import ResolverRegistry
+from ani_scrapy.core.singleflight import SingleFlight
 from ani_scrapy.providers.animeav1.parser import AnimeAV1Parser
-from ani_scrapy.providers.animeav1.constants import BASE_URL, SEARCH_ENDPOINT
+from ani_scrapy.providers.animeav1.constants import (
+    BASE_URL,
+    SEARCH_ENDPOINT,
+    DATA_SCRIPT_MARKERS,
+    BROWSER_BLOCK_RULES,
+)
 from ani_scrapy.core.schemas import (
     PagedSearchAnimeInfo,
     AnimeInfo,
@@ -22,20 +31,29 @@ from ani_scrapy.core.schemas import (
 class AnimeAV1Scraper(BaseScraper):
     """AnimeAV1 scraper."""
 
+    browser_scope = "animeav1"
+    browser_block_rules = BROWSER_BLOCK_RULES
+
     def __init__(
         self,
         headless: bool = True,
         executable_path: str = "",
         external_browser: Optional[AsyncBrowser] = None,
+        http_cache: Optional[HttpCache] = None,
+        parse_executor: Optional[ParseExecutor] = None,
+        resolvers: Optional[ResolverRegistry] = None,
     ):
         super().__init__(
             headless=headless,
             executable_path=executable_path,
             external_browser=external_browser,
+            parse_executor=parse_executor,
+            resolvers=resolvers,
         )
-        self.http = AsyncHttpAdapter(base_url=BASE_URL)
+        self.http = AsyncHttpAdapter(base_url=BASE_URL, cache=http_cache)
         self.parser = AnimeAV1Parser()
         self._schedule_cache: dict[str, datetime] = {}
+        self._schedule_flight = SingleFlight()
 
     async def search_anime(
         self,
@@ -49,11 +67,10 @@ class AnimeAV1Scraper(BaseScraper):
         if page < 1:
             raise ValueError("The variable 'page' must be greater than 0")
 
-        html = await self.http.get(
+        body = await self.http.get_bytes(
             SEARCH_ENDPOINT, params={"search": query, "page": page}
         )
-        animes = self.parser.parse_search_results(html)
-        total_pages = self.parser.parse_total_pages(html)
+        animes, total_pages = await self._parse(self.parser.parse_search_page, body)
 
         logger.info("Search completed | count={count}", count=len(animes))
 
@@ -72,8 +89,12 @@ class AnimeAV1Scraper(BaseScraper):
 
         logger.info("Getting anime info | anime_id={anime_id}", anime_id=anime_id)
 
-        html = await self.http.get(f"media/{anime_id}")
-        anime_info = self.parser.parse_anime_info(html, anime_id, include_episodes)
+        document = await self._get_page(
+            f"media/{anime_id}", stop_after=DATA_SCRIPT_MARKERS
+        )
+        anime_info = await self._parse(
+            self.parser.parse_anime_info, document, anime_id, include_episodes
+        )
 
         # If not finished, fetch schedule for next episode date
         if not anime_info.is_finished and not anime_info.next_episode_date:
@@ -90,9 +111,14 @@ class AnimeAV1Scraper(BaseScraper):
         if self._schedule_cache:
             return self._schedule_cache
 
+        return await self._schedule_flight.do("schedule", self._fetch_schedule)
+
+    async def _fetch_schedule(self) -> dict[str, datetime]:
+        """Fetch and cache the schedule, shared by concurrent callers."""
+
         try:
-            html = await self.http.get("horario")
-            schedule = self.parser.parse_schedule(html)
+            document = await self._get_page("horario", stop_after=DATA_SCRIPT_MARKERS)
+            schedule = await self._parse(self.parser.parse_schedule, document)
             self._schedule_cache = schedule
             return schedule
         except Exception as e:
@@ -112,8 +138,12 @@ class AnimeAV1Scraper(BaseScraper):
             last_episode_number=last_episode_number,
         )
 
-        html = await self.http.get(f"media/{anime_id}")
-        anime_info = self.parser.parse_anime_info(html, anime_id, include_episodes=True)
+        document = await self._get_page(
+            f"media/{anime_id}", stop_after=DATA_SCRIPT_MARKERS
+        )
+        anime_info = await self._parse(
+            self.parser.parse_anime_info, document, anime_id, include_episodes=True
+        )
 
         new_episodes = [
             ep
@@ -142,8 +172,12 @@ class AnimeAV1Scraper(BaseScraper):
                 "The variable 'episode_number' must be greater than or equal to 0"
             )
 
-        html = await self.http.get(f"media/{anime_id}/{episode_number}")
-        download_links = self.parser.parse_episode_page(html, anime_id)
+        document = await self._get_page(
+            f"media/{anime_id}/{episode_number}", stop_after=DATA_SCRIPT_MARKERS
+        )
+        download_links = await self._parse(
+            self.parser.parse_episode_page, document, anime_id
+        )
 
         logger.info(
             "Table download links fetched | count={count}",
@@ -172,8 +206,10 @@ class AnimeAV1Scraper(BaseScraper):
                 "The variable 'episode_number' must be greater than or equal to 0"
             )
 
-        html = await self.http.get(f"media/{anime_id}/{episode_number}")
-        iframe_links = self.parser.parse_episode_embeds(html)
+        document = await self._get_page(
+            f"media/{anime_id}/{episode_number}", stop_after=DATA_SCRIPT_MARKERS
+        )
+        iframe_links = await self._parse(self.parser.parse_episode_embeds, document)
 
         logger.info(
             "Iframe download links fetched | count={count}",
@@ -201,63 +237,7 @@ class AnimeAV1Scraper(BaseScraper):
 
         logger.info("Getting file download link | server={server}", server=server)
 
-        if server == "PDrain":
-            return await self._get_pdrawin_download_link(url)
-        elif server == "UPNShare":
-            return await self._get_upnshare_download_link(url)
-        else:
-            logger.warning("Server not supported | server={server}", server=server)
-            return None
-
-    async def _get_pdrawin_download_link(self, url: str) -> str | None:
-        """Get PDrain download link."""
-        file_id = url.split("/")[-1].split("?")[0]
-        return f"https://pixeldrain.com/api/file/{file_id}?download"
-
-    async def _get_upnshare_download_link(self, url: str) -> str | None:
-        """Get UPNShare download link."""
-
-        dl_url = url + "&dl=1" if "&" not in url else url + "&dl=1"
-
-        try:
-            browser = await self._get_browser()
-            async with await browser.new_page() as page:
-                await page.goto(dl_url)
-
-                await page.wait_for_load_state("networkidle")
-                await page.wait_for_timeout(2000)
-
-                await page.evaluate(
-                    """() => {
-                        const overlay = document.querySelector('div[style*="z-index: 2147483647"]');
-                        if (overlay) {
-                            overlay.remove();
-                        }
-                    }"""
-                )
-
-                button = await page.wait_for_selector(
-                    "button.downloader-button", timeout=10000
-                )
-
-                if button:
-                    await button.dispatch_event("click")
-
-                    anchor = await page.wait_for_selector(
-                        "a.downloader-button[href][download]", timeout=15000
-                    )
-
-                    if anchor is not None:
-                        download_url = await anchor.get_attribute("href")
-                        return download_url
-
-        except Exception as e:
-            logger.warning(
-                "Failed to get UPNShare download link | error={error}",
-                error=str(e),
-            )
-
-        return None
+        return await self._resolve_file_link(server, url)
 
     async def aclose(self) -> None:
         """Cleanup resources."""
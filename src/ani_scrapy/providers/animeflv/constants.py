@@ -21,4 +21,5 @@ RELATED_TYPE_MAP = {
     "Historia Principal": _RelatedType.MAIN_HISTORY,
 }
 
-SUPPORTED_SERVERS = ["SW", "YourUpload"]
+EPISODES_SCRIPT_MARKERS = ("var anime_info = [", "var episodes = [")
+VIDEOS_SCRIPT_MARKER = "var videos = "
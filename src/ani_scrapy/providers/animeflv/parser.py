@@ -1,9 +1,11 @@
 """AnimeFLV parsing logic."""
 
 import json
-from bs4 import BeautifulSoup
+from lxml.cssselect import CSSSelector
+from lxml.html import HtmlElement
 from typing import List
 
+from ani_scrapy.core.html import HtmlSource, Markup, first, parse_html, text_of
 from ani_scrapy.core.schemas import (
     SearchAnimeInfo,
     AnimeInfo,
@@ -16,22 +18,41 @@ from ani_scrapy.providers.animeflv.constants import (
     BASE_EPISODE_IMG_URL,
     ANIME_TYPE_MAP,
     RELATED_TYPE_MAP,
+    VIDEOS_SCRIPT_MARKER,
 )
 
 
+_SEARCH_ARTICLES = CSSSelector("div.Container ul.ListAnimes li article")
+_LINK = CSSSelector("a")
+_SEARCH_TITLE = CSSSelector("h3")
+_POSTER = CSSSelector("figure img")
+_TYPE = CSSSelector("span.Type")
+_TITLE = CSSSelector("h1.Title")
+_DESCRIPTION = CSSSelector("div.Description")
+_GENRES = CSSSelector("nav.Nvgnrs a")
+_RELATED_ITEMS = CSSSelector("ul.Related li")
+_NEXT_EPISODE_DATE = CSSSelector("span.Date")
+_STATUS = CSSSelector("aside.SidebarA span.fa-tv")
+_EPISODE_ITEMS = CSSSelector("ul.Episodes li")
+_PARAGRAPH = CSSSelector("p")
+_IMAGE = CSSSelector("img")
+_DOWNLOAD_ROWS = CSSSelector("table.RTbl.Dwnl tbody tr")
+_CELLS = CSSSelector("td")
+
+
 class AnimeFLVParser:
     """Parsing logic for AnimeFLV."""
 
     @staticmethod
-    def parse_search_results(html: str) -> List[SearchAnimeInfo]:
+    def parse_search_results(html: Markup) -> List[SearchAnimeInfo]:
         """Parse search results from HTML."""
-        soup = BeautifulSoup(html, "lxml")
+        root = parse_html(html)
         results = []
 
-        for article in soup.select("div.Container ul.ListAnimes li article"):
+        for article in _SEARCH_ARTICLES(root):
             try:
-                link_element = article.select_one("a")
-                if not link_element:
+                link_element = first(_LINK(article))
+                if link_element is None:
                     continue
 
                 href = str(link_element.get("href", ""))
@@ -40,14 +61,16 @@ class AnimeFLVParser:
 
                 anime_id = href.split("/")[-1] if href else ""
 
-                title_element = article.select_one("h3")
-                title = str(title_element.text.strip()) if title_element else ""
+                title = text_of(first(_SEARCH_TITLE(article)))
 
-                img_element = article.select_one("figure img")
-                poster = str(img_element.get("src", "")).strip() if img_element else ""
+                img_element = first(_POSTER(article))
+                poster = (
+                    str(img_element.get("src", "")).strip()
+                    if img_element is not None
+                    else ""
+                )
 
-                type_element = article.select_one("span.Type")
-                type_text = type_element.text.strip() if type_element else "Anime"
+                type_text = text_of(first(_TYPE(article))) or "Anime"
                 anime_type = AnimeFLVParser._map_anime_type(type_text)
 
                 if anime_id and title:
@@ -67,44 +90,42 @@ class AnimeFLVParser:
 
     @staticmethod
     def parse_anime_info(
-        html: str,
+        html: HtmlSource,
         anime_id: str,
         include_episodes: bool = True,
     ) -> AnimeInfo:
         """Parse detailed anime information."""
-        soup = BeautifulSoup(html, "lxml")
+        root = parse_html(html)
 
-        title_element = soup.select_one("h1.Title")
-        title = title_element.text.strip() if title_element else ""
+        title = text_of(first(_TITLE(root)))
 
-        poster_element = soup.select_one("figure img")
-        poster = str(poster_element.get("src", "")).strip() if poster_element else ""
+        poster_element = first(_POSTER(root))
+        poster = (
+            str(poster_element.get("src", "")).strip()
+            if poster_element is not None
+            else ""
+        )
 
-        synopsis_element = soup.select_one("div.Description")
-        description = synopsis_element.text.strip() if synopsis_element else ""
+        description = text_of(first(_DESCRIPTION(root)))
 
-        type_element = soup.select_one("span.Type")
-        type_text = type_element.text.strip() if type_element else "Anime"
+        type_text = text_of(first(_TYPE(root))) or "Anime"
         anime_type = AnimeFLVParser._map_anime_type(type_text)
 
         genres = []
-        genre_elements = soup.select("nav.Nvgnrs a")
+        genre_elements = _GENRES(root)
         for genre_element in genre_elements:
-            genre_text = genre_element.text.strip()
+            genre_text = text_of(genre_element)
             if genre_text:
                 genres.append(genre_text)
 
         related_info = []
-        related_elements = soup.select("ul.Related li")
+        related_elements = _RELATED_ITEMS(root)
         for related_element in related_elements:
-            related_link = related_element.select_one("a")
-            if related_link:
+            related_link = first(_LINK(related_element))
+            if related_link is not None:
                 related_id = str(related_link.get("href", "")).split("/")[-1]
-                related_title = related_link.text.strip()
-                related_type_element = related_element.select_one("span.Type")
-                related_type_text = (
-                    related_type_element.text.strip() if related_type_element else ""
-                )
+                related_title = text_of(related_link)
+                related_type_text = text_of(first(_TYPE(related_element)))
 
                 related_type = AnimeFLVParser._map_related_type(related_type_text)
 
@@ -119,12 +140,12 @@ class AnimeFLVParser:
 
         episodes: list[EpisodeInfo | None] = []
         if include_episodes:
-            episodes = AnimeFLVParser._extract_episodes_from_json(soup, anime_id)
+            episodes = AnimeFLVParser._extract_episodes_from_json(root, anime_id)
 
         next_episode_date = None
-        date_element = soup.select_one("span.Date")
-        if date_element:
-            date_text = date_element.text.strip()
+        date_element = first(_NEXT_EPISODE_DATE(root))
+        if date_element is not None:
+            date_text = text_of(date_element)
             try:
                 from datetime import datetime
 
@@ -132,10 +153,10 @@ class AnimeFLVParser:
             except ValueError:
                 pass
 
-        is_finished_element = soup.select_one("aside.SidebarA span.fa-tv")
+        is_finished_element = first(_STATUS(root))
         is_finished = (
-            is_finished_element.text.strip() == "Finalizado"
-            if is_finished_element
+            text_of(is_finished_element) == "Finalizado"
+            if is_finished_element is not None
             else len(episodes) > 0
         )
 
@@ -154,15 +175,19 @@ class AnimeFLVParser:
 
     @staticmethod
     def extract_episode_data(
-        html: str,
+        html: HtmlSource,
     ) -> tuple[list[str], list[list[str]]]:
-        """Extract episode data from HTML script tags."""
-        soup = BeautifulSoup(html, "lxml")
+        """Extract episode data from HTML script tags.
+
+        Accepts markup or a document already built by
+        ``AsyncHttpAdapter.get_document``.
+        """
+        root = parse_html(html)
         info_ids = []
         episodes_data = []
 
-        for script in soup.find_all("script"):
-            contents = str(script)
+        for script in root.iter("script"):
+            contents = script.text or ""
 
             if "var anime_info = [" in contents:
                 try:
@@ -182,10 +207,10 @@ class AnimeFLVParser:
 
     @staticmethod
     def _extract_episodes_from_json(
-        soup: BeautifulSoup, anime_id: str
+        root: HtmlElement, anime_id: str
     ) -> list[EpisodeInfo]:
         """Extract episode information from JSON in script tags."""
-        info_ids, episodes_data = AnimeFLVParser.extract_episode_data(str(soup))
+        info_ids, episodes_data = AnimeFLVParser.extract_episode_data(root)
 
         if not info_ids or not episodes_data:
             return []
@@ -207,23 +232,25 @@ class AnimeFLVParser:
         return episodes
 
     @staticmethod
-    def _extract_episodes(soup: BeautifulSoup, anime_id: str) -> List[EpisodeInfo]:
+    def _extract_episodes(root: HtmlElement, anime_id: str) -> List[EpisodeInfo]:
         """Extract episode information."""
         episodes = []
-        episode_elements = soup.select("ul.Episodes li")
+        episode_elements = _EPISODE_ITEMS(root)
 
         for episode_element in episode_elements:
             try:
-                number_element = episode_element.select_one("p")
-                if number_element:
-                    number_text = number_element.text.strip()
+                number_element = first(_PARAGRAPH(episode_element))
+                if number_element is not None:
+                    number_text = text_of(number_element)
                     number = int(number_text) if number_text.isdigit() else 0
                 else:
                     continue
 
-                img_element = episode_element.select_one("img")
+                img_element = first(_IMAGE(episode_element))
                 preview = (
-                    str(img_element.get("src", "")).strip() if img_element else None
+                    str(img_element.get("src", "")).strip()
+                    if img_element is not None
+                    else None
                 )
 
                 episodes.append(
@@ -246,24 +273,62 @@ class AnimeFLVParser:
         return RELATED_TYPE_MAP.get(site_type, _RelatedType.PREQUEL)
 
     @staticmethod
-    def parse_table_download_links(html: str, episode_number: int) -> list[dict]:
+    def parse_table_download_links(html: Markup, episode_number: int) -> list[dict]:
         """Parse table download links from episode page HTML."""
-        soup = BeautifulSoup(html, "lxml")
-        rows_list = soup.select("table.RTbl.Dwnl tbody tr")
+        root = parse_html(html)
+        rows_list = _DOWNLOAD_ROWS(root)
         rows = []
 
         for row in rows_list:
-            cells = row.select("td")
+            cells = _CELLS(row)
             if len(cells) >= 4:
+                link = first(_LINK(cells[3]))
                 rows.append(
                     {
-                        "server": cells[0].text,
-                        "url": (
-                            str(cells[3].select_one("a").get("href"))
-                            if cells[3].select_one("a")
-                            else None
-                        ),
+                        "server": cells[0].text_content(),
+                        "url": str(link.get("href")) if link is not None else None,
                     }
                 )
 
         return rows
+
+    @staticmethod
+    def parse_iframe_links(html: Markup) -> list[dict]:
+        """Parse the server-to-embed mapping of the episode page script.
+
+        Servers are taken from the ``SUB`` list first, then from any other
+        language; the first embed seen for a server wins.
+        """
+        root = parse_html(html)
+        decoder = json.JSONDecoder()
+
+        for script in root.iter("script"):
+            contents = script.text or ""
+            start = contents.find(VIDEOS_SCRIPT_MARKER)
+            if start == -1:
+                continue
+            try:
+                videos, _ = decoder.raw_decode(
+                    contents, start + len(VIDEOS_SCRIPT_MARKER)
+                )
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(videos, dict):
+                continue
+
+            languages = sorted(videos, key=lambda language: language != "SUB")
+            links = []
+            seen = set()
+            for language in languages:
+                for video in videos[language] or []:
+                    try:
+                        server = video["title"]
+                        url = video["code"]
+                    except (KeyError, TypeError):
+                        continue
+                    if server and url and server not in seen:
+                        seen.add(server)
+                        links.append({"server": server, "url": url})
+            return links
+
+        return []
@@ -2,20 +2,24 @@
 
 import asyncio
 from typing import Optional
-from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from ani_scrapy.core.log import logger
+from ani_scrapy.core.metrics import measure
 
 from ani_scrapy.core.base import BaseScraper
 from ani_scrapy.core.browser import AsyncBrowser
+from ani_scrapy.core.cache import HttpCache
+from ani_scrapy.core.executor import ParseExecutor
+from ani_scrapy.core.exceptions import ScraperBlockedError, ScraperParseError
 from ani_scrapy.core.http import AsyncHttpAdapter
+from ani_scrapy.core.resolvers import ResolverRegistry
 from ani_scrapy.providers.animeflv.parser import AnimeFLVParser
 from ani_scrapy.providers.animeflv.constants import (
     BASE_URL,
     ANIME_VIDEO_ENDPOINT,
     BASE_EPISODE_IMG_URL,
     SW_DOWNLOAD_URL,
-    SUPPORTED_SERVERS,
+    EPISODES_SCRIPT_MARKERS,
 )
 from ani_scrapy.core.constants.general import (
     SW_TIMEOUT,
@@ -31,33 +35,50 @@ from ani_scrapy.core.schemas import (
 )
 
 
+EMBED_DOWNLOAD_URLS = {
+    "SW": SW_DOWNLOAD_URL,
+    "YourUpload": YOURUPLOAD_DOWNLOAD_URL,
+}
+
+
+def embed_download_url(server: str, embed_url: str) -> str:
+    """Download page of the video a server's player embeds."""
+    video_id = embed_url.split("/")[-1].split("?")[0]
+    return f"{EMBED_DOWNLOAD_URLS[server]}/{video_id}"
+
+
 class AnimeFLVScraper(BaseScraper):
     """AnimeFLV scraper."""
 
+    browser_scope = "animeflv"
+
     def __init__(
         self,
         headless: bool = True,
         executable_path: str = "",
         external_browser: Optional[AsyncBrowser] = None,
+        http_cache: Optional[HttpCache] = None,
+        parse_executor: Optional[ParseExecutor] = None,
+        resolvers: Optional[ResolverRegistry] = None,
+        hybrid: bool = True,
     ):
         super().__init__(
             headless=headless,
             executable_path=executable_path,
             external_browser=external_browser,
+            parse_executor=parse_executor,
+            resolvers=resolvers,
         )
-        self.http = AsyncHttpAdapter(base_url=BASE_URL)
+        self.http = AsyncHttpAdapter(base_url=BASE_URL, cache=http_cache)
         self.parser = AnimeFLVParser()
+        # Read iframe links from the episode page script over HTTP.
+        self.hybrid = hybrid
 
         self._tab_link_getters = {
             "SW": self._get_sw_link,
             "YourUpload": self._get_yourupload_link,
         }
 
-        self._file_link_getters = {
-            "SW": self._get_sw_file_link,
-            "YourUpload": self._get_yourupload_file_link,
-        }
-
     async def search_anime(
         self,
         query: str,
@@ -70,8 +91,8 @@ class AnimeFLVScraper(BaseScraper):
         if page < 1:
             raise ValueError("The variable 'page' must be greater than 0")
 
-        html = await self.http.get("browse", params={"q": query, "page": page})
-        animes = self.parser.parse_search_results(html)
+        body = await self.http.get_bytes("browse", params={"q": query, "page": page})
+        animes = await self._parse(self.parser.parse_search_results, body)
 
         logger.info("Search completed | count={count}", count=len(animes))
 
@@ -108,8 +129,12 @@ class AnimeFLVScraper(BaseScraper):
             last_episode_number=last_episode_number,
         )
 
-        html = await self.http.get(f"anime/{anime_id}")
-        info_ids, episodes_data = self.parser.extract_episode_data(html)
+        document = await self._get_page(
+            f"anime/{anime_id}", stop_after=EPISODES_SCRIPT_MARKERS
+        )
+        info_ids, episodes_data = await self._parse(
+            self.parser.extract_episode_data, document
+        )
 
         if not info_ids or not episodes_data:
             return []
@@ -153,9 +178,9 @@ class AnimeFLVScraper(BaseScraper):
             )
 
         url = f"{ANIME_VIDEO_ENDPOINT}/{anime_id}-{episode_number}"
-        html = await self.http.get(url)
-        download_links_data = self.parser.parse_table_download_links(
-            html, episode_number
+        body = await self.http.get_bytes(url)
+        download_links_data = await self._parse(
+            self.parser.parse_table_download_links, body, episode_number
         )
 
         rows = [
@@ -184,18 +209,62 @@ class AnimeFLVScraper(BaseScraper):
 
         url = f"{ANIME_VIDEO_ENDPOINT}/{anime_id}-{episode_number}"
 
-        browser = await self._get_browser()
-        async with await browser.new_page() as page:
+        if self.hybrid:
+            try:
+                async with measure("animeflv.iframe_links.http"):
+                    return await self._get_iframe_download_links_http(
+                        url, episode_number
+                    )
+            except (ConnectionError, ScraperBlockedError, ScraperParseError) as e:
+                logger.warning(
+                    "HTTP iframe links failed, using the browser | error={error}",
+                    error=str(e),
+                )
+
+        async with (
+            measure("animeflv.iframe_links.browser"),
+            self._browser_page() as page,
+        ):
             return await self._get_iframe_download_links_internal(page, url)
 
+    async def _get_iframe_download_links_http(
+        self, url: str, episode_number: int
+    ) -> EpisodeDownloadInfo:
+        """Get iframe download links from the ``var videos`` page script."""
+        body = await self.http.get_bytes(url)
+        embeds = await self._parse(self.parser.parse_iframe_links, body)
+
+        download_links = [
+            DownloadLinkInfo(
+                server=embed["server"],
+                url=embed_download_url(embed["server"], embed["url"]),
+            )
+            for embed in embeds
+            if embed["server"] in self._tab_link_getters
+        ]
+        if not download_links:
+            raise ScraperParseError(f"No supported server embeds in {url}")
+
+        logger.info(
+            "Iframe download links fetched | count={count}",
+            count=len(download_links),
+        )
+        return EpisodeDownloadInfo(
+            episode_number=episode_number,
+            download_links=download_links,
+        )
+
     async def _fetch_and_parse_info(
         self, anime_id: str, include_episodes: bool
     ) -> AnimeInfo:
         """Internal method for fetching and parsing anime info."""
         url = f"anime/{anime_id}"
-        html = await self.http.get(url)
-        anime_info = self.parser.parse_anime_info(
-            html, anime_id, include_episodes=include_episodes
+        body = await self.http.get_bytes(url)
+        anime_info = await self._parse(
+            self.parser.parse_anime_info,
+            body,
+            anime_id,
+            include_episodes=include_episodes,
         )
         return anime_info
 
@@ -281,18 +350,7 @@ class AnimeFLVScraper(BaseScraper):
 
         logger.info("Getting file download link | server={server}", server=server)
 
-        if server not in SUPPORTED_SERVERS:
-            logger.error(
-                "Server not supported | server={server} supported={supported}",
-                server=server,
-                supported=SUPPORTED_SERVERS,
-            )
-            return None
-
-        browser = await self._get_browser()
-        async with await browser.new_page() as page:
-            page.on("popup", lambda popup: popup.close())
-            return await self._file_link_getters[server](page, url)
+        return await self._resolve_file_link(server, url)
 
     async def _get_sw_link(self, page):
         """Get SW server link."""
@@ -304,8 +362,7 @@ class AnimeFLVScraper(BaseScraper):
         )
         iframe_element = await video_element.query_selector("iframe")
         iframe_src = await iframe_element.get_attribute("src")
-        video_id = iframe_src.split("/")[-1].split("?")[0]
-        return f"{SW_DOWNLOAD_URL}/{video_id}"
+        return embed_download_url("SW", iframe_src)
 
     async def _get_yourupload_link(self, page):
         """Get YourUpload server link."""
@@ -317,75 +374,7 @@ class AnimeFLVScraper(BaseScraper):
         )
         iframe_element = await video_element.query_selector("iframe")
         iframe_src = await iframe_element.get_attribute("src")
-        video_id = iframe_src.split("/")[-1].split("?")[0]
-        return f"{YOURUPLOAD_DOWNLOAD_URL}/{video_id}"
-
-    async def _get_sw_file_link(self, page, url: str):
-        """Get SW file download link."""
-
-        logger.debug("Getting SW file link")
-
-        try:
-            await page.goto(url)
-            video_id = url.split("/")[-1]
-            try_urls = [
-                f"{SW_DOWNLOAD_URL}/{video_id}_h",
-                f"{SW_DOWNLOAD_URL}/{video_id}_n",
-                f"{SW_DOWNLOAD_URL}/{video_id}_l",
-            ]
-
-            for try_url in try_urls:
-                retries = 3
-                for _ in range(retries):
-                    try:
-                        await page.goto(try_url)
-
-                        download_button = await page.wait_for_selector(
-                            "form#F1 button", timeout=3000
-                        )
-                        await download_button.click()
-
-                        try:
-                            error_label = await page.wait_for_selector(
-                                "div.text-danger.text-center.mb-5",
-                                timeout=SW_TIMEOUT,
-                            )
-                            text_label = await error_label.inner_text()
-                            if text_label.strip() == "Downloads disabled 620":
-                                continue
-                            else:
-                                break
-                        except PlaywrightTimeoutError:
-                            pass
-
-                        download_link = await page.wait_for_selector(
-                            "div.text-center a.btn", timeout=SW_TIMEOUT
-                        )
-                        return await download_link.get_attribute("href")
-                    except Exception:
-                        continue
-        except Exception:
-            pass
-        return None
-
-    async def _get_yourupload_file_link(self, page, url: str):
-        """Get YourUpload file download link."""
-
-        logger.debug("Getting YourUpload file link")
-
-        try:
-            await page.goto(url)
-
-            try:
-                video_element = await page.wait_for_selector(
-                    "div.jw-media video.jw-video", timeout=YOURUPLOAD_TIMEOUT
-                )
-                video_src = await video_element.get_attribute("src")
-                return video_src
-            except PlaywrightTimeoutError:
-                return None
-        except Exception:
-            return None
+        return embed_download_url("YourUpload", iframe_src)
 
     async def aclose(self) -> None:
         """Cleanup resources."""
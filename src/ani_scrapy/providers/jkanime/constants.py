@@ -24,4 +24,49 @@ RELATED_TYPE_MAP = {
     "Precuela": _RelatedType.PREQUEL,
 }
 
-SUPPORTED_SERVERS = ["Streamwish", "Mediafire"]
+PAGINATION_SELECTOR = "div.nice-select.anime__pagination"
+PAGINATION_ITEMS_SELECTOR = f"{PAGINATION_SELECTOR} ul > li"
+PAGINATION_CONCURRENCY = 3
+PAGINATION_TAB_TIMEOUT = 2000
+
+PLAYER_SWITCH_TIMEOUT = 3000
+EPISODE_SOURCE_TIMEOUT = 5000
+MAGI_TIMEOUT = 5000
+STREAMWISH_TIMEOUT = 5000
+STREAMWISH_IFRAME_HOST = "sfastwish.com"
+STREAMWISH_IFRAME_SELECTOR = f'iframe[src*="{STREAMWISH_IFRAME_HOST}"]'
+# True once the player iframe points somewhere new and, when it is
+# same-origin, its new document has started loading.
+PLAYER_SWITCHED_JS = """previous => {
+    const frame = document.querySelector('#video_box iframe');
+    if (!frame || !frame.src || frame.src === previous) return false;
+    try {
+        const doc = frame.contentDocument;
+        return doc.URL !== previous && doc.URL !== 'about:blank';
+    } catch (e) {
+        return true;
+    }
+}"""
+
+# In-page extractors: return only the fields the parser reads.
+EPISODE_CARDS_SELECTOR = "#episodes-content div.epcontent"
+EPISODE_CARDS_JS = """cards => cards.flatMap(card => {
+    const link = card.querySelector('a');
+    if (!link) return [];
+    const image = card.querySelector('a > div');
+    return [{
+        href: link.getAttribute('href') || '',
+        image: image ? image.getAttribute('data-setbg') || '' : null,
+    }];
+})"""
+DOWNLOAD_TABLE_SELECTOR = "div.download.mt-2"
+DOWNLOAD_ROWS_JS = """containers => {
+    if (!containers.length) return [];
+    return [...containers[0].querySelectorAll('tr')].slice(1).map(row => {
+        const link = row.querySelector('a');
+        return {
+            cells: [...row.querySelectorAll('td')].map(c => c.textContent.trim()),
+            href: link ? link.getAttribute('href') || '' : '',
+        };
+    });
+}"""
@@ -0,0 +1,118 @@
+"""Direct access to the data source behind the JKAnime episode pagination."""
+
+import json
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+PAGE_PLACEHOLDER = "{page}"
+
+# Headers of the captured request that the source may check.
+FORWARDED_HEADERS = frozenset(
+    {
+        "accept",
+        "content-type",
+        "referer",
+        "x-csrf-token",
+        "x-requested-with",
+        "x-xsrf-token",
+    }
+)
+
+
+def _replace_value(pairs: List[Tuple[str, str]], value: str) -> bool:
+    """Put the page placeholder in the last pair whose value is value."""
+    for i in range(len(pairs) - 1, -1, -1):
+        if pairs[i][1] == value:
+            pairs[i] = (pairs[i][0], PAGE_PLACEHOLDER)
+            return True
+    return False
+
+
+def _template_url(url: str, value: str) -> Optional[str]:
+    parts = urlsplit(url)
+    segments = parts.path.split("/")
+    if value in segments:
+        idx = len(segments) - 1 - segments[::-1].index(value)
+        segments[idx] = PAGE_PLACEHOLDER
+        return urlunsplit(parts._replace(path="/".join(segments)))
+
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if _replace_value(query, value):
+        return urlunsplit(parts._replace(query=urlencode(query, safe="{}")))
+    return None
+
+
+def _template_data(data: str, value: str) -> Optional[str]:
+    if data.lstrip().startswith("{"):
+        try:
+            payload = json.loads(data)
+        except ValueError:
+            return None
+        keys = [k for k, v in payload.items() if str(v) == value]
+        if not keys:
+            return None
+        payload[keys[-1]] = PAGE_PLACEHOLDER
+        return json.dumps(payload).replace(f'"{PAGE_PLACEHOLDER}"', PAGE_PLACEHOLDER)
+
+    form = parse_qsl(data, keep_blank_values=True)
+    if _replace_value(form, value):
+        return urlencode(form, safe="{}")
+    return None
+
+
+@dataclass
+class EpisodeSource:
+    """Request template of one anime's episode pages.
+
+    Built from the request the pagination widget sent for a known page;
+    ``request_for`` rebuilds it for any other page.
+    """
+
+    method: str
+    url: str
+    data: Optional[str] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    total_pages: int = 1
+
+    @classmethod
+    def from_request(
+        cls,
+        method: str,
+        url: str,
+        data: Optional[str],
+        headers: Mapping[str, str],
+        page: int,
+        total_pages: int,
+    ) -> Optional["EpisodeSource"]:
+        """Template of a request made for page, or None if page is not in it.
+
+        The page number is looked up in the URL path, then its query and
+        then the form or JSON body.
+        """
+        value = str(page)
+        url_template = _template_url(url, value)
+        data_template = data
+        if url_template is None:
+            if not data:
+                return None
+            data_template = _template_data(data, value)
+            if data_template is None:
+                return None
+            url_template = url
+
+        return cls(
+            method=method.upper(),
+            url=url_template,
+            data=data_template,
+            headers={
+                k: v for k, v in headers.items() if k.lower() in FORWARDED_HEADERS
+            },
+            total_pages=total_pages,
+        )
+
+    def request_for(self, page: int) -> Tuple[str, Optional[str]]:
+        """URL and body of the request for page."""
+        value = str(page)
+        data = self.data.replace(PAGE_PLACEHOLDER, value) if self.data else None
+        return self.url.replace(PAGE_PLACEHOLDER, value), data
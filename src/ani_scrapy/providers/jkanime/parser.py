@@ -1,34 +1,68 @@
 """JKAnime parsing logic."""
 
+import json
+import re
 from datetime import datetime
-from bs4 import BeautifulSoup
+from lxml.cssselect import CSSSelector
 from typing import List
 
+from ani_scrapy.core.exceptions import ScraperParseError
+from ani_scrapy.core.html import HtmlBody, Markup, first, parse_html, text_of
 from ani_scrapy.core.schemas import (
     SearchAnimeInfo,
     AnimeInfo,
     EpisodeInfo,
     _AnimeType,
 )
-from ani_scrapy.providers.jkanime.constants import ANIME_TYPE_MAP
+from ani_scrapy.providers.jkanime.constants import (
+    ANIME_TYPE_MAP,
+    BASE_EPISODE_IMG_URL,
+    STREAMWISH_IFRAME_HOST,
+)
 from ani_scrapy.core.constants.general import MONTH_MAP
 
 
+_SEARCH_ITEMS = CSSSelector("div.row.page_directorio > div")
+_LINK_WITH_HREF = CSSSelector("a[href]")
+_SEARCH_TITLE = CSSSelector("h5 > a")
+_LINKED_DIV = CSSSelector("a > div")
+_SEARCH_TYPE = CSSSelector("li.anime")
+_SIDE_INFO = CSSSelector("div.col-lg-2.picd")
+_INFO_CONTAINER = CSSSelector("div.card-bod")
+_MAIN_INFO = CSSSelector("div.anime_info")
+_SYNOPSIS = CSSSelector("p.scroll")
+_NEXT_EPISODE_DATE = CSSSelector("div#proxep")
+_EPISODES_CONTAINER = CSSSelector("div#episodes-content")
+_EPISODE_ITEMS = CSSSelector("div.epcontent")
+_LINK = CSSSelector("a")
+_DOWNLOAD_CONTAINER = CSSSelector("div.download.mt-2")
+_ROWS = CSSSelector("tr")
+_CELLS = CSSSelector("td")
+_SERVER_LINKS = CSSSelector("#collapseServers a")
+_MAGI_SOURCE = CSSSelector("video#video_html5_api source[src]")
+_STREAMWISH_IFRAME = CSSSelector(f'iframe[src*="{STREAMWISH_IFRAME_HOST}"]')
+_PLAYER_IFRAME = re.compile(r'''video\[(\d+)\]\s*=\s*'<iframe[^>]*?\ssrc="([^"]+)"''')
+_MEDIA_URL = re.compile(r"""["'](https?://[^"']+?\.(?:m3u8|mp4)(?:\?[^"']*)?)["']""")
+_STREAMWISH_URL = re.compile(
+    rf"""["'](https?://{re.escape(STREAMWISH_IFRAME_HOST)}/[^"']+)["']"""
+)
+
+
 class JKAnimeParser:
     """Parsing logic for JKAnime."""
 
     @staticmethod
-    def parse_search_results(html: str) -> List[SearchAnimeInfo]:
+    def parse_search_results(html: Markup) -> List[SearchAnimeInfo]:
         """Parse search results from HTML."""
-        soup = BeautifulSoup(html, "lxml")
+        root = parse_html(html)
         results = []
 
-        elements = soup.select("div.row.page_directorio > div")
+        elements = _SEARCH_ITEMS(root)
 
         for element in elements:
             try:
-                link_element = element.select_one("a[href]")
-                if not link_element:
+                link_element = first(_LINK_WITH_HREF(element))
+                if link_element is None:
                     continue
 
                 href = str(link_element.get("href", ""))
@@ -37,18 +71,16 @@ class JKAnimeParser:
 
                 anime_id = href.split("/")[-2] if href else ""
 
-                title_element = element.select_one("h5 > a")
-                title = title_element.text.strip() if title_element else ""
+                title = text_of(first(_SEARCH_TITLE(element)))
 
-                poster_element = element.select_one("a > div")
+                poster_element = first(_LINKED_DIV(element))
                 poster = (
                     str(poster_element.get("data-setbg", "")).strip()
-                    if poster_element
+                    if poster_element is not None
                     else ""
                 )
 
-                type_element = element.select_one("li.anime")
-                type_text = type_element.text.strip() if type_element else "Anime"
+                type_text = text_of(first(_SEARCH_TYPE(element))) or "Anime"
                 anime_type = JKAnimeParser._map_anime_type(type_text)
 
                 if anime_id and title:
@@ -67,37 +99,45 @@ class JKAnimeParser:
         return results
 
     @staticmethod
-    def parse_anime_info(html: str, anime_id: str) -> AnimeInfo:
+    def parse_anime_info(html: Markup, anime_id: str) -> AnimeInfo:
         """Parse detailed anime information from HTML."""
-        soup = BeautifulSoup(html, "lxml")
+        root = parse_html(html)
 
-        side_anime_info = soup.select_one("div.col-lg-2.picd")
-        if not side_anime_info:
+        side_anime_info = first(_SIDE_INFO(root))
+        if side_anime_info is None:
             raise ValueError("Could not find anime info container")
 
-        poster_element = side_anime_info.find("img")
-        poster = str(poster_element.get("src", "")).strip() if poster_element else ""
+        poster_element = side_anime_info.find(".//img")
+        poster = (
+            str(poster_element.get("src", "")).strip()
+            if poster_element is not None
+            else ""
+        )
 
-        info_container = side_anime_info.select_one("div.card-bod")
-        list_info = info_container.find_all("li") if info_container else []
+        info_container = first(_INFO_CONTAINER(side_anime_info))
+        list_info = (
+            info_container.findall(".//li") if info_container is not None else []
+        )
 
         anime_type = _AnimeType.TV
         if list_info:
-            type_text = list_info[0].text.strip()
+            type_text = text_of(list_info[0])
             anime_type = JKAnimeParser._map_anime_type(type_text)
 
         genres = []
         if len(list_info) > 1:
-            genre_elements = list_info[1].find_all("a")
-            genres = [genre.text.strip() for genre in genre_elements if genre.text]
+            genre_elements = list_info[1].findall(".//a")
+            genres = [
+                text_of(genre) for genre in genre_elements if genre.text_content()
+            ]
 
         is_finished = False
         parsed_date = None
 
         for l_info in list_info:
-            div = l_info.find("div")
-            if div:
-                div_text = div.text.strip()
+            div = l_info.find(".//div")
+            if div is not None:
+                div_text = text_of(div)
                 if div_text == "Concluido":
                     is_finished = True
                     break
@@ -105,10 +145,10 @@ class JKAnimeParser:
                     is_finished = False
                     break
 
-            span = l_info.find("span")
-            if span and "Emitido:" in span.text:
+            span = l_info.find(".//span")
+            if span is not None and "Emitido:" in span.text_content():
                 try:
-                    _, date = l_info.text.split(":")
+                    _, date = l_info.text_content().split(":")
                     date = date.strip()
                     parts = date.split()
                     year = parts[-1]
@@ -118,21 +158,18 @@ class JKAnimeParser:
                 except (ValueError, IndexError):
                     pass
 
-        main_anime_info = soup.select_one("div.anime_info")
+        main_anime_info = first(_MAIN_INFO(root))
         title = ""
         description = ""
 
-        if main_anime_info:
-            title_element = main_anime_info.find("h3")
-            title = title_element.text.strip() if title_element else ""
-
-            synopsis_element = main_anime_info.select_one("p.scroll")
-            description = synopsis_element.text.strip() if synopsis_element else ""
+        if main_anime_info is not None:
+            title = text_of(main_anime_info.find(".//h3"))
+            description = text_of(first(_SYNOPSIS(main_anime_info)))
 
-        raw_next_episode_date = soup.select("div#proxep")
+        raw_next_episode_date = _NEXT_EPISODE_DATE(root)
         if raw_next_episode_date and len(raw_next_episode_date) == 2:
             try:
-                next_episode_date = raw_next_episode_date[-1].text.strip()
+                next_episode_date = text_of(raw_next_episode_date[-1])
                 current_year = datetime.now().year
                 parts = next_episode_date.split(" ")
                 day = parts[-3]
@@ -159,37 +196,55 @@ class JKAnimeParser:
         )
 
     @staticmethod
-    def parse_episode_page(html: str, anime_id: str) -> List[EpisodeInfo]:
+    def parse_episode_page(html: Markup, anime_id: str) -> List[EpisodeInfo]:
         """Parse episode page HTML and extract episodes."""
-        soup = BeautifulSoup(html, "lxml")
-        episodes = []
+        root = parse_html(html)
 
-        episodes_container = soup.select_one("div#episodes-content")
-        if not episodes_container:
-            return episodes
+        episodes_container = first(_EPISODES_CONTAINER(root))
+        if episodes_container is None:
+            return []
 
-        for episode in episodes_container.select("div.epcontent"):
-            try:
-                link_element = episode.select_one("a")
-                if not link_element:
-                    continue
+        return JKAnimeParser._parse_episode_items(episodes_container, anime_id)
 
-                href = link_element.get("href", "")
+    @staticmethod
+    def _parse_episode_items(container, anime_id: str) -> List[EpisodeInfo]:
+        """Parse the episode cards found under container."""
+        cards = []
+        for episode in _EPISODE_ITEMS(container):
+            link_element = first(_LINK(episode))
+            if link_element is None:
+                continue
+            img_element = first(_LINKED_DIV(episode))
+            cards.append(
+                {
+                    "href": link_element.get("href", ""),
+                    "image": (
+                        str(img_element.get("data-setbg", ""))
+                        if img_element is not None
+                        else None
+                    ),
+                }
+            )
+        return JKAnimeParser.episodes_from_cards(cards, anime_id)
+
+    @staticmethod
+    def episodes_from_cards(cards: List[dict], anime_id: str) -> List[EpisodeInfo]:
+        """Build episodes from ``{"href", "image"}`` records of episode cards."""
+        episodes = []
+
+        for card in cards:
+            try:
+                href = card.get("href") or ""
                 if not href:
                     continue
 
                 number = int(href.split("/")[-2])
 
-                img_element = episode.select_one("a > div")
-                image_preview = (
-                    str(img_element.get("data-setbg", "")) if img_element else None
-                )
-
                 episodes.append(
                     EpisodeInfo(
                         number=number,
                         anime_id=anime_id,
-                        image_preview=image_preview,
+                        image_preview=card.get("image"),
                     )
                 )
             except (ValueError, IndexError, TypeError):
@@ -197,34 +252,82 @@ class JKAnimeParser:
 
         return episodes
 
+    @staticmethod
+    def parse_episode_source(body: Markup, anime_id: str) -> List[EpisodeInfo]:
+        """Parse one page answered by the episode pagination source.
+
+        The source may answer with JSON (a list of episodes, bare or under
+        ``data``) or with the HTML of the episode cards.
+        """
+        raw = body.content if isinstance(body, HtmlBody) else body
+        if isinstance(raw, memoryview):
+            raw = raw.tobytes()
+        head = raw.lstrip()[:1]
+        if head not in ("{", "[", b"{", b"["):
+            root = parse_html(body)
+            container = first(_EPISODES_CONTAINER(root))
+            return JKAnimeParser._parse_episode_items(
+                root if container is None else container, anime_id
+            )
+
+        try:
+            data = json.loads(raw)
+        except ValueError as e:
+            raise ScraperParseError(f"Invalid episode source JSON: {e}") from e
+        items = data.get("data", []) if isinstance(data, dict) else data
+
+        episodes = []
+        for item in items:
+            try:
+                number = int(item["number"])
+            except (KeyError, ValueError, TypeError):
+                continue
+            image = item.get("image") or None
+            if image and "://" not in image:
+                image = f"{BASE_EPISODE_IMG_URL}/{image.lstrip('/')}"
+            episodes.append(
+                EpisodeInfo(number=number, anime_id=anime_id, image_preview=image)
+            )
+        return episodes
+
     @staticmethod
     def _map_anime_type(site_type: str) -> _AnimeType:
         """Map site-specific anime types to shared enum."""
         return ANIME_TYPE_MAP.get(site_type, _AnimeType.TV)
 
     @staticmethod
-    def parse_table_download_links(html: str, episode_number: int) -> List[dict]:
+    def parse_table_download_links(html: Markup, episode_number: int) -> List[dict]:
         """Parse table download links."""
-        soup = BeautifulSoup(html, "lxml")
-        download_container = soup.select_one("div.download.mt-2")
+        root = parse_html(html)
+        download_container = first(_DOWNLOAD_CONTAINER(root))
 
-        if not download_container:
+        if download_container is None:
             return []
 
-        download_links = download_container.select("tr")[1:]
+        rows = []
+        for download_link in _ROWS(download_container)[1:]:
+            link_element = download_link.find(".//a")
+            rows.append(
+                {
+                    "cells": [text_of(cell) for cell in _CELLS(download_link)],
+                    "href": (
+                        link_element.get("href", "") if link_element is not None else ""
+                    ),
+                }
+            )
+        return JKAnimeParser.download_links_from_rows(rows)
+
+    @staticmethod
+    def download_links_from_rows(rows: List[dict]) -> List[dict]:
+        """Build download links from ``{"cells", "href"}`` table row records."""
         all_download_links = []
 
-        for download_link in download_links:
+        for row in rows:
             try:
-                cells = download_link.select("td")
+                cells = row["cells"]
                 if len(cells) >= 2:
-                    server = cells[0].text.strip()
-                    link_element = download_link.find("a")
-                    url = (
-                        str(link_element.get("href", "")).strip()
-                        if link_element
-                        else ""
-                    )
+                    server = cells[0]
+                    url = str(row.get("href") or "").strip()
 
                     if server and url:
                         all_download_links.append({"server": server, "url": url})
@@ -232,3 +335,56 @@ class JKAnimeParser:
                 continue
 
         return all_download_links
+
+    @staticmethod
+    def parse_player_sources(html: Markup) -> List[dict]:
+        """Pair the ``#collapseServers`` entries with their player documents.
+
+        The episode page script assigns the player iframe of each server
+        to ``video[n]``; entries are matched by their ``data-id``, or by
+        position when it is missing.
+        """
+        root = parse_html(html)
+
+        players = {}
+        for script in root.iter("script"):
+            for index, src in _PLAYER_IFRAME.findall(script.text or ""):
+                players.setdefault(int(index), src)
+
+        sources = []
+        for position, link in enumerate(_SERVER_LINKS(root)):
+            server = text_of(link)
+            try:
+                index = int(link.get("data-id", position))
+            except ValueError:
+                index = position
+            src = players.get(index)
+            if server and src:
+                sources.append({"server": server, "url": src})
+        return sources
+
+    @staticmethod
+    def parse_magi_source(html: Markup) -> str | None:
+        """Video URL of a Magi player document."""
+        root = parse_html(html)
+        source = first(_MAGI_SOURCE(root))
+        if source is not None:
+            return str(source.get("src"))
+        for script in root.iter("script"):
+            match = _MEDIA_URL.search(script.text or "")
+            if match:
+                return match.group(1)
+        return None
+
+    @staticmethod
+    def parse_streamwish_embed(html: Markup) -> str | None:
+        """Streamwish embed URL of a Streamwish player document."""
+        root = parse_html(html)
+        iframe = first(_STREAMWISH_IFRAME(root))
+        if iframe is not None:
+            return str(iframe.get("src"))
+        for script in root.iter("script"):
+            match = _STREAMWISH_URL.search(script.text or "")
+            if match:
+                return match.group(1)
+        return None
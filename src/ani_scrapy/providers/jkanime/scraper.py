@@ -2,27 +2,53 @@
 
 import asyncio
 import time
-from typing import Optional
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import AsyncIterator, Optional
 from urllib.parse import quote
+from playwright.async_api import Error as PlaywrightError
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from ani_scrapy.core.log import logger
+from ani_scrapy.core.metrics import measure
 
 from ani_scrapy.core.base import BaseScraper
 from ani_scrapy.core.browser import AsyncBrowser
+from ani_scrapy.core.cache import HttpCache
+from ani_scrapy.core.capture import UrlCapture, first_result, is_media_request
+from ani_scrapy.core.executor import ParseExecutor
+from ani_scrapy.core.extract import PageExtractor
+from ani_scrapy.core.html import HtmlBody
 from ani_scrapy.core.http import AsyncHttpAdapter
+from ani_scrapy.core.resolvers import ResolverRegistry
+from ani_scrapy.core.challenge import Clearance
+from ani_scrapy.providers.jkanime.episodes import EpisodeSource
 from ani_scrapy.providers.jkanime.parser import JKAnimeParser
 from ani_scrapy.providers.jkanime.constants import (
     BASE_URL,
     SEARCH_ENDPOINT,
     SW_DOWNLOAD_URL,
-    SUPPORTED_SERVERS,
+    PLAYER_SWITCHED_JS,
+    PLAYER_SWITCH_TIMEOUT,
+    MAGI_TIMEOUT,
+    STREAMWISH_TIMEOUT,
+    STREAMWISH_IFRAME_HOST,
+    STREAMWISH_IFRAME_SELECTOR,
+    EPISODE_SOURCE_TIMEOUT,
+    PAGINATION_SELECTOR,
+    PAGINATION_ITEMS_SELECTOR,
+    PAGINATION_CONCURRENCY,
+    PAGINATION_TAB_TIMEOUT,
+    EPISODE_CARDS_SELECTOR,
+    EPISODE_CARDS_JS,
+    DOWNLOAD_TABLE_SELECTOR,
+    DOWNLOAD_ROWS_JS,
 )
-from ani_scrapy.core.constants.general import (
-    SW_TIMEOUT,
-    MEDIAFIRE_TIMEOUT,
+from ani_scrapy.core.exceptions import (
+    ScraperBlockedError,
+    ScraperParseError,
+    ScraperTimeoutError,
 )
-from ani_scrapy.core.exceptions import ScraperTimeoutError
+from ani_scrapy.core.retry import RetryPolicy
 from ani_scrapy.core.schemas import (
     AnimeInfo,
     DownloadLinkInfo,
@@ -32,32 +58,96 @@ from ani_scrapy.core.schemas import (
 )
 
 
+def is_jkplayer_media(request) -> bool:
+    """Whether request is a video requested by the JKPlayer frame."""
+    return is_media_request(request) and "jkanime.net/jkplayer" in request.frame.url
+
+
+def streamwish_download_url(iframe_src: str) -> str:
+    """Download page of the video a Streamwish embed plays."""
+    video_id = iframe_src.split("?")[0].split("/")[-1]
+    return f"{SW_DOWNLOAD_URL}/{video_id}"
+
+
+def is_site_data_request(request) -> bool:
+    """Whether request is an XHR or fetch call to JKAnime itself."""
+    return request.resource_type in ("xhr", "fetch") and request.url.startswith(
+        BASE_URL
+    )
+
+
+def is_episode_page_request(request, page: int = 2) -> bool:
+    """Whether request is a site data call carrying page as a page number."""
+    if not is_site_data_request(request):
+        return False
+    try:
+        data = request.post_data
+    except UnicodeDecodeError:
+        return False
+    source = EpisodeSource.from_request(
+        request.method, request.url, data, {}, page=page, total_pages=page
+    )
+    return source is not None
+
+
+EPISODE_CARDS = PageExtractor(
+    "jkanime.episode_cards", EPISODE_CARDS_SELECTOR, EPISODE_CARDS_JS
+)
+DOWNLOAD_ROWS = PageExtractor(
+    "jkanime.download_rows", DOWNLOAD_TABLE_SELECTOR, DOWNLOAD_ROWS_JS
+)
+
+# Pagination retries re-read a page that is already loaded, so they do not
+# draw from the shared retry budget.
+PAGINATION_RETRY = RetryPolicy(base_delay=0.1, max_delay=1.0, shared_budget=False)
+
+
 class JKAnimeScraper(BaseScraper):
     """JKAnime scraper."""
 
+    browser_scope = "jkanime"
+
     def __init__(
         self,
         headless: bool = True,
         executable_path: str = "",
         external_browser: Optional[AsyncBrowser] = None,
+        http_cache: Optional[HttpCache] = None,
+        parse_executor: Optional[ParseExecutor] = None,
+        resolvers: Optional[ResolverRegistry] = None,
+        hybrid: bool = True,
+        direct_pagination: bool = True,
+        pagination_concurrency: int = PAGINATION_CONCURRENCY,
     ):
         super().__init__(
             headless=headless,
             executable_path=executable_path,
             external_browser=external_browser,
+            parse_executor=parse_executor,
+            resolvers=resolvers,
         )
-        self.http = AsyncHttpAdapter(base_url=BASE_URL)
+        self.http = AsyncHttpAdapter(base_url=BASE_URL, cache=http_cache)
         self.parser = JKAnimeParser()
-
-        self._file_link_getters = {
-            "Streamwish": self._get_streamwish_file_link,
-            "Mediafire": self._get_mediafire_file_link,
-        }
+        # Fetch static pages over HTTP with the browser's clearance cookies.
+        self.hybrid = hybrid
+        # Fetch episode pages from the pagination source instead of clicking.
+        self.direct_pagination = direct_pagination
+        self._episode_sources: dict[str, EpisodeSource] = {}
+        # Tabs clicking through the pagination at once, capped by the page pool.
+        self.pagination_concurrency = max(1, pagination_concurrency)
 
         self._iframe_link_getters = {
             "Magi": self._get_magi_link,
             "Streamwish": self._get_streamwish_link,
         }
+        self._iframe_link_patterns = {
+            "Magi": is_jkplayer_media,
+            "Streamwish": STREAMWISH_IFRAME_HOST,
+        }
+        self._player_resolvers = {
+            "Magi": self._resolve_magi_player,
+            "Streamwish": self._resolve_streamwish_player,
+        }
 
     async def _safe_click(
         self,
@@ -68,9 +158,7 @@ class JKAnimeScraper(BaseScraper):
         debug_name: str = "",
     ) -> None:
         """Safely click an element handling popups."""
-        ctx = page.context
-
-        popup_task = asyncio.create_task(ctx.wait_for_event("page"))
+        popup_task = asyncio.create_task(page.wait_for_event("popup"))
 
         start = time.perf_counter()
         await element.click(force=True)
@@ -103,11 +191,11 @@ class JKAnimeScraper(BaseScraper):
         logger.debug("Using search URL | url={url}", url=search_anime_url)
 
         try:
-            html_text = await self.http.get(search_anime_url)
+            body = await self.http.get_bytes(search_anime_url)
         except ConnectionError as e:
             raise ScraperTimeoutError(str(e)) from e
 
-        animes = self.parser.parse_search_results(html_text)
+        animes = await self._parse(self.parser.parse_search_results, body)
 
         logger.info("Search completed | count={count}", count=len(animes))
 
@@ -127,17 +215,34 @@ class JKAnimeScraper(BaseScraper):
         logger.info("Getting anime info | anime_id={anime_id}", anime_id=anime_id)
 
         if include_episodes:
+            source = self._episode_sources.get(anime_id)
+            if source is not None:
+                try:
+                    body, episodes = await asyncio.gather(
+                        self.http.get_bytes(anime_id),
+                        self._fetch_source_episodes(source, anime_id),
+                    )
+                    anime_info = await self._parse(
+                        self.parser.parse_anime_info, body, anime_id
+                    )
+                    anime_info.episodes = episodes
+                    logger.info(
+                        "Anime info fetched | episodes={count}", count=len(episodes)
+                    )
+                    return anime_info
+                except (ConnectionError, ScraperBlockedError, ScraperParseError) as e:
+                    self._forget_episode_source(anime_id, e)
+
             url = f"{BASE_URL}/{anime_id}"
-            browser = await self._get_browser()
-            async with await browser.new_page() as page:
+            async with self._browser_page() as page:
                 return await self._get_anime_info_with_episodes(page, url, anime_id)
 
         try:
-            html_text = await self.http.get(anime_id)
+            body = await self.http.get_bytes(anime_id)
         except ConnectionError as e:
             raise ScraperTimeoutError(str(e)) from e
 
-        return self.parser.parse_anime_info(html_text, anime_id)
+        return await self._parse(self.parser.parse_anime_info, body, anime_id)
 
     async def _get_anime_info_with_episodes(
         self, page, url: str, anime_id: str
@@ -150,54 +255,135 @@ class JKAnimeScraper(BaseScraper):
         await page.wait_for_selector("div.col-lg-2.picd")
 
         html_text = await page.content()
-        anime_info = self.parser.parse_anime_info(html_text, anime_id)
+        anime_info = await self._parse(
+            self.parser.parse_anime_info, html_text, anime_id
+        )
 
-        episodes = await self._extract_all_episodes(page, anime_id)
+        episodes = await self._episodes_from_source(page, anime_id)
+        if episodes is None:
+            episodes = await self._extract_all_episodes(page, url, anime_id)
         anime_info.episodes = list(episodes)
 
         logger.info("Anime info fetched | episodes={count}", count=len(episodes))
         return anime_info
 
-    async def _extract_all_episodes(self, page, anime_id: str) -> list[EpisodeInfo]:
-        """Extract all episodes by navigating pages."""
+    async def _extract_all_episodes(
+        self, page, url: str, anime_id: str
+    ) -> list[EpisodeInfo]:
+        """Extract all episodes by navigating pages.
 
-        await page.wait_for_selector("div.nice-select.anime__pagination ul > li")
-        select = await page.query_selector("div.nice-select.anime__pagination")
+        Pagination indexes are dealt round-robin to ``page`` and up to
+        ``pagination_concurrency - 1`` more pooled tabs.
+        """
 
-        paged_episodes = await select.query_selector_all("ul.list > li")
+        await page.wait_for_selector(PAGINATION_ITEMS_SELECTOR)
+        select = await page.query_selector(PAGINATION_SELECTOR)
+        total = len(await select.query_selector_all("ul.list > li"))
 
-        logger.info(
-            "Starting episode extraction | total_pages={total}",
-            total=len(paged_episodes),
+        logger.info("Starting episode extraction | total_pages={total}", total=total)
+
+        retry = PAGINATION_RETRY.start(
+            max_retries=max(int(total * 1.5), 5),
+            name="jkanime_pagination",
         )
+        async with self._pagination_tabs(page, url, total) as tabs:
+            read = await asyncio.gather(
+                *(
+                    self._read_pagination_pages(
+                        tab, url, anime_id, list(range(i, total, len(tabs))), retry
+                    )
+                    for i, tab in enumerate(tabs)
+                )
+            )
 
+        pages = {idx: episodes for result in read for idx, episodes in result.items()}
         all_episodes = []
-        idx = 0
-        retries = max(int(len(paged_episodes) * 1.5), 5)
-        is_retry = False
+        seen = set()
+        for idx in sorted(pages):
+            for episode in pages[idx]:
+                if episode.number not in seen:
+                    seen.add(episode.number)
+                    all_episodes.append(episode)
 
-        while idx < len(paged_episodes):
-            if retries <= 0:
-                logger.warning("Retries exceeded, breaking")
-                break
+        logger.info("All episodes extracted | count={count}", count=len(all_episodes))
+        return all_episodes
 
-            if is_retry:
-                await page.wait_for_selector(
-                    "div.nice-select.anime__pagination ul > li"
-                )
-                select = await page.query_selector("div.nice-select.anime__pagination")
-                paged_episodes = await select.query_selector_all("ul.list > li")
-                is_retry = False
+    @asynccontextmanager
+    async def _pagination_tabs(
+        self, page, url: str, total_pages: int
+    ) -> AsyncIterator[list]:
+        """page plus the extra pooled tabs pagination may run on.
 
-                if idx >= len(paged_episodes):
-                    logger.warning(
-                        "Index out of bounds after retry | idx={idx} | pages={pages}",
-                        idx=idx,
-                        pages=len(paged_episodes),
+        Extra tabs are only taken while the page pool hands them out
+        within ``PAGINATION_TAB_TIMEOUT``, so a busy pool means fewer tabs
+        rather than a wait.
+        """
+        browser = await self._get_browser()
+        wanted = min(
+            self.pagination_concurrency,
+            total_pages,
+            browser.max_pages * browser.max_contexts,
+        )
+        async with AsyncExitStack() as stack:
+            extra = []
+            while len(extra) + 1 < wanted:
+                try:
+                    tab = await stack.enter_async_context(
+                        self._browser_page(timeout=PAGINATION_TAB_TIMEOUT / 1000)
                     )
+                except asyncio.TimeoutError:
                     break
+                extra.append(tab)
+
+            opened = await asyncio.gather(
+                *(tab.goto(url, wait_until="domcontentloaded") for tab in extra),
+                return_exceptions=True,
+            )
+            tabs = [page] + [
+                tab
+                for tab, result in zip(extra, opened)
+                if not isinstance(result, Exception)
+            ]
+            logger.debug(
+                "Pagination tabs ready | wanted={wanted} tabs={tabs}",
+                wanted=wanted,
+                tabs=len(tabs),
+            )
+            yield tabs
 
-            paged_episode = paged_episodes[idx]
+    async def _read_pagination_pages(
+        self,
+        page,
+        url: str,
+        anime_id: str,
+        indexes: list[int],
+        retry,
+        previous_last: Optional[int] = None,
+    ) -> dict[int, list[EpisodeInfo]]:
+        """Read the pagination pages at indexes on one tab, in order.
+
+        A page that comes back empty, or ending on the same episode as the
+        page read before it on this tab, is clicked again after a backoff
+        drawn from retry. Indexes left when retries run out are missing
+        from the result.
+        """
+        pages: dict[int, list[EpisodeInfo]] = {}
+        pos = 0
+
+        while pos < len(indexes):
+            idx = indexes[pos]
+
+            await page.wait_for_selector(PAGINATION_ITEMS_SELECTOR)
+            select = await page.query_selector(PAGINATION_SELECTOR)
+            paged_episodes = await select.query_selector_all("ul.list > li")
+
+            if idx >= len(paged_episodes):
+                logger.warning(
+                    "Index out of bounds | idx={idx} | pages={pages}",
+                    idx=idx,
+                    pages=len(paged_episodes),
+                )
+                break
 
             logger.info(
                 "Processing page {idx} of {total}",
@@ -212,16 +398,27 @@ class JKAnimeScraper(BaseScraper):
                 timeout=3000,
                 debug_name=f"select_reclick_{idx + 1}",
             )
-
             await self._safe_click(
-                paged_episode,
+                paged_episodes[idx],
                 page,
                 timeout=2000,
                 debug_name=f"page_click_{idx + 1}",
             )
 
-            html_text = await page.content()
-            new_episodes = self.parser.parse_episode_page(html_text, anime_id)
+            if page.url != url:
+                logger.warning(
+                    "Page URL changed, retrying | retries_left={retries}",
+                    retries=retry.max_retries - retry.retries,
+                )
+                await page.goto(url)
+                if not await retry.backoff():
+                    logger.warning("Retries exceeded, breaking")
+                    break
+                continue
+
+            new_episodes = self.parser.episodes_from_cards(
+                await EPISODE_CARDS(page), anime_id
+            )
 
             logger.info(
                 "Extracted episodes from page | count={count} | last={last}",
@@ -231,29 +428,183 @@ class JKAnimeScraper(BaseScraper):
 
             if not new_episodes:
                 logger.warning("[ITER_{idx}] EMPTY - Continuing", idx=idx + 1)
+                if not await retry.backoff():
+                    logger.warning("Retries exceeded, breaking")
+                    break
+                continue
 
-                retries -= 1
-                is_retry = True
+            if new_episodes[-1].number == previous_last:
+                logger.warning(
+                    "[ITER_{idx}] SAME episodes detected - Continuing",
+                    idx=idx + 1,
+                )
+                if not await retry.backoff():
+                    logger.warning("Retries exceeded, breaking")
+                    break
                 continue
 
-            if idx > 0 and all_episodes:
-                last_extracted = all_episodes[-1].number
-                last_page_episode = new_episodes[-1].number
-                if last_page_episode == last_extracted:
-                    logger.warning(
-                        "[ITER_{idx}] SAME episodes detected - Continuing",
-                        idx=idx + 1,
-                    )
+            pages[idx] = new_episodes
+            previous_last = new_episodes[-1].number
+            pos += 1
 
-                    retries -= 1
-                    is_retry = True
-                    continue
+        return pages
 
-            all_episodes.extend(new_episodes)
-            idx += 1
+    async def _episodes_from_source(
+        self, page, anime_id: str
+    ) -> Optional[list[EpisodeInfo]]:
+        """All episodes fetched from the pagination source over HTTP.
 
-        logger.info("All episodes extracted | count={count}", count=len(all_episodes))
-        return all_episodes
+        None when direct pagination is off or the source cannot be used;
+        callers then walk the pagination in the browser.
+        """
+        if not self.direct_pagination:
+            return None
+        try:
+            async with measure("jkanime.episode_source"):
+                source = await self._discover_episode_source(page, anime_id)
+                if source is None:
+                    return None
+                episodes = await self._fetch_source_episodes(source, anime_id)
+        except (
+            ConnectionError,
+            ScraperBlockedError,
+            ScraperParseError,
+            PlaywrightError,
+        ) as e:
+            logger.warning(
+                "Episode source failed, clicking through pages | error={error}",
+                error=str(e),
+            )
+            return None
+        self._episode_sources[anime_id] = source
+        return episodes
+
+    async def _discover_episode_source(
+        self, page, anime_id: str
+    ) -> Optional[EpisodeSource]:
+        """Open the second episode page once and template the request it made.
+
+        Only a site call carrying the page number whose answer parses as
+        episodes is taken; analytics and other site calls are ignored.
+        """
+        await page.wait_for_selector(PAGINATION_ITEMS_SELECTOR)
+        select = await page.query_selector(PAGINATION_SELECTOR)
+        paged_episodes = await select.query_selector_all("ul.list > li")
+        if len(paged_episodes) < 2:
+            # A single page is already on screen; nothing to discover.
+            return None
+
+        capture = AsyncBrowser.capture_url(page, is_episode_page_request)
+        try:
+            await self._safe_click(select, page, reclick=True, timeout=3000)
+            await self._safe_click(paged_episodes[1], page, timeout=2000)
+            await capture.wait(EPISODE_SOURCE_TIMEOUT / 1000)
+        finally:
+            capture.dispose()
+
+        request = capture.request
+        if request is None:
+            logger.warning("Pagination made no episode page request")
+            return None
+
+        response = await request.response()
+        if response is None or not await self._parse(
+            self.parser.parse_episode_source,
+            HtmlBody(await response.body()),
+            anime_id,
+        ):
+            logger.warning(
+                "Pagination request answered no episodes | url={url}",
+                url=request.url,
+            )
+            return None
+
+        source = EpisodeSource.from_request(
+            request.method,
+            request.url,
+            request.post_data,
+            await request.all_headers(),
+            page=2,
+            total_pages=len(paged_episodes),
+        )
+        if source is None:
+            logger.warning(
+                "Page number not found in pagination request | url={url}",
+                url=request.url,
+            )
+            return None
+
+        # The source may check the session and CSRF cookies of the page.
+        self.http.set_clearance(await Clearance.from_page(page))
+        logger.debug(
+            "Episode source discovered | method={method} url={url} pages={pages}",
+            method=source.method,
+            url=source.url,
+            pages=source.total_pages,
+        )
+        return source
+
+    async def _fetch_source_page(
+        self, source: EpisodeSource, anime_id: str, page: int
+    ) -> list[EpisodeInfo]:
+        url, data = source.request_for(page)
+        # Listing pages only reads, so replayed POSTs are safe to retry.
+        body = await self.http.request(
+            source.method, url, data, source.headers, retry=True
+        )
+        return await self._parse(self.parser.parse_episode_source, body, anime_id)
+
+    async def _fetch_source_episodes(
+        self, source: EpisodeSource, anime_id: str
+    ) -> list[EpisodeInfo]:
+        """Fetch every page of source concurrently.
+
+        Pages published since the source was discovered are picked up by
+        following a full last page until a short or empty one.
+        """
+        pages = list(
+            await asyncio.gather(
+                *(
+                    self._fetch_source_page(source, anime_id, n)
+                    for n in range(1, source.total_pages + 1)
+                )
+            )
+        )
+        if not pages[0]:
+            raise ScraperParseError("Episode source returned no episodes")
+
+        page_size = len(pages[0])
+        while len(pages[-1]) >= page_size:
+            extra = await self._fetch_source_page(source, anime_id, len(pages) + 1)
+            # Past the end the source repeats a page or returns an empty one.
+            if not extra or min(e.number for e in extra) <= max(
+                e.number for e in pages[-1]
+            ):
+                break
+            pages.append(extra)
+        source.total_pages = len(pages)
+
+        episodes = [episode for page in pages for episode in page]
+        numbers = {episode.number for episode in episodes}
+        if len(numbers) != len(episodes):
+            # The page number did not select the page; the template is wrong.
+            raise ScraperParseError("Episode source pages overlap")
+
+        episodes.sort(key=lambda e: e.number)
+        logger.info(
+            "Episodes fetched from source | pages={pages} count={count}",
+            pages=len(pages),
+            count=len(episodes),
+        )
+        return episodes
+
+    def _forget_episode_source(self, anime_id: str, error: Exception) -> None:
+        logger.warning(
+            "Cached episode source failed | anime_id={anime_id} error={error}",
+            anime_id=anime_id,
+            error=str(error),
+        )
+        self._episode_sources.pop(anime_id, None)
 
     async def get_new_episodes(
         self,
@@ -268,14 +619,35 @@ class JKAnimeScraper(BaseScraper):
             last_episode_number=last_episode_number,
         )
 
+        source = self._episode_sources.get(anime_id)
+        if source is not None:
+            try:
+                episodes = await self._fetch_source_episodes(source, anime_id)
+                return self._newer_episodes(episodes, last_episode_number)
+            except (ConnectionError, ScraperBlockedError, ScraperParseError) as e:
+                self._forget_episode_source(anime_id, e)
+
         url = f"{BASE_URL}/{anime_id}"
 
-        browser = await self._get_browser()
-        async with await browser.new_page() as page:
+        async with self._browser_page() as page:
+            if self.direct_pagination:
+                await page.goto(url, wait_until="domcontentloaded")
+                episodes = await self._episodes_from_source(page, anime_id)
+                if episodes is not None:
+                    return self._newer_episodes(episodes, last_episode_number)
             return await self._get_new_episodes_internal(
                 page, url, anime_id, last_episode_number
             )
 
+    @staticmethod
+    def _newer_episodes(
+        episodes: list[EpisodeInfo], last_episode_number: int
+    ) -> list[EpisodeInfo]:
+        """Episodes after last_episode_number, newest first."""
+        newer = [e for e in reversed(episodes) if e.number > last_episode_number]
+        logger.info("New episodes fetched | count={count}", count=len(newer))
+        return newer
+
     async def _get_new_episodes_internal(
         self,
         page,
@@ -283,24 +655,28 @@ class JKAnimeScraper(BaseScraper):
         anime_id: str,
         last_episode_number: int,
     ) -> list[EpisodeInfo]:
-        """Internal method for getting new episodes."""
+        """Internal method for getting new episodes.
+
+        Pages are read from the last one backwards, one batch of tabs at a
+        time, until a page holds an episode that is not new.
+        """
 
         await page.goto(url)
-        await page.wait_for_selector("div.nice-select.anime__pagination ul > li")
+        await page.wait_for_selector(PAGINATION_ITEMS_SELECTOR)
 
-        select = await page.query_selector("div.nice-select.anime__pagination")
-        paged_episodes = await select.query_selector_all("ul.list > li")
+        select = await page.query_selector(PAGINATION_SELECTOR)
+        total = len(await select.query_selector_all("ul.list > li"))
 
-        logger.debug(
-            "Found {count} episode pages",
-            count=len(paged_episodes),
-        )
+        logger.debug("Found {count} episode pages", count=total)
 
         all_episodes = []
-        idx = len(paged_episodes) - 1
-        retries = max(int(len(paged_episodes) * 1.5), 5)
+        seen = set()
+        idx = total - 1
+        retry = PAGINATION_RETRY.start(
+            max_retries=max(int(total * 1.5), 5),
+            name="jkanime_new_episodes",
+        )
         finished = False
-        is_retry = False
 
         logger.debug(
             "Starting new episode extraction | start_page={page} | last_episode={last}",
@@ -308,98 +684,47 @@ class JKAnimeScraper(BaseScraper):
             last=last_episode_number,
         )
 
-        while idx >= 0:
-            if retries <= 0:
-                logger.warning("Retries exceeded, breaking")
-                break
-
-            if is_retry:
-                logger.debug("Retrying, fetching fresh select elements")
-                await page.wait_for_selector(
-                    "div.nice-select.anime__pagination ul > li"
-                )
-                select = await page.query_selector("div.nice-select.anime__pagination")
-                paged_episodes = await select.query_selector_all("ul.list > li")
-                is_retry = False
-
-            logger.debug(
-                "Processing page {idx} of {total}",
-                idx=idx + 1,
-                total=len(paged_episodes),
-            )
+        async with self._pagination_tabs(page, url, total) as tabs:
+            tab_last: list[Optional[int]] = [None] * len(tabs)
 
-            paged_episode = paged_episodes[idx]
-            await self._safe_click(
-                select,
-                page,
-                reclick=True,
-                timeout=3000,
-            )
-            await self._safe_click(
-                paged_episode,
-                page,
-                timeout=2000,
-            )
-
-            page_url = page.url
-            if page_url != url:
-                logger.warning(
-                    "Page URL changed, retrying | retries_left={retries}",
-                    retries=retries,
-                )
-                await page.close()
-                page = await page.context.new_page()
-                await page.goto(url)
-                retries -= 1
-                is_retry = True
-                continue
-
-            html_text = await page.content()
-            new_episodes = self.parser.parse_episode_page(html_text, anime_id)
-
-            logger.debug(
-                "Extracted episodes from page | count={count} | last_episode={last}",
-                count=len(new_episodes),
-                last=new_episodes[-1].number if new_episodes else None,
-            )
-
-            if not new_episodes:
-                logger.warning(
-                    "Empty episodes page detected, retrying | retries_left={retries}",
-                    retries=retries,
+            while idx >= 0 and not finished:
+                batch = list(range(idx, max(idx - len(tabs), -1), -1))
+                read = await asyncio.gather(
+                    *(
+                        self._read_pagination_pages(
+                            tabs[t], url, anime_id, [i], retry, tab_last[t]
+                        )
+                        for t, i in enumerate(batch)
+                    )
                 )
-                retries -= 1
-                is_retry = True
-                continue
-
-            new_episodes_found = 0
-            for episode in reversed(new_episodes):
-                if episode.number <= last_episode_number:
-                    finished = True
-                    break
-                all_episodes.append(episode)
-                new_episodes_found += 1
 
-            logger.debug(
-                "New episodes on page | count={count} | last_extracted={last}",
-                count=new_episodes_found,
-                last=all_episodes[-1].number if all_episodes else None,
-            )
-
-            if idx > 0 and all_episodes:
-                if new_episodes and new_episodes[-1].number == all_episodes[-1].number:
-                    logger.warning(
-                        "Same paged_episode detected, retrying | retries_left={retries}",
-                        retries=retries,
+                for t, i in enumerate(batch):
+                    new_episodes = read[t].get(i)
+                    if new_episodes is None:
+                        # Retries ran out on this page; stop like a sequential walk.
+                        finished = True
+                        break
+                    tab_last[t] = new_episodes[-1].number
+
+                    new_episodes_found = 0
+                    for episode in reversed(new_episodes):
+                        if episode.number <= last_episode_number:
+                            finished = True
+                            break
+                        if episode.number not in seen:
+                            seen.add(episode.number)
+                            all_episodes.append(episode)
+                            new_episodes_found += 1
+
+                    logger.debug(
+                        "New episodes on page | page={page} count={count}",
+                        page=i + 1,
+                        count=new_episodes_found,
                     )
-                    retries -= 1
-                    is_retry = True
-                    continue
+                    if finished:
+                        break
 
-            idx -= 1
-
-            if finished:
-                break
+                idx -= len(batch)
 
         logger.info("New episodes fetched | count={count}", count=len(all_episodes))
         return all_episodes
@@ -417,8 +742,24 @@ class JKAnimeScraper(BaseScraper):
             episode_number=episode_number,
         )
 
-        browser = await self._get_browser()
-        async with await browser.new_page() as page:
+        if self.hybrid:
+            try:
+                body = await self._get_bytes_with_clearance(
+                    f"{anime_id}/{episode_number}"
+                )
+                download_links_data = await self._parse(
+                    self.parser.parse_table_download_links, body, episode_number
+                )
+                return self._build_table_download_links(
+                    download_links_data, episode_number
+                )
+            except (ScraperBlockedError, ConnectionError) as e:
+                logger.warning(
+                    "HTTP fetch failed, using the browser | error={error}",
+                    error=str(e),
+                )
+
+        async with self._browser_page() as page:
             return await self._get_table_download_links_internal(
                 page, anime_id, episode_number
             )
@@ -434,10 +775,15 @@ class JKAnimeScraper(BaseScraper):
         url = f"{BASE_URL}/{anime_id}/{episode_number}"
         await page.goto(url)
 
-        html = await page.content()
-        download_links_data = self.parser.parse_table_download_links(
-            html, episode_number
+        download_links_data = self.parser.download_links_from_rows(
+            await DOWNLOAD_ROWS(page)
         )
+        return self._build_table_download_links(download_links_data, episode_number)
+
+    def _build_table_download_links(
+        self, download_links_data: list[dict], episode_number: int
+    ) -> EpisodeDownloadInfo:
+        """Build the table download links of an episode page."""
         all_download_links: list[DownloadLinkInfo] = [
             DownloadLinkInfo(
                 server=link["server"],
@@ -472,12 +818,98 @@ class JKAnimeScraper(BaseScraper):
             episode_number=episode_number,
         )
 
-        browser = await self._get_browser()
-        async with await browser.new_page() as page:
+        if self.hybrid:
+            try:
+                async with measure("jkanime.iframe_links.http"):
+                    return await self._get_iframe_download_links_http(
+                        anime_id, episode_number
+                    )
+            except (ConnectionError, ScraperBlockedError, ScraperParseError) as e:
+                logger.warning(
+                    "HTTP iframe links failed, using the browser | error={error}",
+                    error=str(e),
+                )
+
+        async with (
+            measure("jkanime.iframe_links.browser"),
+            self._browser_page() as page,
+        ):
             return await self._get_iframe_download_links_internal(
                 page, anime_id, episode_number
             )
 
+    async def _get_iframe_download_links_http(
+        self, anime_id: str, episode_number: int
+    ) -> EpisodeDownloadInfo:
+        """Resolve the player of every server concurrently over HTTP.
+
+        Network failures on the episode page raise ConnectionError,
+        challenges raise ScraperBlockedError and a page without player
+        sources raises ScraperParseError; any other failure only leaves
+        that server's URL empty and a player without a link is left out,
+        as in the browser flow.
+        """
+        endpoint = f"{anime_id}/{episode_number}"
+        body = await self._get_bytes_with_clearance(endpoint)
+
+        sources = await self._parse(self.parser.parse_player_sources, body)
+        if not sources:
+            raise ScraperParseError(f"No player sources in {endpoint}")
+        players = {source["server"]: source["url"] for source in sources}
+
+        servers = [name for name in self._player_resolvers if name in players]
+        for name in self._player_resolvers:
+            if name not in players:
+                logger.warning(
+                    "Server not found in page | server={server}", server=name
+                )
+
+        referer = self.http.build_url(endpoint)
+        results = await asyncio.gather(
+            *(self._player_resolvers[name](players[name], referer) for name in servers),
+            return_exceptions=True,
+        )
+
+        download_links: list[DownloadLinkInfo] = []
+        for name, result in zip(servers, results):
+            if isinstance(result, ScraperBlockedError):
+                raise result
+            if isinstance(result, Exception):
+                logger.warning(
+                    "Failed to get link for server | server={server} error={error}",
+                    server=name,
+                    error=str(result),
+                )
+                download_links.append(DownloadLinkInfo(server=name, url=None))
+            elif result is not None:
+                download_links.append(DownloadLinkInfo(server=name, url=result))
+
+        logger.info(
+            "Iframe download links fetched | count={count}",
+            count=len(download_links),
+        )
+        return EpisodeDownloadInfo(
+            episode_number=episode_number,
+            download_links=download_links,
+        )
+
+    async def _get_player_document(self, player_url: str, referer: str):
+        """GET a jkplayer document the way the episode page's iframe does."""
+        return await self.http.request("GET", player_url, headers={"Referer": referer})
+
+    async def _resolve_magi_player(self, player_url: str, referer: str) -> str | None:
+        """Video URL of a Magi player document."""
+        body = await self._get_player_document(player_url, referer)
+        return await self._parse(self.parser.parse_magi_source, body)
+
+    async def _resolve_streamwish_player(
+        self, player_url: str, referer: str
+    ) -> str | None:
+        """Streamwish download page of a Streamwish player document."""
+        body = await self._get_player_document(player_url, referer)
+        iframe_src = await self._parse(self.parser.parse_streamwish_embed, body)
+        return streamwish_download_url(iframe_src) if iframe_src else None
+
     async def _get_iframe_download_links_internal(
         self,
         page,
@@ -506,27 +938,35 @@ class JKAnimeScraper(BaseScraper):
                 )
                 continue
 
-            await server_link.click()
-            await page.wait_for_timeout(3000)
-
+            # Listen before clicking: the link may be requested right away.
+            capture = UrlCapture(page, self._iframe_link_patterns[server_name])
             try:
-                download_url = await link_getter(page)
-                if download_url is not None:
-                    download_links.append(
-                        DownloadLinkInfo(server=server_name, url=download_url)
-                    )
-                    logger.info(
-                        "Got iframe URL | server={server} url={url}",
+                async with measure("jkanime.player_switch"):
+                    await self._switch_player(page, server_link)
+
+                try:
+                    async with measure(f"jkanime.iframe_link.{server_name}"):
+                        download_url = await link_getter(page, capture)
+                    if download_url is not None:
+                        download_links.append(
+                            DownloadLinkInfo(server=server_name, url=download_url)
+                        )
+                        logger.info(
+                            "Got iframe URL | server={server} url={url}",
+                            server=server_name,
+                            url=download_url,
+                        )
+                except Exception as e:
+                    logger.warning(
+                        "Failed to get link for server | server={server} error={error}",
                         server=server_name,
-                        url=download_url,
+                        error=str(e),
                     )
-            except Exception as e:
-                logger.warning(
-                    "Failed to get link for server | server={server} error={error}",
-                    server=server_name,
-                    error=str(e),
-                )
-                download_links.append(DownloadLinkInfo(server=server_name, url=None))
+                    download_links.append(
+                        DownloadLinkInfo(server=server_name, url=None)
+                    )
+            finally:
+                capture.dispose()
 
         logger.info(
             "Iframe download links fetched | count={count}",
@@ -537,73 +977,74 @@ class JKAnimeScraper(BaseScraper):
             download_links=download_links,
         )
 
-    async def _get_magi_link(self, page) -> str | None:
-        """Get Magi server link."""
-        logger.debug("Getting Magi link")
-
-        video_box_iframe = await page.query_selector("#video_box iframe")
-        if not video_box_iframe:
-            logger.warning("Video box iframe not found")
-            return None
+    async def _switch_player(self, page, server_link) -> None:
+        """Click a server and wait until the player iframe loads its page."""
+        frame_element = await page.query_selector("#video_box iframe")
+        previous = (
+            await frame_element.evaluate("frame => frame.src") if frame_element else ""
+        )
 
-        src = await video_box_iframe.get_attribute("src")
-        logger.debug("Video box iframe src | src={src}", src=src)
+        await server_link.click()
+        try:
+            await page.wait_for_function(
+                PLAYER_SWITCHED_JS, arg=previous, timeout=PLAYER_SWITCH_TIMEOUT
+            )
+        except PlaywrightTimeoutError:
+            # The server was already the one on screen.
+            logger.debug("Player iframe unchanged after click")
 
+    def _jkplayer_frame(self, page):
+        """Get the JKPlayer frame inside the video box, if loaded."""
         frame = page.frame(url=lambda u: "jkanime.net/jkplayer" in u)
         if not frame:
             logger.warning("JKPlayer frame not found")
-            return None
+        return frame
 
-        logger.debug("Found jkanime frame, waiting for content...")
+    async def _get_magi_link(self, page, capture: UrlCapture) -> str | None:
+        """Get Magi server link."""
+        logger.debug("Getting Magi link")
 
-        try:
+        async def from_dom() -> str | None:
+            frame = self._jkplayer_frame(page)
+            if not frame:
+                return None
             magi_video = await frame.wait_for_selector(
-                "video#video_html5_api", timeout=5000
+                "video#video_html5_api", timeout=MAGI_TIMEOUT
             )
-            if magi_video:
-                source = await magi_video.query_selector("source")
-                if source:
-                    download_url = await source.get_attribute("src")
-                    logger.debug("Found Magi source | src={src}", src=download_url)
-                    return download_url
-        except Exception:
-            logger.warning("Magi video not found")
+            source = await magi_video.query_selector("source")
+            return await source.get_attribute("src") if source else None
 
-        return None
+        download_url = await first_result(
+            capture.future, from_dom(), timeout=MAGI_TIMEOUT / 1000
+        )
+        if download_url is None:
+            logger.warning("Magi video not found")
+        else:
+            logger.debug("Found Magi source | src={src}", src=download_url)
+        return download_url
 
-    async def _get_streamwish_link(self, page) -> str | None:
+    async def _get_streamwish_link(self, page, capture: UrlCapture) -> str | None:
         """Get Streamwish server link."""
         logger.debug("Getting Streamwish link")
 
-        video_box_iframe = await page.query_selector("#video_box iframe")
-        if not video_box_iframe:
-            logger.warning("Video box iframe not found")
-            return None
-
-        src = await video_box_iframe.get_attribute("src")
-        logger.debug("Video box iframe src | src={src}", src=src)
-
-        frame = page.frame(url=lambda u: "jkanime.net/jkplayer" in u)
-        if not frame:
-            logger.warning("JKPlayer frame not found")
-            return None
-
-        logger.debug("Found jkanime frame, waiting for content...")
-
-        try:
+        async def from_dom() -> str | None:
+            frame = self._jkplayer_frame(page)
+            if not frame:
+                return None
             streamwish_iframe = await frame.wait_for_selector(
-                'iframe[src*="sfastwish.com"]', timeout=5000
+                STREAMWISH_IFRAME_SELECTOR, timeout=STREAMWISH_TIMEOUT
             )
-            if streamwish_iframe:
-                iframe_src = await streamwish_iframe.get_attribute("src")
-                video_id = iframe_src.split("/")[-1]
-                download_url = f"{SW_DOWNLOAD_URL}/{video_id}"
-                logger.debug("Found Streamwish iframe | src={src}", src=iframe_src)
-                return download_url
-        except Exception:
+            return await streamwish_iframe.get_attribute("src")
+
+        iframe_src = await first_result(
+            capture.future, from_dom(), timeout=STREAMWISH_TIMEOUT / 1000
+        )
+        if iframe_src is None:
             logger.warning("Streamwish iframe not found")
+            return None
 
-        return None
+        logger.debug("Found Streamwish iframe | src={src}", src=iframe_src)
+        return streamwish_download_url(iframe_src)
 
     async def get_file_download_link(
         self,
@@ -622,84 +1063,7 @@ class JKAnimeScraper(BaseScraper):
 
         logger.info("Getting file download link | server={server}", server=server)
 
-        if server not in SUPPORTED_SERVERS:
-            logger.error(
-                "Server not supported | server={server} supported={supported}",
-                server=server,
-                supported=SUPPORTED_SERVERS,
-            )
-            return None
-
-        browser = await self._get_browser()
-        async with await browser.new_page() as page:
-            return await self._file_link_getters[server](page, url)
-
-    async def _get_streamwish_file_link(self, page, url: str) -> str | None:
-        """Get Streamwish file download link."""
-
-        logger.debug("Getting Streamwish file link")
-
-        await page.goto(url)
-        current_url = page.url
-        video_id = current_url.split("/")[-1]
-
-        try_urls = [
-            f"{SW_DOWNLOAD_URL}/{video_id}_h",
-            f"{SW_DOWNLOAD_URL}/{video_id}_n",
-            f"{SW_DOWNLOAD_URL}/{video_id}_l",
-        ]
-
-        for try_url in try_urls:
-            retries = 3
-            for _ in range(retries):
-                try:
-                    await page.goto(try_url)
-                    download_button = await page.wait_for_selector(
-                        "form#F1 button", timeout=3000
-                    )
-                    await download_button.click(delay=1000)
-
-                    try:
-                        error_label = await page.wait_for_selector(
-                            "div.text-danger.text-center.mb-5",
-                            timeout=SW_TIMEOUT,
-                        )
-                        text_label = await error_label.inner_text()
-                        if text_label.strip() == "Downloads disabled 620":
-                            continue
-                    except PlaywrightTimeoutError:
-                        pass
-
-                    download_link = await page.wait_for_selector(
-                        "div.text-center a.btn", timeout=SW_TIMEOUT
-                    )
-                    return await download_link.get_attribute("href")
-                except Exception:
-                    continue
-
-        return None
-
-    async def _get_mediafire_file_link(self, page, url: str) -> str | None:
-        """Get Mediafire file download link."""
-
-        logger.debug("Getting Mediafire file link")
-
-        await page.goto(url)
-
-        try:
-            download_button = await page.wait_for_selector(
-                "a#downloadButton", timeout=MEDIAFIRE_TIMEOUT
-            )
-        except PlaywrightTimeoutError:
-            return None
-
-        async with page.expect_download() as download_info:
-            await download_button.click()
-
-        download = await download_info.value
-        real_url = download.url
-        await download.cancel()
-        return real_url
+        return await self._resolve_file_link(server, url)
 
     async def aclose(self) -> None:
         """Close resources."""
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+from ani_scrapy.core.exceptions import ScraperParseError
+from ani_scrapy.core.schemas import _AnimeType, _RelatedType
+from ani_scrapy.providers.animeav1.devalue import find_literal, parse_literal
+from ani_scrapy.providers.animeav1.parser import AnimeAV1Parser
+
+
+def sveltekit_page(data: str) -> str:
+    return f"""<html><body>
+    <div class="relative"><img class="aspect-poster" src="https://cdn.example/p.jpg"></div>
+    <script>
+      {{
+        __sveltekit_abc = {{ base: new URL(".", location).pathname.slice(0, -1) }};
+        const element = document.currentScript.parentElement;
+        Promise.all([import("./start.js"), import("./app.js")]).then(([kit, app]) => {{
+          kit.start(app, element, {{
+            node_ids: [0, 2],
+            data: [null, {{type:"data",data:{data},uses:{{params:["slug"]}}}}],
+            form: null,
+            error: null
+          }});
+        }});
+      }}
+    </script></body></html>"""
+
+
+MEDIA = (
+    '{media:{id:42,title:"Dr. Stone: \\"Science\\" Future",slug:"dr-stone",'
+    'synopsis:"Senku {rebuilds} the world, \\u00e9 and [brackets]",'
+    'category:{id:1,name:"TV Anime"},'
+    'genres:[{id:1,name:"Acción",slug:"accion"},{id:2,name:"Sci-Fi",slug:"sci-fi"}],'
+    "episodes:[{id:7,number:1},{id:8,number:2},{id:9,number:3}],"
+    'relations:[{id:3,type:2,destination:{id:5,slug:"dr-stone-s3",title:"Dr. Stone 3"}}],'
+    "startDate:new Date(1700000000000),endDate:void 0,score:-1.5e0}}"
+)
+
+
+def test_parse_literal_handles_devalue_values() -> None:
+    value = parse_literal(
+        '{a:1,"b":[1,,3],c:void 0,d:new Date("2024-01-01"),e:-Infinity,'
+        "f:'it\\'s',g:new Map([[\"k\",1]]),h:x.y(1),i:true}"
+    )
+
+    assert value == {
+        "a": 1,
+        "b": [1, None, 3],
+        "c": None,
+        "d": "2024-01-01",
+        "e": float("-inf"),
+        "f": "it's",
+        "g": {"k": 1},
+        "h": None,
+        "i": True,
+    }
+
+
+def test_find_literal_skips_keys_inside_strings() -> None:
+    source = '{note:",media:1",media:{id:2}}'
+
+    assert find_literal(source, "media") == {"id": 2}
+    with pytest.raises(KeyError):
+        find_literal(source, "downloads")
+    with pytest.raises(ScraperParseError):
+        find_literal("{media:{id:1,title:", "media")
+
+
+def test_parse_anime_info_reads_media_literal() -> None:
+    anime = AnimeAV1Parser().parse_anime_info(sveltekit_page(MEDIA), "dr-stone")
+
+    assert anime.title == 'Dr. Stone: "Science" Future'
+    assert anime.description == "Senku {rebuilds} the world, é and [brackets]"
+    assert anime.type == _AnimeType.TV
+    assert anime.poster == "https://cdn.example/p.jpg"
+    assert anime.genres == ["Acción", "Sci-Fi"]
+    assert [episode.number for episode in anime.episodes] == [1, 2, 3]
+    assert anime.related_info[0].id == "dr-stone-s3"
+    assert anime.related_info[0].type == _RelatedType.SEQUEL
+    assert anime.is_finished is False
+
+
+def test_parse_anime_info_has_no_episode_window() -> None:
+    episodes = ",".join(
+        f'{{id:{n},number:{n},title:"{"x" * 100}"}}' for n in range(1, 1101)
+    )
+    data = f'{{media:{{id:1,title:"Long",episodes:[{episodes}]}}}}'
+
+    anime = AnimeAV1Parser().parse_anime_info(sveltekit_page(data), "long")
+
+    assert len(anime.episodes) == 1100
+    assert anime.episodes[-1].number == 1100
+
+
+def test_parse_episode_links_and_schedule() -> None:
+    parser = AnimeAV1Parser()
+    episode_page = sveltekit_page(
+        '{episode:{number:1},downloads:{SUB:[{server:"MEGA",url:"https://mega.nz/a"}],'
+        'DUB:[{server:"PDrain",url:"https://pd/b"}]},'
+        'embeds:{SUB:[{server:"HLS",url:"https://hls/c"}]}}'
+    )
+    schedule_page = sveltekit_page(
+        '{media:[{slug:"one",latestEpisode:{number:3,createdAt:"2025-01-02T03:04:05+00:00"}},'
+        '{slug:"two",latestEpisode:null}]}'
+    )
+
+    downloads = parser.parse_episode_page(episode_page, "one")
+    embeds = parser.parse_episode_embeds(episode_page)
+    schedule = parser.parse_schedule(schedule_page)
+
+    assert [(link.server, link.url) for link in downloads] == [
+        ("MEGA", "https://mega.nz/a")
+    ]
+    assert [(link.server, link.url) for link in embeds] == [("HLS", "https://hls/c")]
+    assert schedule == {"one": datetime(2025, 1, 2, 3, 4, 5)}
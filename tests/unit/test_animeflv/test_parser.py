@@ -37,3 +37,18 @@ def test_parse_anime_info(animeflv_anime_html: str) -> None:
     assert anime.episodes[1].number == 2
     assert anime.episodes[2].number == 1
     assert "screenshots/12345" in anime.episodes[0].image_preview
+
+
+def test_parse_iframe_links_prefers_sub_and_dedupes() -> None:
+    html = """<html><body><script>
+    var anime_id = 4142;
+    var videos = {"LAT":[{"server":"yu","title":"YourUpload","code":"https://www.yourupload.com/embed/lat1"}],
+    "SUB":[{"server":"sw","title":"SW","code":"https://streamwish.to/e/abc?x=1"},
+    {"server":"yu","title":"YourUpload","code":"https://www.yourupload.com/embed/sub1"}]};
+    $(document).ready(function(){});
+    </script></body></html>"""
+    assert AnimeFLVParser.parse_iframe_links(html) == [
+        {"server": "SW", "url": "https://streamwish.to/e/abc?x=1"},
+        {"server": "YourUpload", "url": "https://www.yourupload.com/embed/sub1"},
+    ]
+    assert AnimeFLVParser.parse_iframe_links("<html></html>") == []
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from ani_scrapy.core.blocking import BlockRules, DomainMatcher, RequestBlocker
+
+
+class FakeRoute:
+    def __init__(self, url: str, resource_type: str) -> None:
+        self.request = SimpleNamespace(url=url, resource_type=resource_type)
+        self.outcome: str | None = None
+
+    async def abort(self, error_code: str | None = None) -> None:
+        self.outcome = "abort"
+
+    async def fallback(self) -> None:
+        self.outcome = "continue"
+
+
+def test_domain_matcher_matches_suffixes_on_label_boundaries() -> None:
+    matcher = DomainMatcher(["doubleclick.net", ".Example.com"])
+
+    assert matcher.matches("doubleclick.net")
+    assert matcher.matches("ad.g.doubleclick.net")
+    assert matcher.matches("cdn.example.com")
+    assert not matcher.matches("notdoubleclick.net")
+    assert not matcher.matches("example.org")
+    assert not matcher.matches("")
+
+
+@pytest.mark.asyncio
+async def test_blocker_applies_rules_and_counts() -> None:
+    blocker = RequestBlocker(
+        BlockRules(
+            block_types=frozenset({"image"}),
+            block_domains=frozenset({"ads.example"}),
+            allow_domains=frozenset({"cdn.site.com"}),
+        )
+    )
+    routes = [
+        FakeRoute("https://site.com/", "document"),
+        FakeRoute("https://site.com/a.png", "image"),
+        FakeRoute("https://x.ads.example/t.js", "script"),
+        FakeRoute("https://cdn.site.com/poster.jpg", "image"),
+    ]
+    for route in routes:
+        await blocker.handle(route)
+    blocker.on_response(SimpleNamespace(headers={"content-length": "1200"}))
+    blocker.on_response(SimpleNamespace(headers={}))
+
+    assert [r.outcome for r in routes] == ["continue", "abort", "abort", "continue"]
+    stats = blocker.stats()
+    assert (stats.allowed, stats.blocked, stats.allowed_bytes) == (2, 2, 1200)
+    assert stats.blocked_by_type == {"image": 1, "script": 1}
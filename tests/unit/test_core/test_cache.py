@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from ani_scrapy.core.cache import (
+    CacheEntry,
+    HttpCache,
+    MemoryCacheBackend,
+    SQLiteCacheBackend,
+)
+from ani_scrapy.core.http import AsyncHttpAdapter, SessionRegistry
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_evicts_least_recently_used() -> None:
+    backend = MemoryCacheBackend(max_bytes=10)
+    await backend.set("a", CacheEntry(body=b"aaaa"))
+    await backend.set("b", CacheEntry(body=b"bbbb"))
+    assert await backend.get("a") is not None
+
+    await backend.set("c", CacheEntry(body=b"cccc"))
+
+    assert await backend.get("b") is None
+    assert await backend.get("a") is not None
+    assert backend.current_bytes == 8
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backend_roundtrip(tmp_path: Path) -> None:
+    backend = SQLiteCacheBackend(tmp_path / "cache.db")
+    await backend.set("key", CacheEntry(body=b"<html></html>", etag='"v1"'))
+
+    entry = await backend.get("key")
+
+    assert entry is not None
+    assert entry.body == b"<html></html>"
+    assert entry.etag == '"v1"'
+    await backend.delete("key")
+    assert await backend.get("key") is None
+    await backend.close()
+
+
+@pytest.mark.asyncio
+async def test_adapter_revalidates_with_etag() -> None:
+    calls: list[str | None] = []
+
+    async def handler(request: web.Request) -> web.Response:
+        calls.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.Response(text="<html>v1</html>", headers={"ETag": '"v1"'})
+
+    app = web.Application()
+    app.router.add_get("/anime/naruto", handler)
+
+    async with TestServer(app) as server:
+        cache = HttpCache()
+        http = AsyncHttpAdapter(
+            base_url=str(server.make_url("/")),
+            cache=cache,
+            registry=SessionRegistry(),
+        )
+
+        assert await http.get("anime/naruto") == "<html>v1</html>"
+        assert await http.get("anime/naruto") == "<html>v1</html>"
+        await http.close()
+
+    assert calls == [None, '"v1"']
+    assert cache.stats.misses == 1
+    assert cache.stats.revalidated == 1
+    assert cache.stats.hits == 0
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import asyncio
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from ani_scrapy.core.capture import UrlCapture, first_result, is_media_request
+
+from .test_pagepool import FakePage
+
+
+def request(url: str, resource_type: str = "document") -> SimpleNamespace:
+    return SimpleNamespace(url=url, resource_type=resource_type)
+
+
+@pytest.mark.asyncio
+async def test_capture_resolves_on_first_match_and_stops_listening() -> None:
+    page = FakePage()
+    iframe = UrlCapture(page, "sfastwish.com")
+    manifest = UrlCapture(page, re.compile(r"master\.m3u8"))
+
+    page.emit("request", request("https://ads.example/pixel.gif", "image"))
+    page.emit("request", request("https://sfastwish.com/e/abc123"))
+    page.emit("request", request("https://sfastwish.com/e/other"))
+    page.emit("request", request("https://cdn.example/hls/master.m3u8", "xhr"))
+
+    assert await iframe.wait(1) == "https://sfastwish.com/e/abc123"
+    assert await manifest.wait(1) == "https://cdn.example/hls/master.m3u8"
+    assert page.listeners("request") == []
+
+
+@pytest.mark.asyncio
+async def test_capture_times_out_and_dispose_cancels() -> None:
+    page = FakePage()
+    capture = UrlCapture(page, is_media_request)
+
+    assert await capture.wait(0.01) is None
+    capture.dispose()
+    assert capture.future.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_first_result_skips_failures_and_none() -> None:
+    async def fails() -> str:
+        raise RuntimeError("frame detached")
+
+    async def nothing() -> None:
+        return None
+
+    async def slow() -> str:
+        await asyncio.sleep(0.01)
+        return "https://cdn.example/video.mp4"
+
+    never = asyncio.get_running_loop().create_future()
+
+    assert await first_result(fails(), nothing(), slow(), timeout=1) == (
+        "https://cdn.example/video.mp4"
+    )
+    assert await first_result(nothing(), never, timeout=0.01) is None
+    assert never.cancelled()
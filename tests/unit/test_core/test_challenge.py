@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from ani_scrapy.core.challenge import Clearance, is_challenge
+from ani_scrapy.core.exceptions import ScraperBlockedError
+from ani_scrapy.core.http import AsyncHttpAdapter, SessionRegistry
+
+CHALLENGE_PAGE = b"<html><head><title>Just a moment...</title></head></html>"
+
+
+def test_is_challenge_checks_header_status_and_markers() -> None:
+    assert is_challenge(403, {}, CHALLENGE_PAGE)
+    assert is_challenge(200, {"cf-mitigated": "challenge"})
+    assert not is_challenge(200, {}, CHALLENGE_PAGE)
+    assert not is_challenge(403, {}, b"<h1>Forbidden</h1>")
+
+
+@pytest.mark.asyncio
+async def test_adapter_raises_on_challenge_and_sends_clearance() -> None:
+    async def handler(request: web.Request) -> web.Response:
+        if request.cookies.get("cf_clearance") != "ok":
+            return web.Response(status=403, body=CHALLENGE_PAGE)
+        return web.Response(
+            text=request.headers["User-Agent"], content_type="text/html"
+        )
+
+    app = web.Application()
+    app.router.add_get("/episode", handler)
+
+    async with TestServer(app) as server:
+        http = AsyncHttpAdapter(
+            base_url=str(server.make_url("/")),
+            registry=SessionRegistry(),
+            coalesce=False,
+        )
+        with pytest.raises(ScraperBlockedError):
+            await http.get_bytes("episode")
+
+        http.set_clearance(Clearance("Browser/1.0", {"cf_clearance": "ok"}))
+        body = await http.get_bytes("episode")
+        await http.close()
+
+    assert body.text() == "Browser/1.0"
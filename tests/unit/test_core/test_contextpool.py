@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from ani_scrapy.core.contextpool import ContextPool
+
+from .test_pagepool import FakePage
+
+
+class FakeContext:
+    def __init__(self) -> None:
+        self.pages: list[FakePage] = []
+        self.closed = False
+
+    async def new_page(self) -> FakePage:
+        page = FakePage()
+        self.pages.append(page)
+        return page
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def navigate(page: FakePage, url: str) -> None:
+    page.url = url
+    page.emit("framenavigated", SimpleNamespace(parent_frame=None, url=url))
+
+
+def make_pool(**kwargs) -> tuple[ContextPool, list[FakeContext]]:
+    created: list[FakeContext] = []
+
+    async def factory() -> FakeContext:
+        context = FakeContext()
+        created.append(context)
+        return context
+
+    return ContextPool(factory, **kwargs), created
+
+
+@pytest.mark.asyncio
+async def test_pages_spread_over_least_loaded_contexts() -> None:
+    pool, created = make_pool(max_contexts=2, max_pages=2)
+    entered = asyncio.Event()
+    release = asyncio.Event()
+    owners: list[FakeContext] = []
+
+    async def worker() -> None:
+        async with pool.page() as page:
+            owners.append(next(c for c in created if page in c.pages))
+            if len(owners) == 3:
+                entered.set()
+            await release.wait()
+
+    tasks = [asyncio.create_task(worker()) for _ in range(3)]
+    await entered.wait()
+
+    assert len(created) == 2
+    assert sorted(owners.count(c) for c in created) == [1, 2]
+
+    release.set()
+    await asyncio.gather(*tasks)
+    stats = pool.stats()
+    assert stats.created == 2
+    assert sum(c.checkouts for c in stats.contexts) == 3
+
+
+@pytest.mark.asyncio
+async def test_contexts_are_recycled_after_navigations() -> None:
+    pool, created = make_pool(max_contexts=1, max_pages=2, recycle_after=2)
+
+    async with pool.page() as page:
+        navigate(page, "https://example.com/1")
+        navigate(page, "https://example.com/2")
+
+    assert created[0].closed
+
+    async with pool.page() as page:
+        assert page in created[1].pages
+
+    stats = pool.stats()
+    assert (stats.created, stats.recycled) == (2, 1)
+    await pool.close()
+    assert created[1].closed
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from ani_scrapy.core.executor import ParseExecutor
+from ani_scrapy.core.html import HtmlBody
+from ani_scrapy.providers.animeflv.parser import AnimeFLVParser
+
+
+def test_rejects_unknown_mode() -> None:
+    with pytest.raises(ValueError):
+        ParseExecutor("fork")
+
+
+@pytest.mark.asyncio
+async def test_inline_runs_on_the_loop() -> None:
+    executor = ParseExecutor()
+
+    assert await executor.run(sum, [1, 2, 3]) == 6
+    stats = executor.stats()
+    assert stats.max_workers == 0
+    assert stats.submitted == stats.completed == 1
+
+
+@pytest.mark.parametrize("mode", ["thread", "process"])
+@pytest.mark.asyncio
+async def test_pool_parses_fixture(mode: str, fixtures_dir: Path) -> None:
+    executor = ParseExecutor(mode, max_workers=2)
+    body = HtmlBody((fixtures_dir / "animeflv_anime.html").read_bytes(), "utf-8")
+
+    try:
+        anime = await executor.run(
+            AnimeFLVParser.parse_anime_info, body, "one-punch-man-3"
+        )
+    finally:
+        executor.shutdown()
+
+    assert anime.title == "One Punch Man 3"
+    assert len(anime.episodes) == 3
+    stats = executor.stats()
+    assert stats.mode == mode
+    assert stats.max_workers == 2
+    assert stats.completed == 1
+    assert stats.in_flight == 0
+    assert stats.total_wait >= 0
+    assert executor.shares_memory is (mode == "thread")
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from ani_scrapy.core.fleet import BrowserFleet
+
+
+class FakeChromium:
+    def __init__(self) -> None:
+        self.connected = True
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+
+class FakeBrowser:
+    def __init__(self) -> None:
+        self.browser = FakeChromium()
+        self.opened = 0
+        self.closed = False
+
+    async def __aexit__(self, *args) -> None:
+        self.closed = True
+
+    @asynccontextmanager
+    async def page(self, scope, rules=None, timeout=None):
+        self.opened += 1
+        yield self
+
+    def page_stats(self) -> dict:
+        return {}
+
+    def blocking_stats(self) -> dict:
+        return {}
+
+
+class FakeFleet(BrowserFleet):
+    def __init__(self, size: int) -> None:
+        super().__init__(size=size)
+        self.launched: list[FakeBrowser] = []
+
+    async def _launch(self) -> FakeBrowser:
+        browser = FakeBrowser()
+        self.launched.append(browser)
+        return browser
+
+
+@pytest.mark.asyncio
+async def test_pages_go_to_the_least_loaded_browser() -> None:
+    fleet = FakeFleet(size=3)
+    await fleet.__aenter__()
+    release = asyncio.Event()
+    started = asyncio.Event()
+    busy = 0
+
+    async def hold() -> None:
+        nonlocal busy
+        async with fleet.page("jkanime"):
+            busy += 1
+            if busy == 4:
+                started.set()
+            await release.wait()
+
+    tasks = [asyncio.create_task(hold()) for _ in range(4)]
+    await started.wait()
+
+    assert sorted(fleet.stats().load) == [1, 1, 2]
+    release.set()
+    await asyncio.gather(*tasks)
+    assert fleet.stats().load == [0, 0, 0]
+    assert sum(b.opened for b in fleet.launched) == 4
+
+
+@pytest.mark.asyncio
+async def test_disconnected_browsers_are_restarted() -> None:
+    fleet = FakeFleet(size=1)
+    await fleet.__aenter__()
+    crashed = fleet.launched[0]
+    crashed.browser.connected = False
+
+    async with fleet.page() as page:
+        assert page is not crashed
+
+    assert crashed.closed
+    assert len(fleet.launched) == 2
+    assert fleet.stats().restarts == 1
+    await fleet.__aexit__(None, None, None)
+    assert fleet.launched[1].closed
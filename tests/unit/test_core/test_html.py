@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from ani_scrapy.core.html import HtmlBody, IncrementalHTMLParser, parse_html
+from ani_scrapy.core.http import AsyncHttpAdapter, SessionRegistry
+from ani_scrapy.providers.animeflv.constants import EPISODES_SCRIPT_MARKERS
+from ani_scrapy.providers.animeflv.parser import AnimeFLVParser
+
+EPISODES_PAGE = (
+    b"<html><head><title>Naruto</title></head><body>"
+    b'<script>var anime_info = ["1","Naruto","naruto"];'
+    b"var episodes = [[2,2],[1,1]];</script>"
+    + b"<div>"
+    + b"x" * 200_000
+    + b"</div>"
+    + b"</body></html>"
+)
+
+
+def feed_in_chunks(parser: IncrementalHTMLParser, data: bytes, size: int) -> int:
+    fed = 0
+    for i in range(0, len(data), size):
+        fed += len(data[i : i + size])
+        if parser.feed(data[i : i + size]):
+            break
+    return fed
+
+
+def test_parse_html_accepts_bytes_and_empty_input() -> None:
+    assert parse_html(b"<p>hola</p>").findtext(".//p") == "hola"
+    assert parse_html(memoryview("<p>acción</p>".encode())).findtext(".//p") == (
+        "acción"
+    )
+    assert parse_html("").tag == "html"
+
+
+def test_parse_html_uses_body_encoding() -> None:
+    body = HtmlBody("<p>acción</p>".encode("latin-1"), "latin-1")
+
+    assert parse_html(body).findtext(".//p") == "acción"
+    assert body.text() == "<p>acción</p>"
+
+
+def test_incremental_parser_stops_after_markers_across_chunks() -> None:
+    parser = IncrementalHTMLParser(stop_after=EPISODES_SCRIPT_MARKERS)
+
+    fed = feed_in_chunks(parser, EPISODES_PAGE, size=7)
+
+    assert parser.complete
+    assert fed < 200
+    script = parser.close().find(".//script")
+    assert script is not None
+    assert "var episodes = [[2,2],[1,1]];" in script.text
+
+
+def test_incremental_parser_without_markers_reads_everything() -> None:
+    parser = IncrementalHTMLParser()
+
+    fed = feed_in_chunks(parser, EPISODES_PAGE, size=4096)
+
+    assert not parser.complete
+    assert fed == len(EPISODES_PAGE)
+    assert parser.close().findtext(".//title") == "Naruto"
+
+
+@pytest.mark.asyncio
+async def test_get_document_feeds_episode_parser() -> None:
+    async def handler(request: web.Request) -> web.Response:
+        return web.Response(body=EPISODES_PAGE, content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/anime/naruto", handler)
+
+    async with TestServer(app) as server:
+        http = AsyncHttpAdapter(
+            base_url=str(server.make_url("/")),
+            registry=SessionRegistry(),
+        )
+        document = await http.get_document(
+            "anime/naruto", stop_after=EPISODES_SCRIPT_MARKERS
+        )
+        await http.close()
+
+    info, episodes = AnimeFLVParser().extract_episode_data(document)
+
+    assert info == ["1", "Naruto", "naruto"]
+    assert episodes == [[2, 2], [1, 1]]
+
+
+@pytest.mark.asyncio
+async def test_get_bytes_returns_body_with_encoding() -> None:
+    async def handler(request: web.Request) -> web.Response:
+        return web.Response(
+            body="<h1 class='Title'>Acción</h1>".encode("latin-1"),
+            content_type="text/html",
+            charset="latin-1",
+        )
+
+    app = web.Application()
+    app.router.add_get("/anime/naruto", handler)
+
+    async with TestServer(app) as server:
+        http = AsyncHttpAdapter(
+            base_url=str(server.make_url("/")),
+            registry=SessionRegistry(),
+        )
+        body = await http.get_bytes("anime/naruto")
+        text = await http.get("anime/naruto")
+        await http.close()
+
+    assert body.encoding == "iso8859-1"
+    assert AnimeFLVParser.parse_anime_info(body, "naruto").title == "Acción"
+    assert text == "<h1 class='Title'>Acción</h1>"
@@ -1,10 +1,80 @@
 from __future__ import annotations
 
+import asyncio
+
 import pytest
-from ani_scrapy.core.http import AsyncHttpAdapter, BaseHttpAdapter
+from ani_scrapy.core.http import AsyncHttpAdapter, BaseHttpAdapter, SessionRegistry
 
 
 @pytest.mark.asyncio
 async def test_async_http_adapter_records_calls() -> None:
     http = AsyncHttpAdapter(base_url="https://example.com")
     http.register_response = pytest.fail  # Not available in real adapter
+
+
+@pytest.mark.asyncio
+async def test_adapters_share_session_per_host() -> None:
+    registry = SessionRegistry()
+    first = AsyncHttpAdapter(base_url="https://example.com", registry=registry)
+    second = AsyncHttpAdapter(base_url="https://example.com/", registry=registry)
+    other = AsyncHttpAdapter(base_url="https://example.org", registry=registry)
+
+    session = await first._get_session()
+    assert await second._get_session() is session
+    assert await other._get_session() is not session
+    assert registry.refcount("example.com") == 2
+
+    await first.close()
+    assert not session.closed
+    await second.close()
+    assert session.closed
+    await other.close()
+    assert registry.refcount("example.org") == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_calls_create_one_session() -> None:
+    registry = SessionRegistry(limit=10, limit_per_host=2)
+    http = AsyncHttpAdapter(base_url="https://example.com", registry=registry)
+
+    sessions = await asyncio.gather(*(http._get_session() for _ in range(10)))
+
+    assert len({id(session) for session in sessions}) == 1
+    assert registry.refcount("example.com") == 1
+    assert sessions[0].connector.limit_per_host == 2
+    await http.close()
+
+
+def test_sessions_of_other_loops_are_still_closed_on_release() -> None:
+    registry = SessionRegistry()
+    first_loop, second_loop = asyncio.new_event_loop(), asyncio.new_event_loop()
+    try:
+        first = AsyncHttpAdapter(base_url="https://example.com", registry=registry)
+        second = AsyncHttpAdapter(base_url="https://example.com", registry=registry)
+        old = first_loop.run_until_complete(first._get_session())
+        new = second_loop.run_until_complete(second._get_session())
+        assert new is not old
+        assert registry.refcount("example.com") == 2
+
+        first_loop.run_until_complete(first.close())
+        assert old.closed and not new.closed
+        second_loop.run_until_complete(second.close())
+        assert new.closed
+        assert registry.refcount("example.com") == 0
+    finally:
+        first_loop.close()
+        second_loop.close()
+
+
+@pytest.mark.asyncio
+async def test_idle_timeout_keeps_session_warm() -> None:
+    registry = SessionRegistry(idle_timeout=60)
+    first = AsyncHttpAdapter(base_url="https://example.com", registry=registry)
+    session = await first._get_session()
+    await first.close()
+
+    second = AsyncHttpAdapter(base_url="https://example.com", registry=registry)
+    assert await second._get_session() is session
+    await second.close()
+    await registry.close()
+    assert session.closed
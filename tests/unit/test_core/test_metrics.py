@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import pytest
+
+from ani_scrapy.core.metrics import LatencyRecorder
+
+
+@pytest.mark.asyncio
+async def test_measure_records_runs_and_failures() -> None:
+    recorder = LatencyRecorder()
+
+    async with recorder.measure("player_switch"):
+        pass
+    with pytest.raises(RuntimeError):
+        async with recorder.measure("player_switch"):
+            raise RuntimeError("frame detached")
+    recorder.record("iframe_link", 0.5)
+
+    stats = recorder.stats()
+    assert (stats["player_switch"].count, stats["player_switch"].failures) == (2, 1)
+    assert stats["iframe_link"].mean == 0.5
+    assert stats["iframe_link"].max == 0.5
+
+    recorder.reset()
+    assert recorder.stats() == {}
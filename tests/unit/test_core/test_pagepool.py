@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from pyee import EventEmitter
+
+from ani_scrapy.core.pagepool import PagePool
+
+
+class FakePage(EventEmitter):
+    def __init__(self) -> None:
+        super().__init__()
+        self.url = "about:blank"
+        self.closed = False
+        self.responsive = True
+        self.unrouted = 0
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    async def close(self) -> None:
+        self.closed = True
+
+    async def goto(self, url: str, timeout: float | None = None) -> None:
+        self.url = url
+
+    async def evaluate(self, expression: str) -> int:
+        if not self.responsive:
+            await asyncio.sleep(10)
+        return 1
+
+    async def unroute_all(self, behavior: str | None = None) -> None:
+        self.unrouted += 1
+
+
+def make_pool(max_pages: int = 2) -> tuple[PagePool, list[FakePage]]:
+    created: list[FakePage] = []
+
+    async def factory() -> FakePage:
+        page = FakePage()
+        created.append(page)
+        return page
+
+    return PagePool(factory, max_pages=max_pages, health_timeout=0.05), created
+
+
+@pytest.mark.asyncio
+async def test_pages_are_reset_and_reused() -> None:
+    pool, created = make_pool()
+
+    async with pool.page() as page:
+        page.on("popup", lambda popup: None)
+        await page.goto("https://example.com/anime")
+
+    async with pool.page() as again:
+        assert again is page
+
+    assert len(created) == 1
+    assert page.url == "about:blank"
+    assert page.listeners("popup") == []
+    assert page.listeners("crash")
+    assert page.unrouted == 2
+    stats = pool.stats()
+    assert (stats.checkouts, stats.checkins, stats.created, stats.reused) == (
+        2,
+        2,
+        1,
+        1,
+    )
+
+
+@pytest.mark.asyncio
+async def test_unhealthy_pages_are_replaced() -> None:
+    pool, created = make_pool()
+
+    async with pool.page() as page:
+        pass
+    page.responsive = False
+
+    async with pool.page() as replacement:
+        assert replacement is not page
+        replacement.emit("crash")
+
+    assert page.closed
+    assert replacement.closed
+    assert len(created) == 2
+    assert pool.stats().discarded == 2
+    assert pool.stats().idle == 0
+
+
+@pytest.mark.asyncio
+async def test_checkout_waits_for_a_free_page() -> None:
+    pool, created = make_pool(max_pages=1)
+    first = await pool.acquire()
+
+    waiter = asyncio.create_task(pool.acquire())
+    await asyncio.sleep(0)
+    assert pool.stats().waiting == 1
+
+    await pool.release(first)
+    second = await waiter
+
+    assert second is first
+    assert len(created) == 1
+    await pool.release(second)
+    await pool.close()
+    assert first.closed
+
+
+@pytest.mark.asyncio
+async def test_cancelled_checkout_keeps_or_closes_its_page() -> None:
+    pool, created = make_pool(max_pages=1)
+    async with pool.page() as page:
+        pass
+    page.responsive = False
+
+    # Cancelled mid health check: the idle page goes back to the pool.
+    checkout = asyncio.create_task(pool.acquire())
+    await asyncio.sleep(0.01)
+    checkout.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await checkout
+    assert pool.stats().idle == 1
+    assert not page.closed
+
+    # Cancelled while a new page is created: it is closed once it opens.
+    page.closed = True
+    opened = asyncio.Event()
+
+    async def slow_factory() -> FakePage:
+        await opened.wait()
+        created.append(FakePage())
+        return created[-1]
+
+    pool.factory = slow_factory
+    checkout = asyncio.create_task(pool.acquire())
+    await asyncio.sleep(0)
+    checkout.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await checkout
+    opened.set()
+    await asyncio.sleep(0.01)
+
+    assert created[-1].closed
+    assert pool.stats().in_use == 0
+    async with pool.page():
+        pass
+
+
+@pytest.mark.asyncio
+async def test_checkout_timeout_only_bounds_the_slot_wait() -> None:
+    pool, created = make_pool(max_pages=1)
+    first = await pool.acquire(timeout=0.01)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await pool.acquire(timeout=0.01)
+    assert pool.stats().waiting == 0
+
+    await pool.release(first)
+    async with pool.page(timeout=0.01) as page:
+        assert page is first
+    assert len(created) == 1
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from ani_scrapy.core.constants.general import HTTP_CONNECTOR_LIMIT_PER_HOST
+from ani_scrapy.core.http import AsyncHttpAdapter, SessionRegistry
+from ani_scrapy.core.ratelimit import (
+    AdaptiveRateLimiter,
+    RateLimiterRegistry,
+    parse_retry_after,
+)
+
+
+def test_parse_retry_after() -> None:
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_default_limit_matches_the_connector_per_host_cap() -> None:
+    limiter = AdaptiveRateLimiter()
+    assert limiter.limit == limiter.max_limit == HTTP_CONNECTOR_LIMIT_PER_HOST
+
+
+@pytest.mark.asyncio
+async def test_limit_grows_on_success_and_halves_once_per_window() -> None:
+    limiter = AdaptiveRateLimiter(rate=None, initial_limit=8, max_limit=16)
+
+    tickets = [await limiter.acquire() for _ in range(8)]
+    for ticket in tickets:
+        ticket.throttled = True
+        limiter.release(ticket)
+    assert limiter.limit == 4
+
+    for _ in range(20):
+        limiter.release(await limiter.acquire())
+    assert limiter.limit > 4
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_capped_by_limit() -> None:
+    limiter = AdaptiveRateLimiter(rate=None, initial_limit=2, max_limit=2)
+    peak = 0
+
+    async def work() -> None:
+        nonlocal peak
+        ticket = await limiter.acquire()
+        peak = max(peak, limiter.in_flight)
+        await asyncio.sleep(0.01)
+        limiter.release(ticket)
+
+    await asyncio.gather(*(work() for _ in range(6)))
+
+    assert peak == 2
+    assert limiter.stats().acquired == 6
+    assert limiter.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_retry_after_pauses_host() -> None:
+    limiter = AdaptiveRateLimiter(rate=None)
+    ticket = await limiter.acquire()
+    ticket.observe(429, {"Retry-After": "1"})
+    assert ticket.throttled and ticket.retry_after == 1.0
+    ticket.retry_after = 0.05
+    limiter.release(ticket)
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    limiter.release(await limiter.acquire())
+    assert loop.time() - start >= 0.04
+
+
+@pytest.mark.asyncio
+async def test_adapter_reports_throttling_to_limiter() -> None:
+    async def handler(request: web.Request) -> web.Response:
+        return web.Response(status=429, headers={"Retry-After": "0"})
+
+    app = web.Application()
+    app.router.add_get("/anime/naruto", handler)
+    limiters = RateLimiterRegistry(rate=None, initial_limit=4)
+
+    async with TestServer(app) as server:
+        http = AsyncHttpAdapter(
+            base_url=str(server.make_url("/")),
+            registry=SessionRegistry(),
+            limiters=limiters,
+            retry=None,
+        )
+        with pytest.raises(ConnectionError):
+            await http.get("anime/naruto")
+        await http.close()
+
+    stats = http.rate_limiter.stats()
+    assert stats.throttled == 1
+    assert stats.limit == 2
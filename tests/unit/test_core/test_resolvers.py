@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import time
+from collections import Counter
+from typing import Optional
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from ani_scrapy.core.http import AsyncHttpAdapter, SessionRegistry
+from ani_scrapy.core.resolvers import (
+    HosterResolver,
+    ResolverRegistry,
+    StreamwishResolver,
+    default_browser_flows,
+)
+from ani_scrapy.core.resolvers.mediafire import parse_download_url
+from ani_scrapy.core.resolvers.registry import default_resolvers, signed_url_expiry
+from ani_scrapy.core.resolvers.yourupload import parse_video_url
+
+FORM_PAGE = """<form id="F1" method="POST">
+<input type="hidden" name="op" value="download_orig">
+<input type="hidden" name="id" value="{id}">
+<input type="hidden" name="hash" value="h1">
+<button type="submit">Download</button>
+</form>"""
+DISABLED_PAGE = '<div class="text-danger text-center mb-5">Downloads disabled 620</div>'
+LINK_PAGE = (
+    '<div class="text-center"><a class="btn" href="https://cdn/{id}.mp4">Go</a></div>'
+)
+
+
+@pytest.mark.asyncio
+async def test_streamwish_variants_race_and_disabled_is_not_retried() -> None:
+    posts: Counter[str] = Counter()
+
+    async def form(request: web.Request) -> web.Response:
+        video_id = request.match_info["id"]
+        if video_id.endswith("_l"):
+            return web.Response(status=404)
+        return web.Response(
+            text=FORM_PAGE.format(id=video_id), content_type="text/html"
+        )
+
+    async def submit(request: web.Request) -> web.Response:
+        data = await request.post()
+        assert data["op"] == "download_orig" and data["hash"] == "h1"
+        video_id = data["id"]
+        posts[video_id] += 1
+        if video_id.endswith("_h"):
+            return web.Response(text=DISABLED_PAGE, content_type="text/html")
+        return web.Response(
+            text=LINK_PAGE.format(id=video_id), content_type="text/html"
+        )
+
+    app = web.Application()
+    app.router.add_get("/f/{id}", form)
+    app.router.add_post("/f/{id}", submit)
+
+    async with TestServer(app) as server:
+        resolver = StreamwishResolver(
+            AsyncHttpAdapter(
+                base_url=str(server.make_url("/")),
+                registry=SessionRegistry(),
+                retry=None,
+            )
+        )
+        link = await resolver.resolve(str(server.make_url("/f/abc")))
+        await resolver.aclose()
+
+    assert link == "https://cdn/abc_n.mp4"
+    # The disabled variant is never submitted twice.
+    assert posts["abc_h"] <= 1
+
+
+def test_yourupload_video_url_from_meta_or_player() -> None:
+    meta = (
+        '<head><meta property="og:video" content="https://vidcache.net/a.mp4"></head>'
+    )
+    assert parse_video_url(meta) == "https://vidcache.net/a.mp4"
+    player = "<script>jwplayerOptions = {file: 'https://vidcache.net/b.mp4'}</script>"
+    assert parse_video_url(player) == "https://vidcache.net/b.mp4"
+    assert parse_video_url("<html></html>") is None
+
+
+def test_mediafire_download_url_plain_or_scrambled() -> None:
+    plain = '<a id="downloadButton" href="https://download1.mediafire.com/x/a.mp4">'
+    assert parse_download_url(plain) == "https://download1.mediafire.com/x/a.mp4"
+    scrambled = base64.b64encode(b"https://download2.mediafire.com/y").decode()
+    page = f'<a id="downloadButton" href="#" data-scrambled-url="{scrambled}">'
+    assert parse_download_url(page) == "https://download2.mediafire.com/y"
+    assert parse_download_url("<html></html>") is None
+
+
+class FakeResolver(HosterResolver):
+    name = "Fake"
+    aliases = ("FK",)
+
+    def __init__(self, links: dict[str, Optional[str]], delay: float = 0) -> None:
+        super().__init__()
+        self.links = links
+        self.delay = delay
+        self.calls = 0
+        self.running = 0
+        self.peak = 0
+
+    async def resolve(self, url: str) -> Optional[str]:
+        self.calls += 1
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(self.delay)
+        self.running -= 1
+        return self.links.get(url)
+
+
+def test_signed_url_expiry_from_query() -> None:
+    assert signed_url_expiry("https://cdn/a.mp4?expires=1900000000") == 1900000000
+    relative = signed_url_expiry("https://cdn/a.mp4?e=120")
+    assert relative is not None and abs(relative - (time.time() + 120)) < 5
+    amz = "https://s3/a.mp4?X-Amz-Date=20300101T000000Z&X-Amz-Expires=60"
+    assert signed_url_expiry(amz) == 1893456060
+    assert signed_url_expiry("https://cdn/a.mp4?token=abc") is None
+
+
+@pytest.mark.asyncio
+async def test_registry_caches_by_alias_until_signed_expiry() -> None:
+    soon = int(time.time()) + 20
+    resolver = FakeResolver(
+        {"u1": "https://cdn/1.mp4", "u2": f"https://cdn/2.mp4?expires={soon}"}
+    )
+    registry = ResolverRegistry([resolver], expiry_margin=30)
+
+    assert await registry.resolve("FK", "u1") == "https://cdn/1.mp4"
+    assert await registry.resolve("fake", "u1") == "https://cdn/1.mp4"
+    # Expires within the margin, so it is never served from the cache.
+    await registry.resolve("Fake", "u2")
+    await registry.resolve("Fake", "u2")
+
+    assert resolver.calls == 3
+    stats = registry.stats()["fake"]
+    assert (stats.successes, stats.cache_hits) == (3, 1)
+    await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_registry_caps_concurrency_and_counts_fallbacks() -> None:
+    resolver = FakeResolver({f"u{i}": f"https://cdn/{i}.mp4" for i in range(6)}, 0.01)
+    registry = ResolverRegistry([resolver], max_concurrency=2)
+
+    links = await asyncio.gather(
+        *(registry.resolve("Fake", f"u{i}") for i in range(6)),
+        registry.resolve("Fake", "u0"),
+    )
+    assert links[0] == links[-1] == "https://cdn/0.mp4"
+    assert resolver.peak == 2
+    assert resolver.calls == 6
+
+    async def browser() -> Optional[str]:
+        return "https://cdn/browser.mp4"
+
+    assert await registry.resolve("Fake", "missing", fallback=browser) == (
+        "https://cdn/browser.mp4"
+    )
+    assert await registry.resolve("Other", "x", fallback=browser) == (
+        "https://cdn/browser.mp4"
+    )
+    assert await registry.resolve("Other", "y") is None
+
+    stats = registry.stats()
+    assert stats["fake"].fallbacks == 1
+    assert (stats["other"].fallbacks, stats["other"].failures) == (1, 1)
+    await registry.aclose()
+
+
+def test_registry_caps_concurrency_in_every_event_loop() -> None:
+    registry = ResolverRegistry(max_concurrency=2)
+
+    async def contend(run: int) -> int:
+        resolver = FakeResolver(
+            {f"{run}-{i}": f"https://cdn/{i}.mp4" for i in range(6)}, 0.01
+        )
+        registry.register(resolver)
+        await asyncio.gather(
+            *(registry.resolve("Fake", f"{run}-{i}") for i in range(6))
+        )
+        await registry.aclose()
+        return resolver.peak
+
+    assert asyncio.run(contend(1)) == 2
+    assert asyncio.run(contend(2)) == 2
+
+
+@pytest.mark.asyncio
+async def test_registry_keeps_browser_only_resolutions_apart() -> None:
+    resolver = FakeResolver({"u": "https://cdn/http.mp4"}, 0.01)
+    registry = ResolverRegistry([resolver])
+
+    async def browser() -> Optional[str]:
+        await asyncio.sleep(0.01)
+        return "https://cdn/browser.mp4"
+
+    # Joined flights and cached links never cross the use_resolver switch.
+    hybrid, browser_only = await asyncio.gather(
+        registry.resolve("Fake", "u", fallback=browser),
+        registry.resolve("Fake", "u", fallback=browser, use_resolver=False),
+    )
+    assert (hybrid, browser_only) == ("https://cdn/http.mp4", "https://cdn/browser.mp4")
+    assert await registry.resolve("Fake", "u", use_resolver=False) == (
+        "https://cdn/browser.mp4"
+    )
+    assert await registry.resolve("Fake", "u") == "https://cdn/http.mp4"
+    assert resolver.calls == 1
+    assert registry.stats()["fake"].cache_hits == 2
+    await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_registry_handles_hosters_with_a_resolver_or_browser_flow() -> None:
+    async def flow(page, url: str) -> Optional[str]:
+        return None
+
+    registry = ResolverRegistry([FakeResolver({})], {"FK": flow, "Flow": flow})
+    assert registry.browser_flow("fake") is flow
+    assert registry.handles("Flow") and not registry.supports("Flow")
+    assert not registry.handles("Nope")
+
+    defaults = ResolverRegistry(default_resolvers(), default_browser_flows())
+    for server in ("SW", "Streamwish", "YourUpload", "Mediafire", "PDrain", "UPNShare"):
+        assert defaults.handles(server), server
+    await registry.aclose()
+    await defaults.aclose()
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import asyncio
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from ani_scrapy.core.http import AsyncHttpAdapter, SessionRegistry
+from ani_scrapy.core.ratelimit import RateLimiterRegistry
+from ani_scrapy.core.retry import RetryableError, RetryBudget, RetryPolicy
+
+
+def _policy(**options) -> RetryPolicy:
+    return RetryPolicy(base_delay=0.001, max_delay=0.01, **options)
+
+
+@pytest.mark.asyncio
+async def test_run_retries_transient_errors() -> None:
+    attempts = 0
+
+    async def flaky() -> str:
+        nonlocal attempts
+        attempts += 1
+        if attempts < 3:
+            raise RetryableError("Downloads disabled 620")
+        return "ok"
+
+    assert await _policy(max_retries=2, shared_budget=False).run(flaky) == "ok"
+    assert attempts == 3
+
+
+@pytest.mark.asyncio
+async def test_run_does_not_retry_permanent_errors() -> None:
+    attempts = 0
+
+    async def broken() -> str:
+        nonlocal attempts
+        attempts += 1
+        raise ValueError("bad markup")
+
+    with pytest.raises(ValueError):
+        await _policy(shared_budget=False).run(broken)
+    assert attempts == 1
+
+
+@pytest.mark.asyncio
+async def test_budget_stops_retry_storms() -> None:
+    budget = RetryBudget(ratio=0.0, min_per_second=0.0, max_tokens=1)
+    policy = _policy(max_retries=5, budget=budget)
+
+    async def down() -> str:
+        raise aiohttp.ClientConnectionError("refused")
+
+    with pytest.raises(aiohttp.ClientConnectionError):
+        await policy.run(down)
+    with pytest.raises(aiohttp.ClientConnectionError):
+        await policy.run(down)
+
+    stats = budget.stats()
+    assert stats.allowed == 1
+    assert stats.denied == 2
+
+
+@pytest.mark.asyncio
+async def test_deadline_bounds_total_time() -> None:
+    async def slow() -> str:
+        await asyncio.sleep(1)
+        return "late"
+
+    with pytest.raises(asyncio.TimeoutError):
+        await _policy(max_retries=10, shared_budget=False).run(slow, deadline=0.05)
+
+
+def test_decorrelated_jitter_stays_in_bounds() -> None:
+    policy = RetryPolicy(base_delay=0.1, max_delay=1.0)
+    delay = policy.base_delay
+    for _ in range(50):
+        delay = policy.next_delay(delay)
+        assert 0.1 <= delay <= 1.0
+
+
+def test_classifies_response_status() -> None:
+    policy = RetryPolicy()
+
+    def error(status: int) -> aiohttp.ClientResponseError:
+        return aiohttp.ClientResponseError(None, (), status=status)  # type: ignore[arg-type]
+
+    assert policy.is_retryable(error(503))
+    assert not policy.is_retryable(error(404))
+
+
+@pytest.mark.asyncio
+async def test_adapter_retries_server_errors() -> None:
+    hits = 0
+
+    async def handler(request: web.Request) -> web.Response:
+        nonlocal hits
+        hits += 1
+        if hits == 1:
+            return web.Response(status=502)
+        return web.Response(text="ok")
+
+    app = web.Application()
+    app.router.add_get("/horario", handler)
+
+    async with TestServer(app) as server:
+        http = AsyncHttpAdapter(
+            base_url=str(server.make_url("/")),
+            registry=SessionRegistry(),
+            limiters=RateLimiterRegistry(rate=None),
+            retry=_policy(shared_budget=False),
+        )
+        assert await http.get("horario") == "ok"
+        await http.close()
+
+    assert hits == 2
+
+
+@pytest.mark.asyncio
+async def test_adapter_retries_posts_only_when_asked() -> None:
+    hits = 0
+
+    async def handler(request: web.Request) -> web.Response:
+        nonlocal hits
+        hits += 1
+        if hits == 1:
+            return web.Response(status=503)
+        return web.Response(text="ok")
+
+    app = web.Application()
+    app.router.add_post("/form", handler)
+
+    async with TestServer(app) as server:
+        http = AsyncHttpAdapter(
+            base_url=str(server.make_url("/")),
+            registry=SessionRegistry(),
+            limiters=RateLimiterRegistry(rate=None),
+            retry=_policy(shared_budget=False),
+        )
+        with pytest.raises(ConnectionError):
+            await http.request("POST", "form", data="a=1")
+        assert hits == 1
+
+        hits = 0
+        body = await http.request("POST", "form", data="a=1", retry=True)
+        assert body.text() == "ok"
+        await http.close()
+
+    assert hits == 2
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from ani_scrapy.core.http import AsyncHttpAdapter, SessionRegistry
+from ani_scrapy.core.singleflight import SingleFlight, request_key
+
+
+@pytest.mark.asyncio
+async def test_followers_share_leader_result() -> None:
+    flight = SingleFlight()
+    calls = 0
+
+    async def fetch() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "page"
+
+    results = await asyncio.gather(*(flight.do("key", fetch) for _ in range(5)))
+
+    assert results == ["page"] * 5
+    assert calls == 1
+    assert flight.coalesced == 4
+    assert len(flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_followers_receive_leader_exception() -> None:
+    flight = SingleFlight()
+
+    async def fail() -> str:
+        await asyncio.sleep(0.01)
+        raise ConnectionError("boom")
+
+    results = await asyncio.gather(
+        *(flight.do("key", fail) for _ in range(3)), return_exceptions=True
+    )
+
+    assert all(isinstance(result, ConnectionError) for result in results)
+
+
+def test_request_key_ignores_param_order() -> None:
+    assert request_key("get", "u", {"q": "a", "page": 1}) == request_key(
+        "GET", "u", {"page": 1, "q": "a"}
+    )
+
+
+@pytest.mark.asyncio
+async def test_adapter_coalesces_identical_gets() -> None:
+    hits = 0
+
+    async def handler(request: web.Request) -> web.Response:
+        nonlocal hits
+        hits += 1
+        await asyncio.sleep(0.05)
+        return web.Response(text=request.query.get("q", ""))
+
+    app = web.Application()
+    app.router.add_get("/browse", handler)
+
+    async with TestServer(app) as server:
+        http = AsyncHttpAdapter(
+            base_url=str(server.make_url("/")), registry=SessionRegistry()
+        )
+        results = await asyncio.gather(
+            *(http.get("browse", params={"q": "naruto"}) for _ in range(4)),
+            http.get("browse", params={"q": "bleach"}),
+        )
+        await http.close()
+
+    assert results == ["naruto"] * 4 + ["bleach"]
+    assert hits == 2
+    assert http.coalesced == 3
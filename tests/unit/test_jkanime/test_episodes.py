@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from ani_scrapy.core.http import AsyncHttpAdapter, SessionRegistry
+from ani_scrapy.providers.jkanime.constants import BASE_EPISODE_IMG_URL
+from ani_scrapy.providers.jkanime.episodes import EpisodeSource
+from ani_scrapy.providers.jkanime.parser import JKAnimeParser
+from ani_scrapy.providers.jkanime.scraper import (
+    JKAnimeScraper,
+    is_episode_page_request,
+)
+
+
+class FakeRequest:
+    def __init__(self, url: str, post_data: str | None = None) -> None:
+        self.url = url
+        self.post_data = post_data
+        self.method = "POST" if post_data else "GET"
+        self.resource_type = "xhr"
+
+
+def test_only_site_calls_carrying_the_page_are_episode_requests() -> None:
+    assert is_episode_page_request(FakeRequest("https://jkanime.net/ajax/ep/812/2"))
+    assert is_episode_page_request(
+        FakeRequest("https://jkanime.net/ajax/ep/812", "_token=abc&page=2")
+    )
+    # Counters, comments and other site calls do not carry the page number.
+    assert not is_episode_page_request(FakeRequest("https://jkanime.net/ajax/views"))
+    assert not is_episode_page_request(
+        FakeRequest("https://jkanime.net/ajax/comments", "anime=812&page=1")
+    )
+    assert not is_episode_page_request(FakeRequest("https://stats.example/p/2"))
+
+
+def test_episode_source_templates_path_query_and_body() -> None:
+    source = EpisodeSource.from_request(
+        "post",
+        "https://jkanime.net/ajax/episodes/812/2",
+        "_token=abc",
+        {"X-CSRF-TOKEN": "abc", "User-Agent": "Browser/1.0"},
+        page=2,
+        total_pages=5,
+    )
+    assert source.method == "POST"
+    assert source.headers == {"X-CSRF-TOKEN": "abc"}
+    assert source.request_for(4) == (
+        "https://jkanime.net/ajax/episodes/812/4",
+        "_token=abc",
+    )
+
+    source = EpisodeSource.from_request(
+        "GET", "https://jkanime.net/ajax?id=2&page=2", None, {}, 2, 5
+    )
+    assert source.request_for(3)[0] == "https://jkanime.net/ajax?id=2&page=3"
+
+    source = EpisodeSource.from_request(
+        "POST", "https://jkanime.net/ajax", '{"id": 812, "page": 2}', {}, 2, 5
+    )
+    assert json.loads(source.request_for(7)[1]) == {"id": 812, "page": 7}
+
+    assert (
+        EpisodeSource.from_request("GET", "https://jkanime.net/ajax", None, {}, 2, 5)
+        is None
+    )
+
+
+def test_parse_episode_source_json_and_html() -> None:
+    body = json.dumps(
+        {"data": [{"number": "1", "image": "a.jpg"}, {"number": 2, "image": ""}]}
+    )
+    episodes = JKAnimeParser.parse_episode_source(body.encode(), "steins-gate")
+    assert [e.number for e in episodes] == [1, 2]
+    assert episodes[0].image_preview == f"{BASE_EPISODE_IMG_URL}/a.jpg"
+    assert episodes[1].image_preview is None
+
+    html = (
+        '<div class="epcontent"><a href="/steins-gate/3/">'
+        '<div data-setbg="c.jpg"></div></a></div>'
+    )
+    episodes = JKAnimeParser.parse_episode_source(html, "steins-gate")
+    assert [(e.number, e.image_preview) for e in episodes] == [(3, "c.jpg")]
+
+
+@pytest.mark.asyncio
+async def test_source_episodes_fetched_concurrently_and_extended() -> None:
+    # Three pages of two episodes; the source was discovered with two pages.
+    async def handler(request: web.Request) -> web.Response:
+        page = int(request.match_info["page"])
+        items = [{"number": n} for n in (2 * page - 1, 2 * page) if n <= 6]
+        return web.json_response({"data": items})
+
+    app = web.Application()
+    app.router.add_get("/ajax/episodes/{page}", handler)
+
+    async with TestServer(app) as server:
+        scraper = JKAnimeScraper()
+        scraper.http = AsyncHttpAdapter(
+            base_url=str(server.make_url("/")), registry=SessionRegistry()
+        )
+        source = EpisodeSource(
+            "GET", f"{server.make_url('/ajax/episodes')}/{{page}}", total_pages=2
+        )
+        episodes = await scraper._fetch_source_episodes(source, "steins-gate")
+        newer = scraper._newer_episodes(episodes, 4)
+        await scraper.aclose()
+
+    assert [e.number for e in episodes] == [1, 2, 3, 4, 5, 6]
+    assert source.total_pages == 3
+    assert [e.number for e in newer] == [6, 5]
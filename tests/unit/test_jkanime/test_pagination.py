@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+
+import pytest
+
+from ani_scrapy.providers.jkanime.scraper import JKAnimeScraper
+
+URL = "https://jkanime.net/steins-gate"
+PAGE_SIZE = 3
+
+
+def _page_cards(idx: int) -> list[dict]:
+    return [
+        {"href": f"/steins-gate/{n}/", "image": None}
+        for n in range(idx * PAGE_SIZE + 1, (idx + 1) * PAGE_SIZE + 1)
+    ]
+
+
+class FakeItem:
+    def __init__(self, tab: "FakeTab", idx: int):
+        self.tab = tab
+        self.idx = idx
+
+    async def click(self, force: bool = False) -> None:
+        if self.idx in self.tab.stale:
+            # The first click leaves the previous page on screen.
+            self.tab.stale.discard(self.idx)
+            return
+        self.tab.current = self.idx
+
+
+class FakeSelect:
+    def __init__(self, tab: "FakeTab"):
+        self.tab = tab
+
+    async def click(self, force: bool = False) -> None:
+        pass
+
+    async def query_selector_all(self, selector: str) -> list[FakeItem]:
+        return [FakeItem(self.tab, i) for i in range(self.tab.total)]
+
+
+class FakeLocator:
+    def __init__(self, tab: "FakeTab"):
+        self.tab = tab
+
+    async def evaluate_all(self, script: str, arg=None) -> list[dict]:
+        self.tab.read.append(self.tab.current)
+        return _page_cards(self.tab.current)
+
+
+class FakeTab:
+    def __init__(self, total: int, stale: tuple[int, ...] = ()):
+        self.url = URL
+        self.total = total
+        self.current = 0
+        self.stale = set(stale)
+        self.read: list[int] = []
+
+    async def wait_for_selector(self, selector: str) -> None:
+        pass
+
+    async def query_selector(self, selector: str) -> FakeSelect:
+        return FakeSelect(self)
+
+    def locator(self, selector: str) -> FakeLocator:
+        return FakeLocator(self)
+
+
+def _scraper(tabs: list[FakeTab]) -> JKAnimeScraper:
+    scraper = JKAnimeScraper(pagination_concurrency=len(tabs))
+
+    async def click(element, page, **kwargs) -> None:
+        await element.click(force=True)
+
+    @asynccontextmanager
+    async def pagination_tabs(page, url, total_pages):
+        yield tabs
+
+    scraper._safe_click = click
+    scraper._pagination_tabs = pagination_tabs
+    return scraper
+
+
+@pytest.mark.asyncio
+async def test_pages_are_spread_over_tabs_and_merged() -> None:
+    tabs = [FakeTab(5), FakeTab(5, stale=(3,))]
+    scraper = _scraper(tabs)
+
+    episodes = await scraper._extract_all_episodes(tabs[0], URL, "steins-gate")
+    await scraper.aclose()
+
+    assert [e.number for e in episodes] == list(range(1, 16))
+    assert tabs[0].read == [0, 2, 4]
+    # The stale read of page 4 on the second tab is retried.
+    assert tabs[1].read == [1, 1, 3]
+
+
+@pytest.mark.asyncio
+async def test_new_episodes_stop_at_the_known_page() -> None:
+    tabs = [FakeTab(5), FakeTab(5)]
+    scraper = _scraper(tabs)
+
+    async def goto(url, **kwargs) -> None:
+        pass
+
+    tabs[0].goto = goto
+    episodes = await scraper._get_new_episodes_internal(tabs[0], URL, "steins-gate", 8)
+    await scraper.aclose()
+
+    assert [e.number for e in episodes] == list(range(15, 8, -1))
+    # Pages are read a batch at a time, so page 2 is read alongside page 3.
+    assert tabs[0].read == [4, 2]
+    assert tabs[1].read == [3, 1]
@@ -19,3 +19,24 @@ def test_parse_anime_info(jkanime_anime_html: str) -> None:
     assert anime.type == _AnimeType.TV
     assert anime.genres == ["Ciencia ficción", "Suspenso"]
     assert anime.is_finished is False
+
+
+def test_card_and_row_records_match_html_parsing() -> None:
+    cards = [
+        {"href": "/steins-gate/1/", "image": "a.jpg"},
+        {"href": "", "image": None},
+        {"href": "/steins-gate/2/", "image": None},
+    ]
+    episodes = JKAnimeParser.episodes_from_cards(cards, "steins-gate")
+    assert [(e.number, e.image_preview) for e in episodes] == [
+        (1, "a.jpg"),
+        (2, None),
+    ]
+
+    rows = [
+        {"cells": ["Mediafire", "720p"], "href": " https://mediafire.com/x "},
+        {"cells": ["Mega"], "href": "https://mega.nz/y"},
+    ]
+    assert JKAnimeParser.download_links_from_rows(rows) == [
+        {"server": "Mediafire", "url": "https://mediafire.com/x"}
+    ]
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from ani_scrapy.core.exceptions import ScraperBlockedError
+from ani_scrapy.core.http import AsyncHttpAdapter, SessionRegistry
+from ani_scrapy.core.schemas import EpisodeDownloadInfo
+from ani_scrapy.providers.jkanime.constants import SW_DOWNLOAD_URL
+from ani_scrapy.providers.jkanime.scraper import JKAnimeScraper
+
+CHALLENGE_PAGE = b"<html><head><title>Just a moment...</title></head></html>"
+
+
+def _episode_page(base: str) -> str:
+    return f"""<html><body>
+    <div id="collapseServers">
+      <a data-id="0">Magi</a><a data-id="1">Streamwish</a><a data-id="2">Desu</a>
+    </div>
+    <script>
+    var video = [];
+    video[0] = '<iframe class="player_conte" src="{base}jkplayer/um?e=1"></iframe>';
+    video[1] = '<iframe class="player_conte" src="{base}jkplayer/jksw?u=2"></iframe>';
+    </script></body></html>"""
+
+
+async def _iframe_links(streamwish_status: int, magi_source: bool = True):
+    referers = []
+
+    async def episode(request: web.Request) -> web.Response:
+        return web.Response(
+            text=_episode_page(str(request.url.origin()) + "/"),
+            content_type="text/html",
+        )
+
+    async def magi(request: web.Request) -> web.Response:
+        referers.append(request.headers.get("Referer"))
+        source = '<source src="https://cdn/v.mp4">' if magi_source else ""
+        return web.Response(
+            text=f'<video id="video_html5_api">{source}</video>',
+            content_type="text/html",
+        )
+
+    async def streamwish(request: web.Request) -> web.Response:
+        if streamwish_status != 200:
+            return web.Response(status=streamwish_status, body=CHALLENGE_PAGE)
+        return web.Response(
+            text='<iframe src="https://sfastwish.com/e/abc123?autoplay=1"></iframe>',
+            content_type="text/html",
+        )
+
+    app = web.Application()
+    app.router.add_get("/steins-gate/1", episode)
+    app.router.add_get("/jkplayer/um", magi)
+    app.router.add_get("/jkplayer/jksw", streamwish)
+
+    async with TestServer(app) as server:
+        scraper = JKAnimeScraper()
+        scraper.http = AsyncHttpAdapter(
+            base_url=str(server.make_url("/")), registry=SessionRegistry()
+        )
+        try:
+            info = await scraper._get_iframe_download_links_http("steins-gate", 1)
+        finally:
+            await scraper.aclose()
+    return info, referers
+
+
+@pytest.mark.asyncio
+async def test_players_are_resolved_over_http() -> None:
+    info, referers = await _iframe_links(200)
+
+    assert [(link.server, link.url) for link in info.download_links] == [
+        ("Magi", "https://cdn/v.mp4"),
+        ("Streamwish", f"{SW_DOWNLOAD_URL}/abc123"),
+    ]
+    assert referers[0].endswith("/steins-gate/1")
+
+
+@pytest.mark.asyncio
+async def test_player_without_link_is_left_out_like_the_browser_flow() -> None:
+    info, _ = await _iframe_links(200, magi_source=False)
+
+    assert [(link.server, link.url) for link in info.download_links] == [
+        ("Streamwish", f"{SW_DOWNLOAD_URL}/abc123"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_challenged_player_raises_for_browser_fallback() -> None:
+    with pytest.raises(ScraperBlockedError):
+        await _iframe_links(403)
+
+
+@pytest.mark.asyncio
+async def test_network_failure_falls_back_to_the_browser() -> None:
+    async def episode(request: web.Request) -> web.Response:
+        return web.Response(status=500)
+
+    app = web.Application()
+    app.router.add_get("/steins-gate/1", episode)
+    from_browser = EpisodeDownloadInfo(episode_number=1, download_links=[])
+
+    @asynccontextmanager
+    async def browser_page():
+        yield None
+
+    async def browser_links(page, anime_id, episode_number):
+        return from_browser
+
+    async with TestServer(app) as server:
+        scraper = JKAnimeScraper()
+        scraper.http = AsyncHttpAdapter(
+            base_url=str(server.make_url("/")), registry=SessionRegistry(), retry=None
+        )
+        scraper._browser_page = browser_page
+        scraper._get_iframe_download_links_internal = browser_links
+        try:
+            info = await scraper.get_iframe_download_links("steins-gate", 1)
+        finally:
+            await scraper.aclose()
+
+    assert info is from_browser